@@ -18,6 +18,15 @@ class Choice:
     case_sensitive: bool = True
 
 
+@dataclass
+class IntRange:
+    """Minimal click.IntRange replacement."""
+
+    min: int | None = None
+    max: int | None = None
+    clamp: bool = False
+
+
 class Context:
     """Minimal click.Context replacement."""
 
@@ -34,6 +43,13 @@ def _passthrough_decorator(
     return decorator
 
 
+def confirm(text: str, default: bool = False, abort: bool = False, **kwargs: Any) -> bool:
+    """Minimal click.confirm replacement that accepts the default answer."""
+    if abort and not default:
+        raise Abort()
+    return default
+
+
 command = _passthrough_decorator
 group = _passthrough_decorator
 option = _passthrough_decorator
@@ -45,8 +61,10 @@ __all__ = [
     "Abort",
     "Choice",
     "Context",
+    "IntRange",
     "argument",
     "command",
+    "confirm",
     "group",
     "option",
     "version_option",
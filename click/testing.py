@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import io
+import sys
+import threading
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, get_args, get_origin
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, get_args, get_origin
 
 
 @dataclass
@@ -17,6 +21,65 @@ class Result:
     exception: Exception | None = None
 
 
+def _identity(value: str) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class _CommandSpec:
+    """Signature data for a command, computed once per callable."""
+
+    coercers: Mapping[str, Callable[[str], Any]]
+    positional_names: tuple[str, ...]
+
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def _coercer_for(param: inspect.Parameter) -> Callable[[str], Any]:
+    annotation = param.annotation
+    if annotation is inspect.Parameter.empty:
+        return _identity
+    if get_origin(annotation) is not None:
+        annotation_args = get_args(annotation)
+    else:
+        annotation_args = (annotation,)
+    if int in annotation_args:
+        return int
+    if float in annotation_args:
+        return float
+    return _identity
+
+
+@lru_cache(maxsize=None)
+def _command_spec(command: Any) -> _CommandSpec:
+    parameters = inspect.signature(command).parameters
+    return _CommandSpec(
+        coercers={name: _coercer_for(param) for name, param in parameters.items()},
+        positional_names=tuple(
+            name for name, param in parameters.items() if param.kind in _POSITIONAL_KINDS
+        ),
+    )
+
+
+_STDIN_POOL = threading.local()
+
+
+def _stdin_buffer(text: str) -> io.StringIO:
+    """Return this thread's reusable stdin buffer, reset to contain text."""
+    buffer = getattr(_STDIN_POOL, "stdin", None)
+    if buffer is None:
+        buffer = _STDIN_POOL.stdin = io.StringIO()
+    buffer.seek(0)
+    buffer.truncate()
+    buffer.write(text)
+    buffer.seek(0)
+    return buffer
+
+
 class CliRunner:
     """Minimal CLI runner for invoking command callables."""
 
@@ -28,7 +91,7 @@ class CliRunner:
         catch_exceptions: bool = True,
     ) -> Result:
         arg_list = list(args or [])
-        stdin = io.StringIO(input or "")
+        stdin = _stdin_buffer(input or "")
         stdout = io.StringIO()
 
         exit_code = 0
@@ -36,8 +99,13 @@ class CliRunner:
 
         try:
             kwargs, positionals = self._parse_args(command, arg_list)
-            with _patched_stdio(stdin, stdout):
-                command(*positionals, **kwargs)
+            old_stdin = sys.stdin
+            sys.stdin = stdin
+            try:
+                with contextlib.redirect_stdout(stdout):
+                    command(*positionals, **kwargs)
+            finally:
+                sys.stdin = old_stdin
         except SystemExit as system_exit:
             exit_code = system_exit.code if isinstance(system_exit.code, int) else 1
             exc = system_exit
@@ -50,35 +118,32 @@ class CliRunner:
         return Result(exit_code=exit_code, output=stdout.getvalue(), exception=exc)
 
     def _parse_args(self, command: Any, args: list[str]) -> tuple[dict[str, Any], list[Any]]:
-        signature = inspect.signature(command)
-        parameters = signature.parameters
-        kwargs, positionals = self._split_args(parameters, args)
-        bound_positionals = self._bind_positionals(parameters, positionals, kwargs)
+        spec = _command_spec(command)
+        kwargs, positionals = self._split_args(spec, args)
+        bound_positionals = self._bind_positionals(spec, positionals, kwargs)
 
         return kwargs, bound_positionals
 
-    def _split_args(
-        self, parameters: Mapping[str, inspect.Parameter], args: list[str]
-    ) -> tuple[dict[str, Any], list[str]]:
+    def _split_args(self, spec: _CommandSpec, args: list[str]) -> tuple[dict[str, Any], list[str]]:
         kwargs: dict[str, Any] = {}
         positionals: list[str] = []
 
         idx = 0
         while idx < len(args):
             token = args[idx]
-            if token.startswith("--"):
-                idx = self._handle_long_option(parameters, args, idx, kwargs)
-            elif token.startswith("-") and len(token) > 1:
-                self._handle_short_option(token, kwargs)
-            else:
+            if token[:1] != "-" or token == "-":
                 positionals.append(token)
+            elif token[:2] == "--":
+                idx = self._handle_long_option(spec, args, idx, kwargs)
+            else:
+                self._handle_short_option(token, kwargs)
             idx += 1
 
         return kwargs, positionals
 
     def _handle_long_option(
         self,
-        parameters: Mapping[str, inspect.Parameter],
+        spec: _CommandSpec,
         args: list[str],
         idx: int,
         kwargs: dict[str, Any],
@@ -89,7 +154,7 @@ class CliRunner:
         if idx + 1 < len(args) and not args[idx + 1].startswith("-"):
             value = args[idx + 1]
             idx += 1
-        kwargs[name] = self._coerce_value(parameters.get(name), value)
+        kwargs[name] = self._coerce_value(spec.coercers.get(name, _identity), value)
         return idx
 
     def _handle_short_option(self, token: str, kwargs: dict[str, Any]) -> None:
@@ -98,61 +163,24 @@ class CliRunner:
 
     def _bind_positionals(
         self,
-        parameters: Mapping[str, inspect.Parameter],
+        spec: _CommandSpec,
         positionals: list[str],
         kwargs: dict[str, Any],
     ) -> list[Any]:
         bound_positionals: list[Any] = []
         remaining_positionals = list(positionals)
-        for param in parameters.values():
-            if param.kind in (
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            ):
-                if param.name in kwargs:
-                    continue
-                if remaining_positionals:
-                    value = remaining_positionals.pop(0)
-                    bound_positionals.append(self._coerce_value(param, value))
+        for name in spec.positional_names:
+            if name in kwargs:
+                continue
+            if remaining_positionals:
+                value = remaining_positionals.pop(0)
+                bound_positionals.append(self._coerce_value(spec.coercers[name], value))
 
         return bound_positionals
 
     @staticmethod
-    def _coerce_value(param: inspect.Parameter | None, value: Any) -> Any:
-        if param is None or param.annotation is inspect._empty:
-            return value
-        annotation = param.annotation
-        if get_origin(annotation) is not None:
-            annotation_args = get_args(annotation)
-        else:
-            annotation_args = (annotation,)
-        if int in annotation_args and isinstance(value, str):
-            return int(value)
-        if float in annotation_args and isinstance(value, str):
-            return float(value)
-        return value
-
-
-class _patched_stdio:
-    def __init__(self, stdin: io.StringIO, stdout: io.StringIO) -> None:
-        self._stdin = stdin
-        self._stdout = stdout
-        self._old_stdin = None
-        self._old_stdout = None
-
-    def __enter__(self) -> None:
-        import sys
-
-        self._old_stdin = sys.stdin
-        self._old_stdout = sys.stdout
-        sys.stdin = self._stdin
-        sys.stdout = self._stdout
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        import sys
-
-        sys.stdin = self._old_stdin
-        sys.stdout = self._old_stdout
+    def _coerce_value(coercer: Callable[[str], Any], value: Any) -> Any:
+        return coercer(value) if isinstance(value, str) else value
 
 
 __all__ = ["CliRunner", "Result"]
@@ -19,6 +19,9 @@ class _LinodeEndpoint:
     def types(self) -> list[Any]:
         return []
 
+    def instances(self) -> list[Any]:
+        return []
+
 
 class LinodeClient:
     """Minimal stand-in for linode_api4.LinodeClient."""
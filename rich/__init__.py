@@ -1,18 +1,41 @@
 """Minimal rich stub for test environments without rich installed."""
 
-from .console import Console
-from .panel import Panel
-from .progress import Progress, SpinnerColumn, TextColumn
-from .prompt import Confirm, Prompt
-from .table import Table
+from importlib import import_module
+from typing import Any
+
+# Submodule providing each public name, imported on first attribute access
+_LAZY_ATTRS = {
+    "Console": ".console",
+    "Confirm": ".prompt",
+    "Group": ".console",
+    "Panel": ".panel",
+    "Progress": ".progress",
+    "Prompt": ".prompt",
+    "SpinnerColumn": ".progress",
+    "Table": ".table",
+    "Text": ".text",
+    "TextColumn": ".progress",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Console",
     "Confirm",
+    "Group",
     "Panel",
     "Progress",
     "Prompt",
     "SpinnerColumn",
     "Table",
+    "Text",
     "TextColumn",
 ]
@@ -12,3 +12,13 @@ class Console:
         end = kwargs.get("end", "\n")
         text = " ".join(str(arg) for arg in args)
         print(text, end=end)
+
+
+class Group:
+    """Minimal stand-in for rich.console.Group."""
+
+    def __init__(self, *renderables: Any, fit: bool = True) -> None:
+        self.renderables = list(renderables)
+
+    def __str__(self) -> str:
+        return "\n".join(str(renderable) for renderable in self.renderables)
@@ -38,3 +38,18 @@ class Progress:
     def update(self, task_id: int, advance: Any = None, **kwargs: Any) -> None:
         self._last_update = {"task_id": task_id, "advance": advance}
         return None
+
+    def advance(self, task_id: int, advance: Any = 1) -> None:
+        self.update(task_id, advance=advance)
+
+
+class BarColumn:
+    """Placeholder bar column."""
+
+
+class MofNCompleteColumn:
+    """Placeholder completed/total column."""
+
+
+class TimeRemainingColumn:
+    """Placeholder time remaining column."""
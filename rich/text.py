@@ -0,0 +1,14 @@
+"""Minimal text stub for rich."""
+
+from __future__ import annotations
+
+
+class Text:
+    """Minimal stand-in for rich.text.Text."""
+
+    def __init__(self, text: str = "", style: str = "", **kwargs) -> None:
+        self.plain = text
+        self.style = style
+
+    def __str__(self) -> str:
+        return self.plain
@@ -2,13 +2,46 @@
 
 import csv
 import fcntl
-import json
-import shutil
+import heapq
+import itertools
+import operator
+import os
+import sys
 import uuid
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import MISSING, asdict, dataclass, fields
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
+
+from .json_utils import json_dumps, json_loads, orjson
+
+
+def _uuid4_batch(count: int = 64) -> List[uuid.UUID]:
+    """Generate random (version 4) UUIDs from a single os.urandom() call."""
+    raw = os.urandom(16 * count)
+    return [uuid.UUID(bytes=raw[i : i + 16], version=4) for i in range(0, len(raw), 16)]
+
+
+@dataclass(slots=True, frozen=True)
+class SummaryMetrics:
+    """The summary fields shown in tables and exports, with their display defaults."""
+
+    avg_tokens_per_sec: float = 0
+    cost_per_1k_tokens: float = 0
+    tests_passed: int = 0
+    tests_total: int = 0
+
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Any]) -> "SummaryMetrics":
+        """Read the displayed fields out of a stored summary dict."""
+        get = summary.get
+        return cls(
+            get("avg_tokens_per_sec", 0),
+            get("cost_per_1k_tokens", 0),
+            get("tests_passed", 0),
+            get("tests_total", 0),
+        )
 
 
 @dataclass
@@ -28,6 +61,114 @@ class BenchmarkResult:
     results_by_category: Dict[str, Dict[str, Any]]
     summary: Dict[str, Any]
     tests: List[Dict[str, Any]]
+    timestamp_ns: int = 0  # Epoch nanoseconds of timestamp; 0 for rows written before it existed
+
+    @property
+    def metrics(self) -> SummaryMetrics:
+        """Displayed summary fields, read from the summary dict in one go."""
+        return SummaryMetrics.from_summary(self.summary)
+
+    @property
+    def cost_efficiency(self) -> float:
+        """Average tokens/sec per dollar/hour (0 when the hourly cost is unknown)."""
+        cost = self.hourly_cost
+        return self.summary.get("avg_tokens_per_sec", 0) / cost if cost > 0 else 0
+
+
+# Required BenchmarkResult fields in declaration order, for positional construction
+_RESULT_FIELDS = tuple(field.name for field in fields(BenchmarkResult) if field.default is MISSING)
+_get_result_fields = operator.itemgetter(*_RESULT_FIELDS)
+
+
+def _timestamp_ns(timestamp: str) -> int:
+    """Convert an ISO 8601 timestamp to epoch nanoseconds (0 if unparseable)."""
+    try:
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000_000)
+    except (TypeError, ValueError):
+        return 0
+
+
+CSV_HEADER = (
+    "ID",
+    "Timestamp",
+    "GPU Type",
+    "GPU Count",
+    "Total VRAM (GB)",
+    "Model",
+    "Model Category",
+    "Avg Tokens/Sec",
+    "Cost per 1K Tokens",
+    "Hourly Cost",
+    "Tests Passed",
+    "Tests Total",
+)
+
+
+def _csv_row(result: BenchmarkResult) -> tuple:
+    """Build the CSV export row for a result."""
+    metrics = result.metrics
+    return (
+        result.id,
+        result.timestamp,
+        result.gpu_type,
+        result.gpu_count,
+        result.total_vram,
+        result.model_id,
+        result.model_category,
+        f"{metrics.avg_tokens_per_sec:.2f}",
+        f"${metrics.cost_per_1k_tokens:.4f}",
+        f"${result.hourly_cost:.2f}",
+        metrics.tests_passed,
+        metrics.tests_total,
+    )
+
+
+_MD_ROW_FMT = "| {} | {}x | {}GB | {} | {:.1f} | ${:.4f} | ${:.2f} | {}/{} |".format
+
+
+def _markdown_row(result: BenchmarkResult) -> str:
+    """Build the Markdown table row for a result."""
+    metrics = result.metrics
+    # Truncate model name if too long
+    model_name = result.model_id.rpartition("/")[2]
+    if len(model_name) > 30:
+        model_name = model_name[:27] + "..."
+
+    return _MD_ROW_FMT(
+        result.gpu_type,
+        result.gpu_count,
+        result.total_vram,
+        model_name,
+        metrics.avg_tokens_per_sec,
+        metrics.cost_per_1k_tokens,
+        result.hourly_cost,
+        metrics.tests_passed,
+        metrics.tests_total,
+    )
+
+
+def _tokens_per_sec_key(result: BenchmarkResult) -> float:
+    return result.summary.get("avg_tokens_per_sec", 0)
+
+
+def _cost_per_1k_key(result: BenchmarkResult) -> float:
+    return result.summary.get("cost_per_1k_tokens", float("inf"))
+
+
+def _cost_efficiency_key(result: BenchmarkResult) -> float:
+    return result.cost_efficiency
+
+
+def _zero_key(result: BenchmarkResult) -> float:
+    return 0
+
+
+# Sort key for each metric accepted by get_best_by_metric
+_METRIC_SORT_KEYS = {
+    "tokens_per_sec": _tokens_per_sec_key,
+    "cost_per_1k_tokens": _cost_per_1k_key,
+    "cost_efficiency": _cost_efficiency_key,
+}
 
 
 class BenchmarkDatabase:
@@ -47,6 +188,23 @@ class BenchmarkDatabase:
             db_path = cache_dir / "benchmark-database.json"
 
         self.db_path = db_path
+
+        # In-memory copy of the database plus indexes into self._results,
+        # populated lazily on first query
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cached_stat: Optional[tuple] = None
+        self._results: List[Optional[BenchmarkResult]] = []
+        self._by_gpu: Dict[str, List[int]] = {}
+        self._by_model_cat: Dict[str, List[int]] = {}
+        self._by_task_cat: Dict[str, List[int]] = {}
+        self._metric_columns: Dict[str, List[float]] = {}
+        # Positions of well-formed results pre-sorted by (metric, ascending), built on
+        # first use and dropped whenever the result list changes
+        self._metric_orders: Dict[tuple, List[int]] = {}
+        # (stat signature, report) of the last coverage report, reused until the file changes
+        self._coverage_report: Optional[tuple] = None
+        self._uuid_pool: List[uuid.UUID] = []
+
         self._ensure_database()
 
     def _ensure_database(self):
@@ -60,11 +218,11 @@ class BenchmarkDatabase:
         Returns:
             Dictionary containing database data
         """
-        with open(self.db_path, "r") as f:
+        with open(self.db_path, "rb") as f:
             # Acquire shared lock for reading
             fcntl.flock(f.fileno(), fcntl.LOCK_SH)
             try:
-                data = json.load(f)
+                data = json_loads(f.read())
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
@@ -74,6 +232,74 @@ class BenchmarkDatabase:
 
         return data
 
+    def _stat_key(self) -> Optional[tuple]:
+        """Return (mtime_ns, size, inode) of the database file, or None if it can't be read."""
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load(self) -> Dict[str, Any]:
+        """Return cached database contents, re-reading and indexing when the file changes.
+
+        Returns:
+            Dictionary containing database data
+        """
+        stat_key = self._stat_key()
+        if self._cache is None or stat_key is None or stat_key != self._cached_stat:
+            self._cache = self._read_database()
+            self._cached_stat = stat_key
+            self._results = []
+            self._by_gpu = {}
+            self._by_model_cat = {}
+            self._by_task_cat = {}
+            self._metric_columns = {metric: [] for metric in _METRIC_SORT_KEYS}
+            self._metric_orders = {}
+            for benchmark in self._cache.get("benchmarks", []):
+                self._index_benchmark(benchmark)
+
+        return self._cache
+
+    def _index_benchmark(self, benchmark: Dict[str, Any]):
+        """Append a benchmark to the result cache and secondary indexes.
+
+        Args:
+            benchmark: Raw benchmark dictionary from the database
+        """
+        position = len(self._results)
+
+        # Only a handful of distinct GPU types and model categories exist; share one
+        # string object per value so rows don't each hold a copy
+        for key in ("gpu_type", "model_category"):
+            value = benchmark.get(key)
+            if isinstance(value, str):
+                benchmark[key] = sys.intern(value)
+
+        try:
+            result = BenchmarkResult(
+                *_get_result_fields(benchmark), benchmark.get("timestamp_ns", 0)
+            )
+        except (TypeError, KeyError):
+            # Keep positions aligned with the raw list, but never return malformed results
+            self._results.append(None)
+            for column in self._metric_columns.values():
+                column.append(0)
+            return
+
+        if not result.timestamp_ns:
+            # Older rows only have the ISO string; parse it once and keep it on the row
+            result.timestamp_ns = benchmark["timestamp_ns"] = _timestamp_ns(result.timestamp)
+
+        self._results.append(result)
+        self._by_gpu.setdefault(result.gpu_type, []).append(position)
+        self._by_model_cat.setdefault(result.model_category, []).append(position)
+        if result.results_by_category:
+            for task_category in result.results_by_category:
+                self._by_task_cat.setdefault(task_category, []).append(position)
+        for metric, column in self._metric_columns.items():
+            column.append(_METRIC_SORT_KEYS[metric](result))
+
     def _write_database(self, data: Dict[str, Any]):
         """Write database with atomic write and file locking.
 
@@ -83,16 +309,19 @@ class BenchmarkDatabase:
         # Write to temporary file first (atomic write pattern)
         temp_path = self.db_path.with_suffix(".tmp")
 
-        with open(temp_path, "w") as f:
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with os.fdopen(fd, "wb") as f:
             # Acquire exclusive lock for writing
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(fd, fcntl.LOCK_EX)
             try:
-                json.dump(data, f, indent=2)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                f.write(json_dumps(data))
+                f.flush()
+                os.fsync(fd)
 
-        # Atomic rename
-        shutil.move(str(temp_path), str(self.db_path))
+                # Atomic rename (single rename(2), no copy fallback) while still locked
+                os.replace(temp_path, self.db_path)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
 
     def add_result(self, result: BenchmarkResult) -> str:
         """Add new benchmark result to database.
@@ -103,16 +332,28 @@ class BenchmarkDatabase:
         Returns:
             ID of the added result
         """
-        data = self._read_database()
+        # Reuse the cached copy unless another writer has changed the file
+        data = self._load()
 
-        # Convert result to dict
+        # Convert result to dict. asdict() deep-copies the nested containers, which
+        # keeps the cached copy isolated from callers that reuse them after adding
         result_dict = asdict(result)
 
         # Append to benchmarks list
         data["benchmarks"].append(result_dict)
 
         # Write back
-        self._write_database(data)
+        try:
+            self._write_database(data)
+        except Exception:
+            # Drop the cache so the next query re-reads what is actually on disk
+            self._cache = None
+            raise
+
+        # Keep the in-memory indexes in step with the file we just wrote
+        self._cached_stat = self._stat_key()
+        self._index_benchmark(result_dict)
+        self._metric_orders = {}
 
         return result.id
 
@@ -132,73 +373,132 @@ class BenchmarkDatabase:
         Returns:
             List of BenchmarkResult objects matching filters
         """
-        data = self._read_database()
-        results = []
+        return list(self._iter_results(gpu_type, model_category, task_category))
+
+    def count_results(self) -> int:
+        """Count well-formed results without building a result list.
+
+        Returns:
+            Number of results get_results() would return with no filters
+        """
+        self._load()
+        return sum(result is not None for result in self._results)
 
-        for benchmark in data.get("benchmarks", []):
-            # Apply filters
-            if gpu_type and benchmark.get("gpu_type") != gpu_type:
-                continue
+    def _iter_results(
+        self,
+        gpu_type: Optional[str] = None,
+        model_category: Optional[str] = None,
+        task_category: Optional[str] = None,
+    ) -> Iterator[BenchmarkResult]:
+        """Yield results matching filters one at a time.
 
-            if model_category and benchmark.get("model_category") != model_category:
-                continue
+        Args:
+            gpu_type: Filter by GPU type
+            model_category: Filter by model category
+            task_category: Filter by task category
 
-            if task_category:
-                # Check if task_category exists in results_by_category
-                results_by_cat = benchmark.get("results_by_category", {})
-                if task_category not in results_by_cat:
-                    continue
+        Yields:
+            BenchmarkResult objects matching filters, in insertion order
+        """
+        for position in self._matching_positions(gpu_type, model_category, task_category):
+            yield self._results[position]
 
-            # Convert to BenchmarkResult object
-            try:
-                result = BenchmarkResult(**benchmark)
-                results.append(result)
-            except (TypeError, KeyError):
-                # Skip malformed results
-                continue
+    def _matching_positions(
+        self,
+        gpu_type: Optional[str] = None,
+        model_category: Optional[str] = None,
+        task_category: Optional[str] = None,
+    ) -> List[int]:
+        """Return sorted positions in self._results of well-formed results matching filters."""
+        self._load()
+
+        # Index lists are built in insertion order, so they are already sorted
+        active = [
+            index.get(key, [])
+            for index, key in (
+                (self._by_gpu, gpu_type),
+                (self._by_model_cat, model_category),
+                (self._by_task_cat, task_category),
+            )
+            if key
+        ]
 
-        return results
+        if not active:
+            return [position for position, result in enumerate(self._results) if result is not None]
+
+        if len(active) == 1:
+            return active[0]
+
+        # Walk the shortest list, checking membership in the others
+        active.sort(key=len)
+        others = [set(positions) for positions in active[1:]]
+        return [position for position in active[0] if all(position in other for other in others)]
 
     def get_best_by_metric(
         self,
         metric: str,
         task_category: Optional[str] = None,
-        limit: int = 10,
+        limit: Optional[int] = 10,
         ascending: bool = False,
+        gpu_type: Optional[str] = None,
+        model_category: Optional[str] = None,
     ) -> List[BenchmarkResult]:
         """Get top results sorted by metric.
 
         Args:
             metric: Metric to sort by ("tokens_per_sec", "cost_per_1k_tokens", "cost_efficiency")
             task_category: Filter by task category
-            limit: Maximum number of results to return
+            limit: Maximum number of results to return (None for every match)
             ascending: Sort ascending (for cost metrics) or descending (for performance metrics)
+            gpu_type: Filter by GPU type
+            model_category: Filter by model category
 
         Returns:
             List of BenchmarkResult objects sorted by metric
         """
-        results = self.get_results(task_category=task_category)
-
-        # Define sort key based on metric
-        def sort_key(result: BenchmarkResult) -> float:
-            summary = result.summary
-
-            if metric == "tokens_per_sec":
-                return summary.get("avg_tokens_per_sec", 0)
-            elif metric == "cost_per_1k_tokens":
-                return summary.get("cost_per_1k_tokens", float("inf"))
-            elif metric == "cost_efficiency":
-                # Cost efficiency = tokens_per_sec / hourly_cost
-                tps = summary.get("avg_tokens_per_sec", 0)
-                cost = result.hourly_cost
-                return tps / cost if cost > 0 else 0
+        positions = self._matching_positions(gpu_type, model_category, task_category)
+
+        # Metric values are precomputed per result when indexing, so the key is a
+        # C-level list lookup instead of a Python callback per comparison
+        column = self._metric_columns.get(metric)
+        sort_key = column.__getitem__ if column is not None else _zero_key
+
+        # When the filters keep most rows, walk the pre-sorted order and stop after
+        # `limit` matches; selective filters are cheaper to rank directly
+        if column is not None and 2 * len(positions) >= len(self._results):
+            order = self._metric_order(metric, ascending)
+            if len(positions) == len(order):
+                best = order[:limit]
             else:
-                return 0
+                wanted = set(positions)
+                best = list(itertools.islice(filter(wanted.__contains__, order), limit))
+            return [self._results[position] for position in best]
+
+        # Partial heap selection instead of sorting every result, unless all are wanted
+        if limit is None:
+            best = sorted(positions, key=sort_key, reverse=not ascending)
+        elif ascending:
+            best = heapq.nsmallest(limit, positions, key=sort_key)
+        else:
+            best = heapq.nlargest(limit, positions, key=sort_key)
+
+        return [self._results[position] for position in best]
 
-        # Sort results
-        sorted_results = sorted(results, key=sort_key, reverse=not ascending)
+    def _metric_order(self, metric: str, ascending: bool) -> List[int]:
+        """Return positions of well-formed results sorted by a metric column.
 
-        return sorted_results[:limit]
+        Ties keep insertion order, matching heapq.nsmallest/nlargest.
+        """
+        order = self._metric_orders.get((metric, ascending))
+        if order is None:
+            column = self._metric_columns[metric]
+            order = [
+                position for position, result in enumerate(self._results) if result is not None
+            ]
+            # reverse=True keeps ties in insertion order, as the sort is stable
+            order.sort(key=column.__getitem__, reverse=not ascending)
+            self._metric_orders[(metric, ascending)] = order
+        return order
 
     def get_coverage_report(self) -> Dict[str, Any]:
         """Generate coverage report showing which configs have been tested.
@@ -207,55 +507,70 @@ class BenchmarkDatabase:
             Dictionary with coverage information:
             {
                 "tested_configs": [
-                    {"gpu_type": str, "model_category": str, "count": int, "last_run": str}
+                    {"gpu_type": str, "model_category": str, "count": int, "last_run": str,
+                     "last_run_ns": int}
                 ],
                 "total_benchmarks": int,
                 "gpu_types_tested": int,
                 "gpu_types_total": int,
+                "confidence_counts": {"high": int, "medium": int, "low": int},
             }
+
+            Configs count as high confidence with 3+ runs, medium with 2 and low with 1.
+            The report is reused until the database file changes.
         """
+        self._load()
+        if self._coverage_report is not None and self._coverage_report[0] == self._cached_stat:
+            return self._coverage_report[1]
+
         results = self.get_results()
 
-        # Count benchmarks by GPU type and model category
-        config_counts: Dict[str, Dict[str, Any]] = {}
+        # Count benchmarks by GPU type and model category in a single pass
+        config_counts: Dict[tuple, Dict[str, Any]] = {}
+        gpu_types = set()
 
         for result in results:
-            key = f"{result.gpu_type}|{result.model_category}"
-
-            if key not in config_counts:
-                config_counts[key] = {
+            entry = config_counts.setdefault(
+                (result.gpu_type, result.model_category),
+                {
                     "gpu_type": result.gpu_type,
                     "model_category": result.model_category,
                     "count": 0,
                     "last_run": result.timestamp,
-                }
-
-            config_counts[key]["count"] += 1
-
-            # Update last_run if this is more recent
-            if result.timestamp > config_counts[key]["last_run"]:
-                config_counts[key]["last_run"] = result.timestamp
-
-        # Convert to list
-        tested_configs = list(config_counts.values())
+                    "last_run_ns": result.timestamp_ns,
+                },
+            )
+            entry["count"] += 1
+            if result.timestamp_ns > entry["last_run_ns"]:
+                entry["last_run"] = result.timestamp
+                entry["last_run_ns"] = result.timestamp_ns
+            gpu_types.add(result.gpu_type)
 
         # Sort by last_run (most recent first)
-        tested_configs.sort(key=lambda x: x["last_run"], reverse=True)
+        tested_configs = sorted(
+            config_counts.values(), key=lambda x: x["last_run_ns"], reverse=True
+        )
 
-        # Get unique GPU types
-        gpu_types_tested = len({config["gpu_type"] for config in tested_configs})
+        confidence_counts = {"high": 0, "medium": 0, "low": 0}
+        for config in tested_configs:
+            count = config["count"]
+            confidence_counts["high" if count >= 3 else "medium" if count == 2 else "low"] += 1
 
         # Total GPU types available (from linode provider)
         gpu_types_total = (
             7  # RTX4000x1, RTX4000x2, RTX4000x4, RTX6000x1, RTX6000x2, RTX6000x3, RTX6000x4
         )
 
-        return {
+        report = {
             "tested_configs": tested_configs,
             "total_benchmarks": len(results),
-            "gpu_types_tested": gpu_types_tested,
+            "gpu_types_tested": len(gpu_types),
             "gpu_types_total": gpu_types_total,
+            "confidence_counts": confidence_counts,
         }
+        if self._cached_stat is not None:
+            self._coverage_report = (self._cached_stat, report)
+        return report
 
     def get_results_by_config(
         self, gpu_type: str, model_category: Optional[str] = None
@@ -271,120 +586,69 @@ class BenchmarkDatabase:
         """
         return self.get_results(gpu_type=gpu_type, model_category=model_category)
 
-    def export(self, format: str, output_path: Path):
-        """Export database to file.
+    def export(
+        self,
+        format: str,
+        output_path: Path,
+        results: Optional[Iterable[BenchmarkResult]] = None,
+    ) -> int:
+        """Export results to file.
 
         Args:
             format: Export format ("json", "csv", "markdown")
             output_path: Path to write output file
-        """
-        results = self.get_results()
+            results: Already-fetched results to write (default: the whole database)
 
+        Returns:
+            Number of results written
+        """
         if format == "json":
-            self._export_json(results, output_path)
-        elif format == "csv":
-            self._export_csv(results, output_path)
-        elif format == "markdown":
-            self._export_markdown(results, output_path)
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
-
-    def _export_json(self, results: List[BenchmarkResult], output_path: Path):
+            return self._export_json(
+                self.get_results() if results is None else results, output_path
+            )
+        if results is None:
+            results = self._iter_results()
+        if format == "csv":
+            return self._export_csv(results, output_path)
+        if format == "markdown":
+            return self._export_markdown(results, output_path)
+        raise ValueError(f"Unsupported export format: {format}")
+
+    def _export_json(self, results: Iterable[BenchmarkResult], output_path: Path) -> int:
         """Export to JSON format."""
-        data = [asdict(result) for result in results]
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
-
-    def _export_csv(self, results: List[BenchmarkResult], output_path: Path):
-        """Export to CSV format."""
-        if not results:
-            # Write empty CSV with headers
-            with open(output_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "ID",
-                        "Timestamp",
-                        "GPU Type",
-                        "GPU Count",
-                        "Total VRAM (GB)",
-                        "Model",
-                        "Model Category",
-                        "Avg Tokens/Sec",
-                        "Cost per 1K Tokens",
-                        "Hourly Cost",
-                        "Tests Passed",
-                        "Tests Total",
-                    ]
-                )
-            return
-
+        results = list(results)
+        if orjson is not None:
+            # orjson serializes dataclass instances natively, with no per-row dict copy
+            payload = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+        else:
+            # Fields are already JSON-serializable, so skip asdict()'s recursive copy
+            payload = json_dumps([vars(result) for result in results], indent=True)
+        output_path.write_bytes(payload)
+        return len(results)
+
+    def _export_csv(self, results: Iterable[BenchmarkResult], output_path: Path) -> int:
+        """Export to CSV format, writing one row per result as it is read."""
+        count = 0
         with open(output_path, "w", newline="") as f:
             writer = csv.writer(f)
-
-            # Write header
-            writer.writerow(
-                [
-                    "ID",
-                    "Timestamp",
-                    "GPU Type",
-                    "GPU Count",
-                    "Total VRAM (GB)",
-                    "Model",
-                    "Model Category",
-                    "Avg Tokens/Sec",
-                    "Cost per 1K Tokens",
-                    "Hourly Cost",
-                    "Tests Passed",
-                    "Tests Total",
-                ]
-            )
-
-            # Write rows
-            for result in results:
-                summary = result.summary
-                writer.writerow(
-                    [
-                        result.id,
-                        result.timestamp,
-                        result.gpu_type,
-                        result.gpu_count,
-                        result.total_vram,
-                        result.model_id,
-                        result.model_category,
-                        f"{summary.get('avg_tokens_per_sec', 0):.2f}",
-                        f"${summary.get('cost_per_1k_tokens', 0):.4f}",
-                        f"${result.hourly_cost:.2f}",
-                        summary.get("tests_passed", 0),
-                        summary.get("tests_total", 0),
-                    ]
-                )
-
-    def _export_markdown(self, results: List[BenchmarkResult], output_path: Path):
-        """Export to Markdown table format."""
-        lines = [
-            "# Benchmark Results",
-            "",
-            "| GPU Type | GPUs | VRAM | Model | Tokens/Sec | Cost/1K | Hourly Cost | Tests |",
-            "|----------|------|------|-------|------------|---------|-------------|-------|",
-        ]
-
-        for result in results:
-            summary = result.summary
-            # Truncate model name if too long
-            model_name = result.model_id.split("/")[-1]
-            if len(model_name) > 30:
-                model_name = model_name[:27] + "..."
-
-            lines.append(
-                f"| {result.gpu_type} | {result.gpu_count}x | {result.total_vram}GB | "
-                f"{model_name} | {summary.get('avg_tokens_per_sec', 0):.1f} | "
-                f"${summary.get('cost_per_1k_tokens', 0):.4f} | ${result.hourly_cost:.2f} | "
-                f"{summary.get('tests_passed', 0)}/{summary.get('tests_total', 0)} |"
-            )
-
+            writer.writerow(CSV_HEADER)
+            for count, result in enumerate(results, 1):
+                writer.writerow(_csv_row(result))
+        return count
+
+    def _export_markdown(self, results: Iterable[BenchmarkResult], output_path: Path) -> int:
+        """Export to Markdown table format, writing one line per result as it is read."""
+        count = 0
         with open(output_path, "w") as f:
-            f.write("\n".join(lines))
+            f.write(
+                "# Benchmark Results\n"
+                "\n"
+                "| GPU Type | GPUs | VRAM | Model | Tokens/Sec | Cost/1K | Hourly Cost | Tests |\n"
+                "|----------|------|------|-------|------------|---------|-------------|-------|"
+            )
+            for count, result in enumerate(results, 1):
+                f.write("\n" + _markdown_row(result))
+        return count
 
     def create_result(
         self,
@@ -398,6 +662,7 @@ class BenchmarkDatabase:
         results_by_category: Dict[str, Dict[str, Any]],
         summary: Dict[str, Any],
         tests: List[Dict[str, Any]],
+        timestamp: Optional[datetime] = None,
     ) -> BenchmarkResult:
         """Create a new BenchmarkResult object with generated ID and timestamp.
 
@@ -412,13 +677,18 @@ class BenchmarkDatabase:
             results_by_category: Results organized by task category
             summary: Summary metrics
             tests: List of individual test results
+            timestamp: When the benchmark ran (default: now, in UTC)
 
         Returns:
             BenchmarkResult object ready to be added to database
         """
+        if not self._uuid_pool:
+            self._uuid_pool = _uuid4_batch()
+
+        now = timestamp or datetime.now(timezone.utc)
         return BenchmarkResult(
-            id=str(uuid.uuid4()),
-            timestamp=datetime.now().isoformat(),
+            id=str(self._uuid_pool.pop()),
+            timestamp=now.isoformat(),
             gpu_type=gpu_type,
             gpu_count=gpu_count,
             vram_per_gpu=vram_per_gpu,
@@ -430,4 +700,15 @@ class BenchmarkDatabase:
             results_by_category=results_by_category,
             summary=summary,
             tests=tests,
+            timestamp_ns=int(now.timestamp() * 1_000_000_000),
         )
+
+
+@lru_cache(maxsize=1)
+def default_database() -> BenchmarkDatabase:
+    """Return the process-wide database at the default path.
+
+    Commands share one instance so its parsed results and indexes are reused; the
+    cache still re-reads the file whenever another process changes it.
+    """
+    return BenchmarkDatabase()
@@ -1,10 +1,13 @@
 """Model selection and categorization for benchmarking."""
 
+import re
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for a model to benchmark."""
 
@@ -15,75 +18,111 @@ class ModelConfig:
     recommended_context: int  # Recommended max_model_len
 
 
-# Model database organized by category
+# Model database, grouped by category in ascending size
+ALL_MODELS = (
+    ModelConfig(
+        id="Qwen/Qwen2.5-Coder-7B-Instruct",
+        category="7b",
+        quantization="full",
+        min_vram_gb=16,
+        recommended_context=32768,
+    ),
+    ModelConfig(
+        id="deepseek-ai/deepseek-coder-7b-instruct-v1.5",
+        category="7b",
+        quantization="full",
+        min_vram_gb=16,
+        recommended_context=16384,
+    ),
+    ModelConfig(
+        id="Qwen/Qwen2.5-Coder-14B-Instruct-AWQ",
+        category="14b",
+        quantization="awq",
+        min_vram_gb=18,
+        recommended_context=32768,
+    ),
+    ModelConfig(
+        id="Qwen/Qwen2.5-Coder-14B-Instruct",
+        category="14b",
+        quantization="full",
+        min_vram_gb=32,
+        recommended_context=32768,
+    ),
+    ModelConfig(
+        id="Qwen/Qwen2.5-Coder-32B-Instruct-AWQ",
+        category="30b",
+        quantization="awq",
+        min_vram_gb=35,
+        recommended_context=32768,
+    ),
+    ModelConfig(
+        id="deepseek-ai/deepseek-coder-33b-instruct",
+        category="30b",
+        quantization="full",
+        min_vram_gb=70,
+        recommended_context=16384,
+    ),
+    ModelConfig(
+        id="Qwen/Qwen2.5-72B-Instruct-AWQ",
+        category="70b",
+        quantization="awq",
+        min_vram_gb=70,
+        recommended_context=32768,
+    ),
+    ModelConfig(
+        id="deepseek-ai/DeepSeek-Coder-V2-Instruct",
+        category="70b",
+        quantization="full",
+        min_vram_gb=140,
+        recommended_context=32768,
+    ),
+)
+
+# Per-category view of ALL_MODELS
 MODEL_CATEGORIES = {
-    "7b": [
-        ModelConfig(
-            id="Qwen/Qwen2.5-Coder-7B-Instruct",
-            category="7b",
-            quantization="full",
-            min_vram_gb=16,
-            recommended_context=32768,
-        ),
-        ModelConfig(
-            id="deepseek-ai/deepseek-coder-7b-instruct-v1.5",
-            category="7b",
-            quantization="full",
-            min_vram_gb=16,
-            recommended_context=16384,
-        ),
-    ],
-    "14b": [
-        ModelConfig(
-            id="Qwen/Qwen2.5-Coder-14B-Instruct-AWQ",
-            category="14b",
-            quantization="awq",
-            min_vram_gb=18,
-            recommended_context=32768,
-        ),
-        ModelConfig(
-            id="Qwen/Qwen2.5-Coder-14B-Instruct",
-            category="14b",
-            quantization="full",
-            min_vram_gb=32,
-            recommended_context=32768,
-        ),
-    ],
-    "30b": [
-        ModelConfig(
-            id="Qwen/Qwen2.5-Coder-32B-Instruct-AWQ",
-            category="30b",
-            quantization="awq",
-            min_vram_gb=35,
-            recommended_context=32768,
-        ),
-        ModelConfig(
-            id="deepseek-ai/deepseek-coder-33b-instruct",
-            category="30b",
-            quantization="full",
-            min_vram_gb=70,
-            recommended_context=16384,
-        ),
-    ],
-    "70b": [
-        ModelConfig(
-            id="Qwen/Qwen2.5-72B-Instruct-AWQ",
-            category="70b",
-            quantization="awq",
-            min_vram_gb=70,
-            recommended_context=32768,
-        ),
-        ModelConfig(
-            id="deepseek-ai/DeepSeek-Coder-V2-Instruct",
-            category="70b",
-            quantization="full",
-            min_vram_gb=140,
-            recommended_context=32768,
-        ),
-    ],
+    category: tuple(model for model in ALL_MODELS if model.category == category)
+    for category in ("7b", "14b", "30b", "70b")
 }
 
 
+_QUANTIZED_FORMATS = frozenset(("awq", "gptq"))
+
+# Categories considered by select_models_for_vram, largest first
+_CATEGORY_ORDER = ("70b", "30b", "14b", "7b")
+
+
+def _build_recommendation_tables() -> Tuple[
+    Tuple[int, ...], Dict[bool, Tuple[Tuple[ModelConfig, ...], ...]]
+]:
+    """Precompute get_recommended_models() answers for every distinct VRAM threshold.
+
+    Returns:
+        Sorted tuple of distinct min_vram_gb values, and for each prefer_quantized
+        flag a tuple (parallel to the thresholds) of the models that fit, in
+        recommendation order
+    """
+    thresholds = tuple(sorted({model.min_vram_gb for model in ALL_MODELS}))
+
+    tables: Dict[bool, Tuple[Tuple[ModelConfig, ...], ...]] = {}
+    for prefer_quantized in (True, False):
+        # Priority order: 1) quantization preference, 2) VRAM requirement (larger = better)
+        ordered = sorted(
+            ALL_MODELS,
+            key=lambda m: (
+                (m.quantization in _QUANTIZED_FORMATS) != prefer_quantized,
+                -m.min_vram_gb,
+            ),
+        )
+        tables[prefer_quantized] = tuple(
+            tuple(m for m in ordered if m.min_vram_gb <= threshold) for threshold in thresholds
+        )
+
+    return thresholds, tables
+
+
+_VRAM_THRESHOLDS, _RECOMMENDED_BY_THRESHOLD = _build_recommendation_tables()
+
+
 def get_recommended_models(vram_gb: int, prefer_quantized: bool = True) -> List[ModelConfig]:
     """Get recommended models for given VRAM capacity.
 
@@ -94,74 +133,59 @@ def get_recommended_models(vram_gb: int, prefer_quantized: bool = True) -> List[
     Returns:
         List of ModelConfig objects suitable for the VRAM capacity
     """
-    suitable_models: List[ModelConfig] = []
+    thresholds_fit = bisect_right(_VRAM_THRESHOLDS, vram_gb)
+    if thresholds_fit == 0:
+        return []
 
-    # Collect all models that fit in VRAM
-    for category, models in MODEL_CATEGORIES.items():
-        for model in models:
-            if model.min_vram_gb <= vram_gb:
-                suitable_models.append(model)
+    return list(_RECOMMENDED_BY_THRESHOLD[prefer_quantized][thresholds_fit - 1])
 
-    # Sort by preference: quantized first if prefer_quantized, then by size (largest first)
-    def sort_key(model: ModelConfig) -> tuple:
-        # Priority order: 1) quantization preference, 2) VRAM requirement (larger = better)
-        is_quantized = model.quantization in ["awq", "gptq"]
-        if prefer_quantized:
-            return (not is_quantized, -model.min_vram_gb)
-        else:
-            return (is_quantized, -model.min_vram_gb)
 
-    suitable_models.sort(key=sort_key)
+# Size and quantization markers, tried in priority order: each alternative scans
+# the whole ID before the next is tried, so "7B-to-70B" is still a 70b model
+_CATEGORY_RE = re.compile(
+    r"(?:.*(70b|72b)|.*(30b|32b|33b)|.*(14b|15b)|.*(7b|8b)|.*(3b|1b))",
+    re.IGNORECASE | re.DOTALL,
+)
+_CATEGORY_BY_GROUP = {1: "70b", 2: "30b", 3: "14b", 4: "7b", 5: "small"}
 
-    return suitable_models
+_QUANTIZATION_RE = re.compile(r"(?:.*(awq)|.*(gptq)|.*(gguf))", re.IGNORECASE | re.DOTALL)
+_QUANTIZATION_BY_GROUP = {1: "awq", 2: "gptq", 3: "gguf"}
 
 
+@lru_cache(maxsize=256)
 def get_model_category(model_id: str) -> str:
     """Determine model category from model ID.
 
+    Results are cached for the lifetime of the process.
+
     Args:
         model_id: HuggingFace model ID
 
     Returns:
         Model category (e.g., "7b", "14b", "30b", "70b")
     """
-    model_id_lower = model_id.lower()
-
-    # Check for explicit size markers
-    if "70b" in model_id_lower or "72b" in model_id_lower:
-        return "70b"
-    elif "30b" in model_id_lower or "32b" in model_id_lower or "33b" in model_id_lower:
-        return "30b"
-    elif "14b" in model_id_lower or "15b" in model_id_lower:
-        return "14b"
-    elif "7b" in model_id_lower or "8b" in model_id_lower:
-        return "7b"
-    elif "3b" in model_id_lower or "1b" in model_id_lower:
-        return "small"
-    else:
-        # Default to unknown
+    match = _CATEGORY_RE.match(model_id)
+    if match is None:
         return "unknown"
+    return _CATEGORY_BY_GROUP[match.lastindex]
 
 
+@lru_cache(maxsize=256)
 def get_quantization_type(model_id: str) -> str:
     """Determine quantization type from model ID.
 
+    Results are cached for the lifetime of the process.
+
     Args:
         model_id: HuggingFace model ID
 
     Returns:
         Quantization type (e.g., "awq", "gptq", "full")
     """
-    model_id_lower = model_id.lower()
-
-    if "awq" in model_id_lower:
-        return "awq"
-    elif "gptq" in model_id_lower:
-        return "gptq"
-    elif "gguf" in model_id_lower:
-        return "gguf"
-    else:
+    match = _QUANTIZATION_RE.match(model_id)
+    if match is None:
         return "full"
+    return _QUANTIZATION_BY_GROUP[match.lastindex]
 
 
 def get_best_model_for_vram(vram_gb: int) -> Optional[ModelConfig]:
@@ -205,11 +229,10 @@ def select_models_for_vram(vram_gb: int) -> List[ModelConfig]:
         return []
 
     by_category = _group_models_by_category(all_suitable)
-    category_order = ["70b", "30b", "14b", "7b"]
-    selected = _select_primary_quantized(by_category, category_order)
+    selected = _select_primary_quantized(by_category, _CATEGORY_ORDER)
 
     if vram_gb >= 80:
-        _append_full_precision(by_category, category_order, selected)
+        _append_full_precision(by_category, _CATEGORY_ORDER, selected)
 
     return selected[:3]  # Maximum 3 models
 
@@ -223,11 +246,11 @@ def _group_models_by_category(models: List[ModelConfig]) -> dict[str, List[Model
 
 def _select_primary_quantized(
     by_category: dict[str, List[ModelConfig]],
-    category_order: list[str],
+    category_order: Tuple[str, ...],
 ) -> list[ModelConfig]:
     for category in category_order:
         candidates = by_category.get(category, [])
-        quantized = [m for m in candidates if m.quantization in ["awq", "gptq"]]
+        quantized = [m for m in candidates if m.quantization in _QUANTIZED_FORMATS]
         if quantized:
             return [quantized[0]]
     return []
@@ -235,7 +258,7 @@ def _select_primary_quantized(
 
 def _append_full_precision(
     by_category: dict[str, List[ModelConfig]],
-    category_order: list[str],
+    category_order: Tuple[str, ...],
     selected: list[ModelConfig],
 ) -> None:
     if len(selected) >= 3:
@@ -248,9 +271,37 @@ def _append_full_precision(
             return
 
 
+# Base parameter counts (approximate)
+_PARAM_COUNTS = {
+    "7b": 7_000_000_000,
+    "14b": 14_000_000_000,
+    "30b": 33_000_000_000,
+    "70b": 70_000_000_000,
+}
+
+# Half-bytes (4-bit units) per parameter based on quantization
+_HALF_BYTES_PER_PARAM = {
+    "awq": 1,  # 4-bit quantization
+    "gptq": 1,  # 4-bit quantization
+    "gguf": 1,  # 4-bit quantization (typical)
+    "full": 4,  # FP16/BF16
+}
+
+# Estimated VRAM in GB for every (category, quantization) pair: model size plus 25%
+# overhead for KV cache, activations, etc. In integer math,
+# params * half_bytes / 2 * 1.25 / 1024**3 == params * half_bytes * 5 // (8 * 1024**3)
+_VRAM_TABLE = {
+    (category, quantization): params * half_bytes * 5 // (8 * 1024**3)
+    for category, params in _PARAM_COUNTS.items()
+    for quantization, half_bytes in _HALF_BYTES_PER_PARAM.items()
+}
+
+
 def estimate_vram_usage(model_category: str, quantization: str) -> int:
     """Estimate VRAM usage for a model.
 
+    Unknown categories are treated as 7b and unknown quantization as full precision.
+
     Args:
         model_category: Model category (e.g., "7b", "30b", "70b")
         quantization: Quantization type (e.g., "awq", "gptq", "full")
@@ -258,37 +309,19 @@ def estimate_vram_usage(model_category: str, quantization: str) -> int:
     Returns:
         Estimated VRAM usage in GB
     """
-    # Base parameter counts (approximate)
-    param_counts = {
-        "7b": 7_000_000_000,
-        "14b": 14_000_000_000,
-        "30b": 33_000_000_000,
-        "70b": 70_000_000_000,
-    }
-
-    # Bytes per parameter based on quantization
-    bytes_per_param = {
-        "awq": 0.5,  # 4-bit quantization
-        "gptq": 0.5,  # 4-bit quantization
-        "gguf": 0.5,  # 4-bit quantization (typical)
-        "full": 2.0,  # FP16/BF16
-    }
-
-    params = param_counts.get(model_category, 7_000_000_000)
-    multiplier = bytes_per_param.get(quantization, 2.0)
-
-    # Calculate model size in GB
-    model_size_gb = (params * multiplier) / (1024**3)
-
-    # Add 20-30% overhead for KV cache, activations, etc.
-    total_vram_gb = model_size_gb * 1.25
-
-    return int(total_vram_gb)
+    if model_category not in _PARAM_COUNTS:
+        model_category = "7b"
+    if quantization not in _HALF_BYTES_PER_PARAM:
+        quantization = "full"
+    return _VRAM_TABLE[model_category, quantization]
 
 
+@lru_cache(maxsize=256)
 def get_recommended_context_length(vram_gb: int, model_category: str) -> int:
     """Get recommended context length based on VRAM and model size.
 
+    Results are cached for the lifetime of the process.
+
     Args:
         vram_gb: Total VRAM available in GB
         model_category: Model category (e.g., "7b", "30b", "70b")
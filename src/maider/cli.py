@@ -1,35 +1,57 @@
 #!/usr/bin/env python3
 """CLI entry point for Linode LLM Coder."""
 
+import importlib
 import sys
 import click
 
 from .output import set_quiet
-from .commands import (
-    up,
-    down,
-    list_vms,
-    list_types,
-    status,
-    validate,
-    check,
-    validate_perf,
-    wizard,
-    use,
-    cleanup,
-    extend,
-    switch_model,
-    tunnel,
-    watch,
-    benchmark,
-    benchmark_collect,
-    benchmark_compare,
-    benchmark_status,
-    recommend,
-)
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module only when it is invoked."""
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module.path:attribute" (relative to this package)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+        module_path, attr = self.lazy_subcommands[cmd_name].split(":")
+        return getattr(importlib.import_module(module_path, __package__), attr)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "wizard": ".commands.wizard:cmd",
+        "up": ".commands.up:cmd",
+        "down": ".commands.down:cmd",
+        "list": ".commands.list_vms:cmd",
+        "list-types": ".commands.list_types:cmd",
+        "status": ".commands.status:cmd",
+        "use": ".commands.use:cmd",
+        "cleanup": ".commands.cleanup:cmd",
+        "extend": ".commands.extend:cmd",
+        "switch-model": ".commands.switch_model:cmd",
+        "tunnel": ".commands.tunnel:cmd",
+        "watch": ".commands.watch:cmd",
+        "validate": ".commands.validate:cmd",
+        "check": ".commands.check:cmd",
+        "validate-perf": ".commands.validate_perf:cmd",
+        # Benchmark commands
+        "benchmark": ".commands.benchmark:cmd",
+        "benchmark-collect": ".commands.benchmark_collect:cmd",
+        "benchmark-compare": ".commands.benchmark_compare:cmd",
+        "benchmark-status": ".commands.benchmark_status:cmd",
+        "recommend": ".commands.recommend:cmd",
+    },
+)
 @click.version_option()
 @click.option(
     "--quiet",
@@ -42,30 +64,5 @@ def main(quiet: bool):
     set_quiet(quiet)
 
 
-# Register commands
-main.add_command(wizard.cmd)
-main.add_command(up.cmd)
-main.add_command(down.cmd)
-main.add_command(list_vms.cmd)
-main.add_command(list_types.cmd)
-main.add_command(status.cmd)
-main.add_command(use.cmd)
-main.add_command(cleanup.cmd)
-main.add_command(extend.cmd)
-main.add_command(switch_model.cmd)
-main.add_command(tunnel.cmd)
-main.add_command(watch.cmd)
-main.add_command(validate.cmd)
-main.add_command(check.cmd)
-main.add_command(validate_perf.cmd)
-
-# Benchmark commands
-main.add_command(benchmark.cmd)
-main.add_command(benchmark_collect.cmd)
-main.add_command(benchmark_compare.cmd)
-main.add_command(benchmark_status.cmd)
-main.add_command(recommend.cmd)
-
-
 if __name__ == "__main__":
     sys.exit(main())
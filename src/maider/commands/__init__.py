@@ -1,28 +1,7 @@
 """Command modules for coder CLI."""
 
-# Make commands available for import
-from . import (
-    up,
-    down,
-    list_vms,
-    list_types,
-    status,
-    validate,
-    check,
-    validate_perf,
-    wizard,
-    use,
-    cleanup,
-    extend,
-    switch_model,
-    tunnel,
-    watch,
-    benchmark,
-    benchmark_collect,
-    benchmark_compare,
-    benchmark_status,
-    recommend,
-)
+# Command modules are imported on demand by the CLI (see maider.cli.LazyGroup),
+# so nothing is imported eagerly here.
 
 __all__ = [
     "up",
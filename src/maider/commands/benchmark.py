@@ -1,34 +1,112 @@
 """Benchmark command for testing VM performance."""
 
-import json
+import hashlib
+import os
+import re
+import statistics
+import sys
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterable, List, Sequence, Set
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+)
 from rich.table import Table
 
-from ..benchmark_db import BenchmarkDatabase
+from ..benchmark_db import default_database
 from ..benchmark_models import get_model_category
+from ..json_utils import json_dumps, json_loads
 from ..output import console
 from ..providers.linode import GPU_TYPES
 from ..session import SessionManager
 
-# Test prompts of varying complexity, organized by category
-TEST_PROMPTS = [
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Upper bound for --concurrency; also the connection pool size of the shared session
+MAX_CONCURRENCY = 32
+
+# Shared session so keep-alive connections are reused across prompts instead of
+# paying TCP/TLS setup on every request (which would be counted in elapsed_time)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=MAX_CONCURRENCY))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENCY))
+
+# Stored responses for --reuse-cache, one JSON file per request key
+PROMPT_CACHE_DIR = Path.home() / ".cache" / "linode-vms" / "prompt-cache"
+
+# vLLM settings recorded with database results; tensor_parallel_size is the session's GPU count
+_DEFAULT_VLLM_CONFIG = {
+    "tensor_parallel_size": 1,
+    "max_model_len": 32768,
+    "gpu_memory_utilization": 0.90,
+}
+
+# `export NAME=value` lines of an aider-env file, with optional quotes around the value
+_API_SETTINGS_RE = re.compile(
+    r"^export (OPENAI_API_BASE|AIDER_MODEL)=[\"']?([^\"'\n]*)[\"']?", re.MULTILINE
+)
+
+# Fixed preamble sent ahead of every prompt in a category. It must stay byte-identical
+# across the category's tests so vLLM's automatic prefix cache can reuse its KV blocks.
+CATEGORY_PREAMBLES = {
+    "coding": (
+        "You are an expert software engineer. Answer with correct, idiomatic, "
+        "well-commented code and briefly explain the key decisions.\n\n"
+    ),
+    "context_heavy": (
+        "You are a senior software architect reviewing a codebase. Read the supplied "
+        "context carefully, refer to specific details from it, and structure your "
+        "answer with clear headings.\n\n"
+    ),
+    "reasoning": (
+        "You are a principal engineer. Reason step by step, state your assumptions "
+        "explicitly, weigh the trade-offs of each option, and finish with a clear "
+        "recommendation.\n\n"
+    ),
+}
+
+_CATEGORIES = frozenset(CATEGORY_PREAMBLES)
+
+
+@dataclass(slots=True, frozen=True)
+class BenchmarkPrompt:
+    """A benchmark test prompt."""
+
+    name: str
+    category: str  # Key into CATEGORY_PREAMBLES
+    prompt: str  # Sent after the category preamble
+    expected_tokens: int
+
+
+# Test prompts of varying complexity, organized by category. Each prompt is sent after
+# its category's preamble, and tests of the same category are kept adjacent.
+TEST_PROMPTS = (
     # Coding tasks (4 prompts)
-    {
-        "name": "Simple function",
-        "category": "coding",
-        "prompt": "Write a Python function that checks if a number is prime.",
-        "expected_tokens": 100,
-    },
-    {
-        "name": "Code review",
-        "category": "coding",
-        "prompt": """Review this code and suggest improvements:
+    BenchmarkPrompt(
+        name="Simple function",
+        category="coding",
+        prompt="Write a Python function that checks if a number is prime.",
+        expected_tokens=100,
+    ),
+    BenchmarkPrompt(
+        name="Code review",
+        category="coding",
+        prompt="""Review this code and suggest improvements:
 
 def process_data(data):
     result = []
@@ -36,21 +114,21 @@ def process_data(data):
         if data[i] > 0:
             result.append(data[i] * 2)
     return result""",
-        "expected_tokens": 200,
-    },
-    {
-        "name": "Algorithm explanation",
-        "category": "coding",
-        "prompt": (
+        expected_tokens=200,
+    ),
+    BenchmarkPrompt(
+        name="Algorithm explanation",
+        category="coding",
+        prompt=(
             "Explain how the quicksort algorithm works and provide "
             "a Python implementation with comments."
         ),
-        "expected_tokens": 400,
-    },
-    {
-        "name": "Complex refactoring",
-        "category": "coding",
-        "prompt": """\
+        expected_tokens=400,
+    ),
+    BenchmarkPrompt(
+        name="Complex refactoring",
+        category="coding",
+        prompt="""\
 Refactor this legacy code to use modern Python patterns, type hints, and error handling:
 
 class DataProcessor:
@@ -68,13 +146,13 @@ class DataProcessor:
             except:
                 pass
         return results""",
-        "expected_tokens": 500,
-    },
+        expected_tokens=500,
+    ),
     # Context-heavy tasks (4 prompts)
-    {
-        "name": "Multi-file code analysis",
-        "category": "context_heavy",
-        "prompt": """Analyze this multi-file Python project and identify potential issues:
+    BenchmarkPrompt(
+        name="Multi-file code analysis",
+        category="context_heavy",
+        prompt="""Analyze this multi-file Python project and identify potential issues:
 
 # File: models.py
 class User:
@@ -98,12 +176,12 @@ def save_user(user):
     users.append(user)
 
 What architectural problems do you see? How would you refactor this to be more maintainable?""",
-        "expected_tokens": 800,
-    },
-    {
-        "name": "Refactor with context",
-        "category": "context_heavy",
-        "prompt": """Given this large codebase context, refactor the payment processing module:
+        expected_tokens=800,
+    ),
+    BenchmarkPrompt(
+        name="Refactor with context",
+        category="context_heavy",
+        prompt="""Given this large codebase context, refactor the payment processing module:
 
 Current implementation has:
 - 5 different payment providers (Stripe, PayPal, Square, Venmo, Bitcoin)
@@ -121,12 +199,12 @@ Propose a clean architecture that:
 5. Makes testing easier
 
 Provide the refactored code with detailed comments.""",
-        "expected_tokens": 1000,
-    },
-    {
-        "name": "Debug trace analysis",
-        "category": "context_heavy",
-        "prompt": """Analyze this stack trace and explain the root cause:
+        expected_tokens=1000,
+    ),
+    BenchmarkPrompt(
+        name="Debug trace analysis",
+        category="context_heavy",
+        prompt="""Analyze this stack trace and explain the root cause:
 
 Traceback (most recent call last):
   File "app.py", line 145, in process_request
@@ -144,12 +222,12 @@ Traceback (most recent call last):
 json.decoder.JSONDecodeError: Expecting value: line 1 column 1 (char 0)
 
 What's the likely root cause? How would you fix it?""",
-        "expected_tokens": 600,
-    },
-    {
-        "name": "Architecture explanation",
-        "category": "context_heavy",
-        "prompt": """\
+        expected_tokens=600,
+    ),
+    BenchmarkPrompt(
+        name="Architecture explanation",
+        category="context_heavy",
+        prompt="""\
 Explain the architecture of a production-ready microservices system for e-commerce:
 
 Requirements:
@@ -169,13 +247,13 @@ Describe:
 4. Scalability considerations
 5. Reliability and fault tolerance
 6. Monitoring and observability""",
-        "expected_tokens": 800,
-    },
+        expected_tokens=800,
+    ),
     # Reasoning tasks (4 prompts)
-    {
-        "name": "Problem decomposition",
-        "category": "reasoning",
-        "prompt": """Break down this complex problem into smaller, manageable sub-problems:
+    BenchmarkPrompt(
+        name="Problem decomposition",
+        category="reasoning",
+        prompt="""Break down this complex problem into smaller, manageable sub-problems:
 
 Problem: Build a real-time collaborative code editor (like Google Docs but for code)
 
@@ -189,12 +267,12 @@ Consider:
 - Offline support with sync when reconnected
 
 What are the key technical challenges and how would you approach each one?""",
-        "expected_tokens": 300,
-    },
-    {
-        "name": "Design trade-offs analysis",
-        "category": "reasoning",
-        "prompt": """\
+        expected_tokens=300,
+    ),
+    BenchmarkPrompt(
+        name="Design trade-offs analysis",
+        category="reasoning",
+        prompt="""\
 Analyze the trade-offs between these database architectures for social media:
 
 Option A: Single PostgreSQL database with read replicas
@@ -211,12 +289,12 @@ Compare them on:
 - Development speed
 
 Which would you choose and why?""",
-        "expected_tokens": 400,
-    },
-    {
-        "name": "Algorithmic optimization reasoning",
-        "category": "reasoning",
-        "prompt": """You need to find the k-th largest element in an unsorted array of n integers.
+        expected_tokens=400,
+    ),
+    BenchmarkPrompt(
+        name="Algorithmic optimization reasoning",
+        category="reasoning",
+        prompt="""You need to find the k-th largest element in an unsorted array of n integers.
 
 Analyze these approaches:
 1. Sort the array: O(n log n) time, O(1) space
@@ -231,12 +309,12 @@ For each approach, explain:
 - What if k is very small (k=1) or very large (k=n/2)?
 
 Recommend the best approach for a production system.""",
-        "expected_tokens": 500,
-    },
-    {
-        "name": "System design",
-        "category": "reasoning",
-        "prompt": """\
+        expected_tokens=500,
+    ),
+    BenchmarkPrompt(
+        name="System design",
+        category="reasoning",
+        prompt="""\
 Design a URL shortener (like bit.ly) handling 1B URLs and 10B redirects per day.
 
 Consider:
@@ -250,13 +328,25 @@ Consider:
 8. How do you track analytics (click counts, geo location)?
 
 Provide a high-level architecture with justifications for your choices.""",
-        "expected_tokens": 600,
-    },
-]
+        expected_tokens=600,
+    ),
+)
+
+
+def _prompt_cache_file(payload: Dict[str, Any]) -> Path:
+    key = "\0".join(str(payload[name]) for name in ("model", "prompt", "max_tokens", "temperature"))
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return PROMPT_CACHE_DIR / f"{digest}.json"
 
 
 def run_single_prompt(
-    api_base: str, prompt: str, model: str, timeout: int = 120
+    api_base: str,
+    prompt: str,
+    model: str,
+    timeout: int = 120,
+    max_tokens: int = 1000,
+    reuse_cache: bool = False,
+    completion_preview: bool = True,
 ) -> Optional[Dict[str, Any]]:
     """Run a single prompt against the vLLM API.
 
@@ -265,6 +355,10 @@ def run_single_prompt(
         prompt: Prompt to send
         model: Model name
         timeout: Request timeout in seconds
+        max_tokens: Maximum number of tokens to generate
+        reuse_cache: Return a stored response for an identical earlier request
+            (marked with from_cache) instead of calling the API, and store new ones
+        completion_preview: Include the first 200 characters of the completion
 
     Returns:
         Dictionary with response data or None if failed
@@ -274,38 +368,67 @@ def run_single_prompt(
     payload = {
         "model": model,
         "prompt": prompt,
-        "max_tokens": 1000,
+        "max_tokens": max_tokens,
         "temperature": 0.7,
         "stream": False,
     }
 
+    cache_file = None
+    if reuse_cache:
+        cache_file = _prompt_cache_file(payload)
+        try:
+            return {**json_loads(cache_file.read_bytes()), "from_cache": True}
+        except (OSError, ValueError):
+            pass
+
     try:
-        start_time = time.time()
-        response = requests.post(url, json=payload, timeout=timeout)
+        start_time = time.perf_counter()
+        response = _SESSION.post(
+            url,
+            data=json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
         response.raise_for_status()
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
-        data = response.json()
+        data = json_loads(response.content)
 
         # Extract metrics
-        completion = data.get("choices", [{}])[0].get("text", "")
-        tokens_generated = len(completion.split())  # Rough estimate
-        usage = data.get("usage", {})
+        try:
+            completion = data["choices"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            console.print("[yellow]⚠ Malformed response: no completion text[/yellow]")
+            return None
+        usage = data.get("usage") or {}
         prompt_tokens = usage.get("prompt_tokens", 0)
-        completion_tokens = usage.get("completion_tokens", tokens_generated)
+        completion_tokens = usage.get("completion_tokens")
+        if completion_tokens is None:
+            # Rough estimate (~4 characters per token) when the server omits usage
+            completion_tokens = len(completion) // 4
         total_tokens = prompt_tokens + completion_tokens
 
         tokens_per_sec = completion_tokens / elapsed_time if elapsed_time > 0 else 0
 
-        return {
+        result = {
             "success": True,
             "elapsed_time": elapsed_time,
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
             "tokens_per_sec": tokens_per_sec,
-            "completion": completion[:200],  # First 200 chars
         }
+        if completion_preview:
+            result["completion"] = completion[:200]  # First 200 chars
+
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(json_dumps(result))
+            except OSError:
+                pass  # The cache is best-effort
+
+        return result
 
     except requests.exceptions.Timeout:
         console.print(f"[yellow]⚠ Request timeout after {timeout}s[/yellow]")
@@ -357,7 +480,7 @@ def calculate_cost_per_1k_tokens(tokens_per_sec: float, hourly_cost: float) -> f
 @click.option(
     "--category",
     "-c",
-    type=click.Choice(["all", "coding", "context_heavy", "reasoning"], case_sensitive=False),
+    type=click.Choice(["all", *sorted(_CATEGORIES)], case_sensitive=False),
     default="all",
     help="Test category to run (default: all)",
 )
@@ -366,7 +489,39 @@ def calculate_cost_per_1k_tokens(tokens_per_sec: float, hourly_cost: float) -> f
     default=True,
     help="Save results to centralized benchmark database (default: True)",
 )
-def cmd(session: Optional[str], output: str, category: str, save_to_db: bool):
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1, max=MAX_CONCURRENCY),
+    default=1,
+    help=f"Number of prompts to run concurrently, up to {MAX_CONCURRENCY} (default: 1)",
+)
+@click.option(
+    "--warmup/--no-warmup",
+    default=True,
+    help="Prime the prefix cache with each category's preamble before timing (default: True)",
+)
+@click.option(
+    "--reuse-cache/--no-cache",
+    default=False,
+    help="Answer repeated prompts from a local response cache; "
+    "such runs are not saved to the database (default: False)",
+)
+@click.option(
+    "--completion-preview/--no-completion-preview",
+    default=True,
+    help="Store the first 200 characters of each completion in the results (default: True)",
+)
+def cmd(
+    session: Optional[str],
+    output: str,
+    category: str,
+    save_to_db: bool,
+    concurrency: int,
+    warmup: bool,
+    reuse_cache: bool,
+    completion_preview: bool,
+):
     """Run performance benchmark on current or specified VM.
 
     Tests the VM with prompts of varying complexity across three categories:
@@ -379,50 +534,72 @@ def cmd(session: Optional[str], output: str, category: str, save_to_db: bool):
     - Total generation time
     - Cost per 1K tokens
 
+    With --concurrency > 1, prompts are sent in parallel so vLLM can batch them;
+    the aggregate throughput then reflects multi-request serving capacity.
+
+    Prompts in a category share a fixed preamble that vLLM's prefix cache can reuse.
+    Throughput is reported separately for prompts sent with the preamble already
+    cached (cache-primed) and without it (cold); --no-warmup skips the untimed
+    priming request so the first prompt of each category runs cold.
+
+    --reuse-cache answers repeated prompts from a local response cache. It speeds up
+    iterative runs but does not measure the server, so such runs skip the database.
+
     Results are saved to a JSON file and optionally to the centralized database.
     """
-    session_mgr = SessionManager()
+    session_mgr = click.get_current_context().ensure_object(SessionManager)
     current_session = _get_session(session_mgr, session)
     _print_session_header(current_session)
 
     env_file = session_mgr.cache_dir / current_session.name / "aider-env"
     api_base, model_name = _load_api_settings(env_file)
+    _preflight(api_base, model_name)
     selected_tests = _select_tests(category)
 
     console.print(f"[bold]Running benchmark tests ({category})...[/bold]\n")
-    results = _run_benchmark_tests(api_base, model_name, selected_tests)
-    successful_results = [r for r in results if r.get("success", False)]
+    # One UTC wall-clock time for the whole run, shared by the JSON file and database record
+    run_started_at = datetime.now(timezone.utc)
+    output_path = Path(output)
+    header = _build_output_header(current_session, category, run_started_at, concurrency)
+    with _ResultsWriter(output_path, header) as writer:
+        results = _run_benchmark_tests(
+            api_base,
+            model_name,
+            selected_tests,
+            concurrency,
+            warmup,
+            writer.write_test,
+            reuse_cache,
+            completion_preview,
+        )
+        successful_results = [r for r in results if r.get("success", False)]
 
-    if not successful_results:
-        console.print("[red]✗ All tests failed[/red]")
-        raise click.Abort()
+        if not successful_results:
+            console.print("[red]✗ All tests failed[/red]")
+            raise click.Abort()
 
-    summary, results_by_category = _aggregate_results(
-        successful_results,
-        selected_tests,
-        current_session.hourly_cost,
-    )
-    _print_summary(
-        summary,
-        current_session.hourly_cost,
-        len(successful_results),
-        len(selected_tests),
-        results_by_category,
-        category,
-    )
+        summary, results_by_category = _aggregate_results(
+            successful_results,
+            selected_tests,
+            current_session.hourly_cost,
+            concurrency,
+        )
+        _print_summary(
+            summary,
+            current_session.hourly_cost,
+            len(successful_results),
+            len(selected_tests),
+            results_by_category,
+            category,
+        )
 
-    output_data = _build_output_data(
-        current_session,
-        category,
-        results_by_category,
-        summary,
-        results,
-    )
-    output_path = _write_results(output, output_data)
+        writer.finish({"results_by_category": results_by_category, "summary": summary})
     console.print(f"\n[green]✓ Results saved to: {output_path}[/green]")
 
-    if save_to_db:
-        _save_results_to_db(current_session, results_by_category, output_data, results)
+    if save_to_db and any(r.get("from_cache") for r in successful_results):
+        console.print("[yellow]⚠ Results include cached responses; not saved to database[/yellow]")
+    elif save_to_db:
+        _save_results_to_db(current_session, results_by_category, summary, results, run_started_at)
 
 
 def _get_session(session_mgr: SessionManager, session_name: Optional[str]):
@@ -449,17 +626,13 @@ def _print_session_header(current_session):
 
 
 def _load_api_settings(env_file: Path) -> tuple[str, str]:
-    if not env_file.exists():
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except FileNotFoundError:
         console.print(f"[red]✗ Environment file not found: {env_file}[/red]")
         raise click.Abort()
 
-    api_base = None
-    model_name = None
-    for line in env_file.read_text().splitlines():
-        if line.startswith("export OPENAI_API_BASE="):
-            api_base = line.split("=", 1)[1].strip('"').strip("'")
-        elif line.startswith("export AIDER_MODEL="):
-            model_name = line.split("=", 1)[1].strip('"').strip("'").replace("openai/", "")
+    api_base, model_name = _parse_api_settings(str(env_file), mtime_ns)
 
     if not api_base or not model_name:
         console.print("[red]✗ Could not determine API settings[/red]")
@@ -468,11 +641,60 @@ def _load_api_settings(env_file: Path) -> tuple[str, str]:
     return api_base, model_name
 
 
-def _select_tests(category: str):
-    if category.lower() == "all":
+@lru_cache(maxsize=16)
+def _parse_api_settings(path: str, mtime_ns: int) -> tuple[Optional[str], Optional[str]]:
+    """Parse API base and model name from an aider-env file.
+
+    Cached per path and modification time, so the file is only re-read after it changes.
+    """
+    settings = dict(_API_SETTINGS_RE.findall(Path(path).read_text()))
+    model_name = settings.get("AIDER_MODEL")
+    if model_name:
+        model_name = model_name.replace("openai/", "")
+    return settings.get("OPENAI_API_BASE"), model_name
+
+
+def _preflight(api_base: str, model_name: str) -> None:
+    """Abort early unless the API answers quickly and serves the expected model.
+
+    Without this, a dead endpoint costs the full request timeout for every prompt.
+    """
+    try:
+        response = _SESSION.get(f"{api_base}/models", timeout=5)
+        response.raise_for_status()
+        served = _served_model_ids(json_loads(response.content))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        console.print(f"[red]✗ API not reachable at {api_base}: {e}[/red]")
+        raise click.Abort()
+
+    if served and model_name not in served:
+        console.print(f"[red]✗ Model '{model_name}' is not served by {api_base}[/red]")
+        console.print(f"  Available: {', '.join(served)}")
+        raise click.Abort()
+
+
+def _served_model_ids(body: Any) -> List[str]:
+    """Extract model IDs from a /models response body.
+
+    Raises:
+        ValueError: If the body is not an OpenAI-style model list
+    """
+    if not isinstance(body, dict) or not isinstance(body.get("data", []), list):
+        raise ValueError("unexpected /models response")
+    return [
+        model["id"]
+        for model in body.get("data", [])
+        if isinstance(model, dict) and isinstance(model.get("id"), str)
+    ]
+
+
+def _select_tests(category: str) -> Sequence[BenchmarkPrompt]:
+    # Interned so comparisons against the (interned) literal categories hit the identity fast path
+    category = sys.intern(category.lower())
+    if category == "all":
         selected_tests = TEST_PROMPTS
     else:
-        selected_tests = [t for t in TEST_PROMPTS if t["category"] == category.lower()]
+        selected_tests = [t for t in TEST_PROMPTS if t.category == category]
 
     if not selected_tests:
         console.print(f"[red]✗ No tests found for category: {category}[/red]")
@@ -481,91 +703,209 @@ def _select_tests(category: str):
     return selected_tests
 
 
+def _warm_prefix_cache(api_base: str, model_name: str, categories: Iterable[str]) -> Set[str]:
+    """Send each category's preamble once, untimed, to populate vLLM's prefix cache.
+
+    Returns:
+        Categories whose warmup request succeeded
+    """
+    primed = set()
+    for cat in categories:
+        console.print(f"[dim]Priming prefix cache for {cat}...[/dim]")
+        if run_single_prompt(api_base, CATEGORY_PREAMBLES[cat], model_name, 10, max_tokens=1):
+            primed.add(cat)
+    if primed:
+        console.print()
+    return primed
+
+
 def _run_benchmark_tests(
-    api_base: str, model_name: str, selected_tests: List[Dict[str, Any]]
+    api_base: str,
+    model_name: str,
+    selected_tests: Sequence[BenchmarkPrompt],
+    concurrency: int = 1,
+    warmup: bool = True,
+    result_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
+    reuse_cache: bool = False,
+    completion_preview: bool = True,
 ) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
-
-    for i, test in enumerate(selected_tests, 1):
-        console.print(
-            f"[cyan]Test {i}/{len(selected_tests)}: {test['name']} ({test['category']})[/cyan]"
+    categories = list(dict.fromkeys(test.category for test in selected_tests))
+    primed_categories = _warm_prefix_cache(api_base, model_name, categories) if warmup else set()
+
+    # A prompt finds its preamble cached if the warmup succeeded, or when running
+    # sequentially and an earlier prompt of the same category has already been sent
+    cache_primed: List[bool] = []
+    seen_categories = set()
+    for test in selected_tests:
+        cat = test.category
+        cache_primed.append(
+            cat in primed_categories or (concurrency == 1 and cat in seen_categories)
         )
-
-        result = run_single_prompt(api_base, test["prompt"], model_name)
+        seen_categories.add(cat)
+
+    results: List[Dict[str, Any]] = [{} for _ in selected_tests]
+    run_start = time.perf_counter()
+
+    def run_test(index: int, test: BenchmarkPrompt) -> Dict[str, Any]:
+        started_at = time.perf_counter() - run_start
+        prompt = CATEGORY_PREAMBLES[test.category] + test.prompt
+        result = run_single_prompt(
+            api_base,
+            prompt,
+            model_name,
+            reuse_cache=reuse_cache,
+            completion_preview=completion_preview,
+        )
+        finished_at = time.perf_counter() - run_start
 
         if result:
-            console.print(
-                f"  ✓ {result['completion_tokens']} tokens in {result['elapsed_time']:.2f}s"
-            )
-            console.print(f"  ➜ {result['tokens_per_sec']:.2f} tokens/sec\n")
-            results.append(
-                {
-                    "test_name": test["name"],
-                    "category": test["category"],
-                    "prompt": test["prompt"],
-                    "expected_tokens": test["expected_tokens"],
-                    **result,
-                }
-            )
+            cached = " (cached)" if result.get("from_cache") else ""
+            description = f"{test.name}: {result['tokens_per_sec']:.1f} tok/s{cached}"
+            record = {
+                "test_name": test.name,
+                "category": test.category,
+                "prompt": test.prompt,
+                "expected_tokens": test.expected_tokens,
+                "success": True,
+                "elapsed_time": result["elapsed_time"],
+                "prompt_tokens": result["prompt_tokens"],
+                "completion_tokens": result["completion_tokens"],
+                "total_tokens": result["total_tokens"],
+                "tokens_per_sec": result["tokens_per_sec"],
+                "from_cache": result.get("from_cache", False),
+                # Offsets in seconds from the start of the run, for aggregate throughput
+                "started_at": started_at,
+                "finished_at": finished_at,
+                "cache_primed": cache_primed[index],
+            }
+            if completion_preview:
+                # Responses cached by a --no-completion-preview run have no preview
+                record["completion"] = result.get("completion", "")
         else:
-            console.print("  ✗ Test failed\n")
-            results.append(
-                {
-                    "test_name": test["name"],
-                    "category": test["category"],
-                    "prompt": test["prompt"],
-                    "success": False,
-                }
-            )
+            description = f"[red]✗ {test.name} failed[/red]"
+            record = {
+                "test_name": test.name,
+                "category": test.category,
+                "prompt": test.prompt,
+                "success": False,
+            }
+
+        results[index] = record
+        progress.update(task, advance=1, description=description)
+        return record
+
+    # Progress renders thread-safely, so workers update it without a lock
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[cyan]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        disable=console.quiet,
+    ) as progress:
+        task = progress.add_task("Benchmarking...", total=len(selected_tests))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(run_test, i, test) for i, test in enumerate(selected_tests)]
+            for future in as_completed(futures):
+                record = future.result()
+                if result_sink is not None:
+                    result_sink(record)
+        progress.update(task, description="Benchmark complete")
 
     return results
 
 
 def _aggregate_results(
     successful_results: List[Dict[str, Any]],
-    selected_tests: List[Dict[str, Any]],
+    selected_tests: Sequence[BenchmarkPrompt],
     hourly_cost: float,
+    concurrency: int = 1,
 ) -> tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
-    avg_tokens_per_sec = sum(r["tokens_per_sec"] for r in successful_results) / len(
-        successful_results
-    )
-    total_time = sum(r["elapsed_time"] for r in successful_results)
-    total_tokens = sum(r["completion_tokens"] for r in successful_results)
-    cost_per_1k = calculate_cost_per_1k_tokens(avg_tokens_per_sec, hourly_cost)
+    # Running [tokens_per_sec sum, elapsed_time sum, completion_tokens sum, count],
+    # filled in a single pass over the results
+    overall = [0.0, 0.0, 0, 0]
+    by_category: Dict[str, List[Any]] = defaultdict(lambda: [0.0, 0.0, 0, 0])
+    by_priming = {True: [0.0, 0.0, 0, 0], False: [0.0, 0.0, 0, 0]}
+    first_start = float("inf")
+    last_finish = float("-inf")
+    tps_values: List[float] = []
+
+    for r in successful_results:
+        tokens_per_sec = r["tokens_per_sec"]
+        tps_values.append(tokens_per_sec)
+        elapsed_time = r["elapsed_time"]
+        completion_tokens = r["completion_tokens"]
+        for acc in (
+            overall,
+            by_category[r["category"]],
+            by_priming[bool(r.get("cache_primed"))],
+        ):
+            acc[0] += tokens_per_sec
+            acc[1] += elapsed_time
+            acc[2] += completion_tokens
+            acc[3] += 1
+        first_start = min(first_start, r["started_at"])
+        last_finish = max(last_finish, r["finished_at"])
+
+    tps_sum, total_time, total_tokens, count = overall
+    avg_tokens_per_sec = tps_sum / count
+    if count > 1:
+        p95_tokens_per_sec = statistics.quantiles(tps_values, n=20, method="inclusive")[18]
+        stddev_tokens_per_sec = statistics.stdev(tps_values, avg_tokens_per_sec)
+    else:
+        p95_tokens_per_sec = tps_values[0]
+        stddev_tokens_per_sec = 0.0
+
+    # Wall-clock span of the run; shorter than total_time when prompts ran concurrently
+    wall_time = last_finish - first_start
+    aggregate_tokens_per_sec = total_tokens / wall_time if wall_time > 0 else 0
 
-    results_by_category = _build_results_by_category(successful_results, hourly_cost)
+    # The VM is billed for wall-clock time, so overlapping prompts share the hourly
+    # cost: price concurrent runs on aggregate throughput, not per-request throughput
+    if concurrency > 1:
+        billed_tokens_per_sec = aggregate_tokens_per_sec
+    else:
+        billed_tokens_per_sec = avg_tokens_per_sec
+    cost_per_1k = calculate_cost_per_1k_tokens(billed_tokens_per_sec, hourly_cost)
+
+    results_by_category: Dict[str, Dict[str, Any]] = {}
+    for cat, (cat_tps_sum, cat_time, cat_tokens, cat_count) in by_category.items():
+        cat_avg_tps = cat_tps_sum / cat_count
+        # Categories overlap under concurrency, so scale the billed rate by the
+        # category's per-request speed relative to the run's
+        cat_billed_tps = (
+            billed_tokens_per_sec * cat_avg_tps / avg_tokens_per_sec if avg_tokens_per_sec else 0
+        )
+        results_by_category[cat] = {
+            "avg_tokens_per_sec": cat_avg_tps,
+            "total_time": cat_time,
+            "total_tokens": cat_tokens,
+            "cost_per_1k_tokens": calculate_cost_per_1k_tokens(cat_billed_tps, hourly_cost),
+            "tests_passed": cat_count,
+        }
 
+    primed, cold = by_priming[True], by_priming[False]
     summary = {
         "avg_tokens_per_sec": avg_tokens_per_sec,
+        "p50_tokens_per_sec": statistics.median(tps_values),
+        "p95_tokens_per_sec": p95_tokens_per_sec,
+        "stddev_tokens_per_sec": stddev_tokens_per_sec,
         "total_time": total_time,
         "total_tokens": total_tokens,
+        "wall_time": wall_time,
+        "aggregate_tokens_per_sec": aggregate_tokens_per_sec,
+        "cache_primed_tokens_per_sec": primed[0] / primed[3] if primed[3] else None,
+        "cold_tokens_per_sec": cold[0] / cold[3] if cold[3] else None,
         "cost_per_1k_tokens": cost_per_1k,
-        "tests_passed": len(successful_results),
+        "concurrency": concurrency,
+        "tests_passed": count,
         "tests_total": len(selected_tests),
     }
 
     return summary, results_by_category
 
 
-def _build_results_by_category(
-    successful_results: List[Dict[str, Any]], hourly_cost: float
-) -> Dict[str, Dict[str, Any]]:
-    results_by_category: Dict[str, Dict[str, Any]] = {}
-    for cat in ["coding", "context_heavy", "reasoning"]:
-        cat_results = [r for r in successful_results if r.get("category") == cat]
-        if not cat_results:
-            continue
-        cat_avg_tps = sum(r["tokens_per_sec"] for r in cat_results) / len(cat_results)
-        results_by_category[cat] = {
-            "avg_tokens_per_sec": cat_avg_tps,
-            "total_time": sum(r["elapsed_time"] for r in cat_results),
-            "total_tokens": sum(r["completion_tokens"] for r in cat_results),
-            "cost_per_1k_tokens": calculate_cost_per_1k_tokens(cat_avg_tps, hourly_cost),
-            "tests_passed": len(cat_results),
-        }
-    return results_by_category
-
-
 def _print_summary(
     summary: Dict[str, Any],
     hourly_cost: float,
@@ -581,9 +921,24 @@ def _print_summary(
     table.add_column("Value", style="green")
 
     table.add_row("Average throughput", f"{summary['avg_tokens_per_sec']:.2f} tokens/sec")
+    table.add_row(
+        "Throughput p50 / p95",
+        f"{summary['p50_tokens_per_sec']:.2f} / {summary['p95_tokens_per_sec']:.2f} tokens/sec",
+    )
+    table.add_row("Throughput std dev", f"{summary['stddev_tokens_per_sec']:.2f} tokens/sec")
+    table.add_row("Aggregate throughput", f"{summary['aggregate_tokens_per_sec']:.2f} tokens/sec")
+    for label, key in (
+        ("Cache-primed throughput", "cache_primed_tokens_per_sec"),
+        ("Cold throughput", "cold_tokens_per_sec"),
+    ):
+        if summary[key] is not None:
+            table.add_row(label, f"{summary[key]:.2f} tokens/sec")
     table.add_row("Total generation time", f"{summary['total_time']:.2f} seconds")
+    table.add_row("Wall-clock time", f"{summary['wall_time']:.2f} seconds")
     table.add_row("Total tokens generated", f"{summary['total_tokens']}")
     table.add_row("Hourly cost", f"${hourly_cost:.2f}/hour")
+    if summary["concurrency"] > 1:
+        table.add_row("Concurrency", f"{summary['concurrency']} (cost from aggregate throughput)")
     table.add_row("Cost per 1K tokens", f"${summary['cost_per_1k_tokens']:.4f}")
     table.add_row("Tests passed", f"{successful_count}/{total_count}")
 
@@ -599,50 +954,94 @@ def _print_summary(
             )
 
 
-def _build_output_data(
-    current_session,
-    category: str,
-    results_by_category: Dict[str, Dict[str, Any]],
-    summary: Dict[str, Any],
-    results: List[Dict[str, Any]],
+def _build_output_header(
+    current_session, category: str, timestamp: datetime, concurrency: int = 1
 ) -> Dict[str, Any]:
     return {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp.isoformat(),
         "session": current_session.name,
         "model": current_session.model_id,
         "vm_type": current_session.type,
         "hourly_cost": current_session.hourly_cost,
         "category_filter": category,
-        "results_by_category": results_by_category,
-        "summary": summary,
-        "tests": results,
+        "concurrency": concurrency,
     }
 
 
-def _write_results(output: str, output_data: Dict[str, Any]) -> Path:
-    output_path = Path(output)
-    output_path.write_text(json.dumps(output_data, indent=2))
-    return output_path
+class _ResultsWriter:
+    """Writes the benchmark output JSON incrementally.
+
+    Header fields are written on open, each test record as soon as it completes, and the
+    aggregated fields by finish(), so only one record is serialized in memory at a time.
+    Records appear in completion order, one per line.
+
+    Output streams into a temporary file next to the destination, which replaces it only
+    when the run finishes; an aborted run leaves any previous results in place.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any]):
+        self._path = path
+        self._temp_path = path.with_name(path.name + ".tmp")
+        self._file = self._temp_path.open("wb")
+        self._file.write(b"{")
+        self._field_separator = b"\n  "
+        for key, value in header.items():
+            self._write_field(key, value)
+        self._file.write(self._field_separator + b'"tests": [')
+        self._field_separator = b",\n  "
+        self._record_separator = b"\n    "
+        self._tests_open = True
+        self._finished = False
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None and self._finished:
+            self._file.write(b"\n}\n")
+            self._file.close()
+            os.replace(self._temp_path, self._path)
+        else:
+            self._file.close()
+            self._temp_path.unlink(missing_ok=True)
+
+    def _write_field(self, key: str, value: Any) -> None:
+        self._file.write(self._field_separator + json_dumps(key) + b": " + json_dumps(value))
+        self._field_separator = b",\n  "
+
+    def _close_tests(self) -> None:
+        if self._tests_open:
+            self._file.write(b"\n  ]")
+            self._tests_open = False
+
+    def write_test(self, record: Dict[str, Any]) -> None:
+        """Append a completed test record to the tests array."""
+        self._file.write(self._record_separator + json_dumps(record))
+        self._record_separator = b",\n    "
+
+    def finish(self, trailer: Dict[str, Any]) -> None:
+        """Close the tests array and write the remaining top-level fields."""
+        self._close_tests()
+        for key, value in trailer.items():
+            self._write_field(key, value)
+        self._finished = True
 
 
 def _save_results_to_db(
     current_session,
     results_by_category: Dict[str, Dict[str, Any]],
-    output_data: Dict[str, Any],
+    summary: Dict[str, Any],
     results: List[Dict[str, Any]],
+    timestamp: datetime,
 ) -> None:
     try:
-        db = BenchmarkDatabase()
+        db = default_database()
 
         gpu_info = GPU_TYPES.get(current_session.type, {})
         gpu_count = gpu_info.get("gpus", 1)
         vram_per_gpu = gpu_info.get("vram_per_gpu", 0)
 
-        vllm_config = {
-            "tensor_parallel_size": gpu_count,
-            "max_model_len": 32768,
-            "gpu_memory_utilization": 0.90,
-        }
+        vllm_config = {**_DEFAULT_VLLM_CONFIG, "tensor_parallel_size": gpu_count}
 
         benchmark_result = db.create_result(
             gpu_type=current_session.type,
@@ -653,8 +1052,9 @@ def _save_results_to_db(
             model_category=get_model_category(current_session.model_id),
             vllm_config=vllm_config,
             results_by_category=results_by_category,
-            summary=output_data["summary"],
+            summary=summary,
             tests=results,
+            timestamp=timestamp,
         )
 
         result_id = db.add_result(benchmark_result)
@@ -14,7 +14,7 @@ from . import benchmark
 @click.option(
     "--category",
     "-c",
-    type=click.Choice(["all", "coding", "context_heavy", "reasoning"], case_sensitive=False),
+    type=click.Choice(["all", *sorted(benchmark._CATEGORIES)], case_sensitive=False),
     default="all",
     help="Test category to run (default: all)",
 )
@@ -37,7 +37,9 @@ def cmd(session_name: str, category: str):
         maider benchmark-collect my-session         # Benchmark specific session
         maider benchmark-collect --category coding  # Only run coding tests
     """
-    session_mgr = SessionManager()
+    # Stored on the context so the invoked benchmark command reuses it
+    ctx = click.get_current_context()
+    session_mgr = ctx.ensure_object(SessionManager)
 
     # Get session
     if session_name:
@@ -57,17 +59,15 @@ def cmd(session_name: str, category: str):
     console.print(f"  Model: {session.model_id}")
     console.print(f"  Category: {category}\n")
 
-    # Call the benchmark command with database saving enabled
-    ctx = click.Context(benchmark.cmd)
-    ctx.params = {
-        "session": session.name,
-        "output": f".benchmark-{session.name}.json",
-        "category": category,
-        "save_to_db": True,  # Always save to database
-    }
-
     try:
-        ctx.invoke(benchmark.cmd, **ctx.params)
+        # Call the benchmark command with database saving enabled
+        ctx.invoke(
+            benchmark.cmd,
+            session=session.name,
+            output=f".benchmark-{session.name}.json",
+            category=category,
+            save_to_db=True,  # Always save to database
+        )
         console.print("\n[green]✓ Benchmark data collected successfully![/green]")
         console.print("[dim]View all benchmarks with: maider benchmark-compare[/dim]")
         console.print("[dim]Get recommendations with: maider recommend[/dim]")
@@ -1,16 +1,19 @@
 """Benchmark comparison command for analyzing results."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import click
 from rich.table import Table
 
-from ..benchmark_db import BenchmarkDatabase
+from ..benchmark_db import BenchmarkDatabase, default_database
 from ..output import console
 
 METRIC_SORTS = {"tokens_per_sec", "cost_per_1k_tokens", "cost_efficiency"}
 
+# Tokens/Sec, Cost/1K, $/Hour, Efficiency and Tests cells, formatted in one call
+_METRIC_CELLS_FMT = "{:.1f}\t${:.4f}\t${:.2f}\t{:.1f}\t{}/{}".format
+
 
 @click.command(name="benchmark-compare")
 @click.option(
@@ -74,9 +77,16 @@ def cmd(
         maider benchmark-compare --sort-by cost_per_1k_tokens # Sort by cost
         maider benchmark-compare --format csv -o results.csv  # Export to CSV
     """
-    db = BenchmarkDatabase()
+    if format != "table" and not output:
+        # Fail before touching the database rather than after loading every result
+        console.print(f"[red]✗ --output required for {format.upper()} format[/red]")
+        raise click.Abort()
+
+    db = default_database()
 
-    results = _load_results(db, gpu_type, model_category, task_category, sort_by)
+    # The table shows the top rows; exports write every matching result
+    limit = 100 if format == "table" else None
+    results = _load_results(db, gpu_type, model_category, task_category, sort_by, limit)
 
     if not results:
         _print_no_results()
@@ -91,30 +101,46 @@ def _load_results(
     model_category: Optional[str],
     task_category: Optional[str],
     sort_by: str,
+    limit: Optional[int] = 100,
 ):
     if sort_by in METRIC_SORTS:
         ascending = sort_by == "cost_per_1k_tokens"
         return db.get_best_by_metric(
             metric=sort_by,
             task_category=task_category,
-            limit=100,
+            limit=limit,
             ascending=ascending,
+            gpu_type=gpu_type,
+            model_category=model_category,
         )
 
-    results = db.get_results(
+    return db.get_results(
         gpu_type=gpu_type,
         model_category=model_category,
         task_category=task_category,
     )
-    return _filter_results(results, gpu_type, model_category)
 
 
-def _filter_results(results, gpu_type: Optional[str], model_category: Optional[str]):
-    if gpu_type:
-        results = [r for r in results if r.gpu_type == gpu_type]
-    if model_category:
-        results = [r for r in results if r.model_category == model_category]
-    return results
+def _compute_gpu_label(gpu_type: str) -> str:
+    gpu_label = gpu_type
+    if "rtx6000" in gpu_label.lower():
+        return gpu_label.replace("g1-gpu-rtx6000-", "RTX6000x")
+    if "rtx4000" in gpu_label.lower():
+        gpu_label = gpu_label.replace("g2-gpu-rtx4000a", "RTX4000x")
+        return gpu_label.replace("-s", "").replace("-m", "")
+    return gpu_label
+
+
+# Short labels by GPU type, computed once per type
+_GPU_LABELS: Dict[str, str] = {}
+
+
+def _format_gpu_label(gpu_type: str) -> str:
+    try:
+        return _GPU_LABELS[gpu_type]
+    except KeyError:
+        label = _GPU_LABELS[gpu_type] = _compute_gpu_label(gpu_type)
+        return label
 
 
 def _print_no_results():
@@ -136,12 +162,8 @@ def _render_output(
         _display_table(results, task_category, sort_by)
         return
 
-    if not output:
-        console.print(f"[red]✗ --output required for {format.upper()} format[/red]")
-        raise click.Abort()
-
-    db.export(format, Path(output))
-    console.print(f"[green]✓ Exported {len(results)} results to: {output}[/green]")
+    count = db.export(format, Path(output), results=results)
+    console.print(f"[green]✓ Exported {count} results to: {output}[/green]")
 
 
 def _display_table(results, task_category: Optional[str], sort_metric: str):
@@ -162,37 +184,28 @@ def _display_table(results, task_category: Optional[str], sort_metric: str):
     table.add_column("Efficiency", justify="right")
     table.add_column("Tests", justify="right")
 
+    add_row = table.add_row
     for result in results:
+        metrics = result.metrics
+
         # Truncate model name if too long
-        model_name = result.model_id.split("/")[-1]
+        model_name = result.model_id.rpartition("/")[2]
         if len(model_name) > 30:
             model_name = model_name[:27] + "..."
 
-        # Calculate cost efficiency
-        cost_efficiency = (
-            result.summary.get("avg_tokens_per_sec", 0) / result.hourly_cost
-            if result.hourly_cost > 0
-            else 0
-        )
-
-        # Get GPU label
-        gpu_label = result.gpu_type
-        if "rtx6000" in gpu_label.lower():
-            gpu_label = gpu_label.replace("g1-gpu-rtx6000-", "RTX6000x")
-        elif "rtx4000" in gpu_label.lower():
-            gpu_label = gpu_label.replace("g2-gpu-rtx4000a", "RTX4000x")
-            gpu_label = gpu_label.replace("-s", "").replace("-m", "")
-
-        table.add_row(
-            gpu_label,
+        add_row(
+            _format_gpu_label(result.gpu_type),
             str(result.gpu_count),
             f"{result.total_vram}GB",
             model_name,
-            f"{result.summary.get('avg_tokens_per_sec', 0):.1f}",
-            f"${result.summary.get('cost_per_1k_tokens', 0):.4f}",
-            f"${result.hourly_cost:.2f}",
-            f"{cost_efficiency:.1f}",
-            f"{result.summary.get('tests_passed', 0)}/{result.summary.get('tests_total', 0)}",
+            *_METRIC_CELLS_FMT(
+                metrics.avg_tokens_per_sec,
+                metrics.cost_per_1k_tokens,
+                result.hourly_cost,
+                result.cost_efficiency,
+                metrics.tests_passed,
+                metrics.tests_total,
+            ).split("\t"),
         )
 
     console.print(table)
@@ -1,11 +1,12 @@
 """Benchmark status and coverage command."""
 
-from datetime import datetime, timedelta
+import time
+from typing import Optional
 
 import click
 from rich.table import Table
 
-from ..benchmark_db import BenchmarkDatabase
+from ..benchmark_db import default_database
 from ..output import console
 from ..providers.linode import GPU_TYPES
 
@@ -20,7 +21,7 @@ def cmd():
     Example:
         maider benchmark-status
     """
-    db = BenchmarkDatabase()
+    db = default_database()
 
     # Get coverage report
     coverage = db.get_coverage_report()
@@ -56,10 +57,11 @@ def _print_tested_configurations(coverage):
     table.add_column("Last Run", style="dim")
     table.add_column("Status", justify="center")
 
+    now_ns = time.time_ns()
     for config in coverage["tested_configs"]:
         gpu_label = _format_gpu_label(config["gpu_type"])
         model_cat = config["model_category"].upper()
-        time_str, is_stale = _format_last_run(config["last_run"])
+        time_str, is_stale = _format_last_run(config["last_run_ns"], now_ns)
         status = _format_run_status(config["count"], is_stale)
 
         table.add_row(
@@ -73,27 +75,40 @@ def _print_tested_configurations(coverage):
     console.print(table)
 
 
-def _format_last_run(last_run_value):
-    try:
-        last_run = datetime.fromisoformat(last_run_value)
-        now = datetime.now()
-        delta = now - last_run
-
-        if delta < timedelta(hours=1):
-            time_str = f"{int(delta.total_seconds() / 60)} minutes ago"
-        elif delta < timedelta(days=1):
-            time_str = f"{int(delta.total_seconds() / 3600)} hours ago"
-        elif delta < timedelta(days=7):
-            time_str = f"{delta.days} days ago"
-        elif delta < timedelta(days=30):
-            time_str = f"{delta.days // 7} weeks ago"
-        else:
-            time_str = f"{delta.days // 30} months ago"
-
-        return time_str, delta > timedelta(days=30)
-    except (ValueError, TypeError):
+_DAY_S = 86400
+_STALE_AFTER_S = 30 * _DAY_S
+
+# (age limit in seconds, unit, seconds per unit), checked in order; the last always matches
+_LAST_RUN_BUCKETS = (
+    (3600, "minutes", 60),
+    (_DAY_S, "hours", 3600),
+    (7 * _DAY_S, "days", _DAY_S),
+    (30 * _DAY_S, "weeks", 7 * _DAY_S),
+    (None, "months", 30 * _DAY_S),
+)
+
+
+def _format_last_run(
+    last_run_ns: int, now_ns: Optional[int] = None, _time_ns=time.time_ns
+) -> tuple[str, bool]:
+    """Describe how long ago a run was, from the report's epoch nanoseconds.
+
+    Returns:
+        Tuple of ("N units ago", whether the run is over 30 days old)
+    """
+    if not last_run_ns:
+        # 0 means the stored timestamp could not be parsed
         return "Unknown", False
 
+    if now_ns is None:
+        now_ns = _time_ns()
+    delta_s = max(0, (now_ns - last_run_ns) // 1_000_000_000)
+
+    for limit, unit, unit_s in _LAST_RUN_BUCKETS:
+        if limit is None or delta_s < limit:
+            break
+    return f"{delta_s // unit_s} {unit} ago", delta_s > _STALE_AFTER_S
+
 
 def _format_run_status(num_runs: int, is_stale: bool) -> str:
     if num_runs >= 3:
@@ -109,7 +124,7 @@ def _format_run_status(num_runs: int, is_stale: bool) -> str:
     return status
 
 
-def _format_gpu_label(gpu_type: str) -> str:
+def _compute_gpu_label(gpu_type: str) -> str:
     gpu_label = gpu_type
     if "rtx6000" in gpu_label.lower():
         return gpu_label.replace("g1-gpu-rtx6000-", "RTX6000x")
@@ -119,24 +134,37 @@ def _format_gpu_label(gpu_type: str) -> str:
     return gpu_label
 
 
+# Short labels for known GPU types; unknown types are added on first use
+_GPU_LABELS = {gpu_type: _compute_gpu_label(gpu_type) for gpu_type in GPU_TYPES}
+
+
+def _format_gpu_label(gpu_type: str) -> str:
+    try:
+        return _GPU_LABELS[gpu_type]
+    except KeyError:
+        label = _GPU_LABELS[gpu_type] = _compute_gpu_label(gpu_type)
+        return label
+
+
 def _print_missing_gpu_types(coverage):
     console.print("\n[bold]Missing GPU Types:[/bold]\n")
 
     tested_gpu_types = {config["gpu_type"] for config in coverage["tested_configs"]}
-    all_gpu_types = set(GPU_TYPES.keys())
-    missing_types = all_gpu_types - tested_gpu_types
-
-    if not missing_types:
+    # (cost, type, info) tuples, so sorting needs no lookup per comparison
+    missing = [
+        (info.get("hourly_cost", 999), gpu_type, info)
+        for gpu_type, info in GPU_TYPES.items()
+        if gpu_type not in tested_gpu_types
+    ]
+
+    if not missing:
         console.print("[green]✓ All GPU types have been benchmarked![/green]\n")
         return
 
-    sorted_missing = sorted(
-        missing_types,
-        key=lambda t: GPU_TYPES.get(t, {}).get("hourly_cost", 999),
-    )
+    # GPU types are unique, so ties on cost never fall through to comparing the dicts
+    missing.sort()
 
-    for gpu_type in sorted_missing:
-        info = GPU_TYPES.get(gpu_type, {})
+    for _, gpu_type, info in missing:
         gpus = info.get("gpus", 1)
         vram = info.get("vram_per_gpu", 0)
         cost = info.get("hourly_cost", 0)
@@ -152,18 +180,20 @@ def _print_missing_gpu_types(coverage):
 
 
 def _format_missing_label(gpu_type: str, gpus: int) -> str:
-    if "rtx6000" in gpu_type.lower():
+    gpu_type_lower = gpu_type.lower()
+    if "rtx6000" in gpu_type_lower:
         return f"RTX 6000 Ada x{gpus}"
-    if "rtx4000" in gpu_type.lower():
+    if "rtx4000" in gpu_type_lower:
         return f"RTX 4000 Ada x{gpus}"
     return gpu_type
 
 
 def _print_confidence_levels(coverage):
     console.print("[bold]Confidence Levels:[/bold]\n")
-    high_confidence = sum(1 for c in coverage["tested_configs"] if c["count"] >= 3)
-    medium_confidence = sum(1 for c in coverage["tested_configs"] if c["count"] == 2)
-    low_confidence = sum(1 for c in coverage["tested_configs"] if c["count"] == 1)
+    confidence_counts = coverage["confidence_counts"]
+    high_confidence = confidence_counts["high"]
+    medium_confidence = confidence_counts["medium"]
+    low_confidence = confidence_counts["low"]
 
     console.print(f"  [green]High (3+ runs):[/green] {high_confidence} configs")
     console.print(f"  [yellow]Medium (2 runs):[/yellow] {medium_confidence} configs")
@@ -2,16 +2,21 @@
 
 import sys
 import time
-import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
 import click
-from rich.table import Table
 
-from ..gpu_utils import GPUMonitor
+from ..gpu_utils import GPUInfo, GPUMonitor
+from ..json_utils import json_loads
 from ..output import console
 from ..session import SessionManager
 from ..ssh_utils import SSHClient
 
+# Give up on a server that has not produced a first token within this many seconds
+_FIRST_TOKEN_TIMEOUT = 5.0
+
 
 @click.command(name="check")
 @click.argument("session_name", required=False)
@@ -28,9 +33,16 @@ def cmd(session_name: str):
     ssh = SSHClient(session.ip)
     gpu_monitor = GPUMonitor(ssh)
 
-    _print_gpu_memory_usage(gpu_monitor)
-    _print_tensor_parallel_status(gpu_monitor)
-    _run_throughput_test(session)
+    # The SSH query and the HTTP test are independent, so overlap their round-trips;
+    # sections are printed afterwards to keep the output order stable
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        gpus_future = executor.submit(gpu_monitor.get_gpu_info)
+        throughput_future = executor.submit(_measure_throughput, session)
+        gpus = gpus_future.result()
+
+        _print_gpu_memory_usage(gpus)
+        _print_tensor_parallel_status(gpu_monitor, gpus)
+        _print_throughput(throughput_future)
     _print_footer()
 
 
@@ -56,14 +68,15 @@ def _print_header():
     console.print("[bold]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold]\n")
 
 
-def _print_gpu_memory_usage(gpu_monitor: GPUMonitor):
+def _print_gpu_memory_usage(gpus: list[GPUInfo]):
     console.print("[bold]GPU Memory Usage:[/bold]")
-    gpus = gpu_monitor.get_gpu_info()
 
     if not gpus:
         console.print("[red]✗ Failed to get GPU information[/red]")
         sys.exit(1)
 
+    from rich.table import Table
+
     table = Table(show_header=True)
     table.add_column("GPU")
     table.add_column("Name")
@@ -72,35 +85,41 @@ def _print_gpu_memory_usage(gpu_monitor: GPUMonitor):
     table.add_column("Usage %")
     table.add_column("Utilization")
 
-    for gpu in gpus:
-        memory_pct = gpu.memory_percent
-        util = f"{gpu.utilization_percent}%"
-        status_color, status = _memory_status(memory_pct)
-
-        table.add_row(
-            f"GPU {gpu.index}",
-            gpu.name,
-            f"{gpu.memory_used_mb} MB",
-            f"{gpu.memory_total_mb} MB",
-            f"[{status_color}]{status}[/{status_color}]",
-            util,
-        )
+    rows = [_gpu_row(gpu) for gpu in gpus]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print()
 
 
+def _gpu_row(gpu: GPUInfo) -> tuple:
+    from rich.text import Text
+
+    status_color, status = _memory_status(gpu.memory_percent)
+    return (
+        f"GPU {gpu.index}",
+        gpu.name,
+        f"{gpu.memory_used_mb} MB",
+        f"{gpu.memory_total_mb} MB",
+        # Pre-styled Text skips rich's markup parser for every cell
+        Text(status, style=status_color),
+        f"{gpu.utilization_percent}%",
+    )
+
+
+# Usage-cell colour per 10% band of memory usage: idle below 10%, low below 50%
+_STATUS_COLORS = ("red",) + ("yellow",) * 4 + ("green",) * 6
+
+
 def _memory_status(memory_pct: float) -> tuple[str, str]:
-    if memory_pct < 10:
-        return "red", "IDLE"
-    if memory_pct < 50:
-        return "yellow", f"{memory_pct:.0f}%"
-    return "green", f"{memory_pct:.0f}%"
+    band = min(10, int(memory_pct // 10))
+    return _STATUS_COLORS[band], "IDLE" if band == 0 else f"{memory_pct:.0f}%"
 
 
-def _print_tensor_parallel_status(gpu_monitor: GPUMonitor):
+def _print_tensor_parallel_status(gpu_monitor: GPUMonitor, gpus: list[GPUInfo]):
     console.print("[bold]Multi-GPU Status:[/bold]")
-    is_working, message = gpu_monitor.check_tensor_parallelism()
+    is_working, message = gpu_monitor.check_tensor_parallelism(gpus)
 
     if is_working:
         console.print(f"  [green]✓[/green] {message}")
@@ -112,41 +131,123 @@ def _print_tensor_parallel_status(gpu_monitor: GPUMonitor):
     console.print()
 
 
-def _run_throughput_test(session):
-    console.print("[bold]Quick Throughput Test:[/bold]")
+@lru_cache(maxsize=1)
+def _http_session():
+    """Keep-alive session so the check does not pay a fresh TCP handshake through the tunnel.
 
-    try:
-        start = time.time()
-        response = requests.post(
-            "http://localhost:8000/v1/completions",
-            json={
-                "model": session.served_model_name,
-                "prompt": "Write a hello world program",
-                "max_tokens": 100,
-            },
-            timeout=30,
+    Built on first use so ``requests`` is only imported once the check actually runs.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # A failed health check should be reported, not silently retried
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(total=0, connect=0))
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+def _measure_throughput(session) -> tuple[int, int, float, Optional[float]]:
+    """Run the quick completion request.
+
+    Returns:
+        Tuple of (status_code, completion tokens, duration, TTFT), the last three
+        only meaningful when status_code is 200
+    """
+    start = time.perf_counter()
+    with _http_session().post(
+        "http://localhost:8000/v1/completions",
+        json={
+            "model": session.served_model_name,
+            "prompt": "Write a hello world program",
+            "max_tokens": 100,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        },
+        # Also bounds each read, so a server that stalls mid-stream is abandoned too
+        timeout=_FIRST_TOKEN_TIMEOUT,
+        stream=True,
+    ) as response:
+        if response.status_code != 200:
+            return response.status_code, 0, 0.0, None
+
+        tokens, first_token_at = _read_completion_stream(
+            response, deadline=start + _FIRST_TOKEN_TIMEOUT
         )
-        end = time.time()
+    ttft = first_token_at - start if first_token_at else None
+    return response.status_code, tokens, time.perf_counter() - start, ttft
+
+
+def _print_throughput(throughput: "Future[tuple[int, int, float, Optional[float]]]"):
+    import requests
 
-        if response.status_code == 200:
-            data = response.json()
-            tokens = data.get("usage", {}).get("completion_tokens", 0)
-            duration = end - start
-            tokens_per_sec = tokens / duration if duration > 0 else 0
+    console.print("[bold]Quick Throughput Test:[/bold]")
+
+    try:
+        status_code, tokens, duration, ttft = throughput.result()
 
+        if status_code == 200:
             console.print(
                 f"  [green]✓[/green] Generated {tokens} tokens in {duration:.1f}s "
-                f"({tokens_per_sec:.1f} tok/s)"
+                f"({_format_rates(tokens, duration, ttft)})"
             )
         else:
-            console.print(f"  [red]✗[/red] API test failed: {response.status_code}")
+            console.print(f"  [red]✗[/red] API test failed: {status_code}")
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         console.print(f"  [red]✗[/red] API test failed: {e}")
         console.print("     → Is the SSH tunnel active?")
         console.print("     → Is vLLM still loading the model?")
 
 
+def _format_rates(tokens: int, duration: float, ttft: Optional[float]) -> str:
+    """Describe TTFT plus the decode rate measured after the first token."""
+    if ttft is None:
+        tokens_per_sec = tokens / duration if duration > 0 else 0
+        return f"{tokens_per_sec:.1f} tok/s, TTFT n/a"
+
+    decode_time = duration - ttft
+    if tokens < 2 or decode_time <= 0:
+        return f"TTFT {ttft * 1000:.0f} ms"
+
+    tokens_per_sec = (tokens - 1) / decode_time
+    itl_ms = decode_time / (tokens - 1) * 1000
+    return f"TTFT {ttft * 1000:.0f} ms, {tokens_per_sec:.1f} tok/s, ITL {itl_ms:.1f} ms"
+
+
+def _read_completion_stream(
+    response, deadline: Optional[float] = None
+) -> tuple[int, Optional[float]]:
+    """Drain a streamed completion, returning (completion tokens, first token time).
+
+    Uses the final usage chunk for the token count when the server sends one,
+    otherwise counts the non-empty text chunks. Raises ``requests.Timeout`` when
+    ``deadline`` (a ``time.perf_counter`` value) passes before the first token.
+    """
+    import requests
+
+    tokens = 0
+    usage_tokens = None
+    first_token_at = None
+    for line in response.iter_lines():
+        if first_token_at is None and deadline is not None and time.perf_counter() > deadline:
+            raise requests.exceptions.Timeout(f"no first token within {_FIRST_TOKEN_TIMEOUT:.0f}s")
+        if not line.startswith(b"data: ") or line == b"data: [DONE]":
+            continue
+        chunk = json_loads(line[6:])
+        usage = chunk.get("usage")
+        if usage:
+            usage_tokens = usage.get("completion_tokens")
+        choices = chunk.get("choices")
+        if choices and choices[0].get("text"):
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            tokens += 1
+    return (usage_tokens if usage_tokens is not None else tokens), first_token_at
+
+
 def _print_footer():
     console.print()
     console.print("[bold]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold]")
@@ -1,12 +1,14 @@
 """Remove stale VM sessions."""
 
+import os
 import shutil
+import sys
+import time
+from pathlib import Path
 
 import click
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..config import Config
-from ..linode_client import LinodeManager
 from ..output import console
 from ..session import SessionManager
 
@@ -18,7 +20,14 @@ from ..session import SessionManager
     help="Clean up a specific session (force-remove if --force is set)",
 )
 @click.option("--force", "-f", is_flag=True, help="Force removal without checking if VM exists")
-def cmd(session: str, force: bool):
+@click.option(
+    "--min-age",
+    type=int,
+    default=300,
+    show_default=True,
+    help="Skip the VM check for sessions whose state changed within this many seconds",
+)
+def cmd(session: str, force: bool, min_age: int):
     """Remove stale VM sessions.
 
     Removes session directories where:
@@ -27,6 +36,7 @@ def cmd(session: str, force: bool):
 
     Use --session to target a specific session (e.g., after manually deleting the VM).
     Use --force to skip VM existence check (for manual cleanup).
+    Use --min-age 0 to also check sessions that were just created.
     """
     session_mgr = SessionManager()
 
@@ -34,7 +44,7 @@ def cmd(session: str, force: bool):
         _cleanup_single_session(session_mgr, session, force)
         return
 
-    _cleanup_bulk_sessions(session_mgr)
+    _cleanup_bulk_sessions(session_mgr, min_age)
 
 
 def _cleanup_single_session(session_mgr: SessionManager, session: str, force: bool):
@@ -56,19 +66,21 @@ def _cleanup_single_session(session_mgr: SessionManager, session: str, force: bo
 
 def _force_remove_session(session_mgr: SessionManager, session: str, target_session):
     console.print("\n[yellow]⚠ Force mode enabled - skipping VM existence check[/yellow]")
-    response = input("\nRemove local session state? [y/N]: ")
-    if response.lower() != "y":
+    # --force already states the intent, so scripts (no TTY) proceed without a prompt
+    if sys.stdin.isatty() and not click.confirm("\nRemove local session state?", default=False):
         console.print("Cancelled")
         return
 
     session_dir = session_mgr.cache_dir / session
-    shutil.rmtree(session_dir)
+    _fast_rmdir(session_dir)
     console.print(f"[green]✓ Removed local session state: {session}[/green]")
     console.print("\n[yellow]Note: If the VM still exists, you must delete it manually:[/yellow]")
     console.print(f"  https://cloud.linode.com/linodes/{target_session.linode_id}")
 
 
 def _remove_session_if_vm_missing(session_mgr: SessionManager, session: str, target_session):
+    from ..linode_client import LinodeManager
+
     try:
         config = Config()
         linode_mgr = LinodeManager(config)
@@ -92,12 +104,14 @@ def _remove_session_if_vm_missing(session_mgr: SessionManager, session: str, tar
         return
 
     session_dir = session_mgr.cache_dir / session
-    shutil.rmtree(session_dir)
+    _fast_rmdir(session_dir)
     console.print(f"[green]✓ Removed orphaned session: {session}[/green]")
     console.print(f"[dim](Linode {target_session.linode_id} no longer exists)[/dim]")
 
 
-def _cleanup_bulk_sessions(session_mgr: SessionManager):
+def _cleanup_bulk_sessions(session_mgr: SessionManager, min_age: int = 300):
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     sessions = session_mgr.list_sessions()
 
     if not sessions:
@@ -105,7 +119,13 @@ def _cleanup_bulk_sessions(session_mgr: SessionManager):
         return
 
     console.print("[bold]Checking for stale sessions...[/bold]\n")
-    linode_mgr = _get_linode_manager()
+    # A local stat rules out freshly written sessions before any API call is made
+    now = time.time()
+    recent = {s.name for s in sessions if _is_recent(session_mgr, s, now, min_age)}
+    existing_ids = None
+    if len(recent) < len(sessions):
+        linode_mgr = _get_linode_manager()
+        existing_ids = _list_existing_ids(linode_mgr) if linode_mgr else None
 
     removed_count = 0
 
@@ -117,8 +137,12 @@ def _cleanup_bulk_sessions(session_mgr: SessionManager):
         task = progress.add_task("Checking sessions...", total=len(sessions))
 
         for session in sessions:
-            removed = _cleanup_session_dir(session_mgr, linode_mgr, session)
-            if removed:
+            if session.name in recent:
+                pass
+            elif _remove_if_state_missing(session_mgr, session):
+                removed_count += 1
+            elif existing_ids is not None and session.linode_id not in existing_ids:
+                _remove_stale_session(session_mgr, session)
                 removed_count += 1
             progress.advance(task)
 
@@ -130,6 +154,8 @@ def _cleanup_bulk_sessions(session_mgr: SessionManager):
 
 
 def _get_linode_manager():
+    from ..linode_client import LinodeManager
+
     try:
         config = Config()
         return LinodeManager(config)
@@ -141,27 +167,51 @@ def _get_linode_manager():
         return None
 
 
-def _cleanup_session_dir(session_mgr: SessionManager, linode_mgr, session):
-    session_dir = session_mgr.cache_dir / session.name
-    state_file = session_dir / "state.json"
-    if not state_file.exists():
-        console.print(f"[yellow]  Removing session with missing state: {session.name}[/yellow]")
-        shutil.rmtree(session_dir)
-        return True
+def _is_recent(session_mgr: SessionManager, session, now: float, min_age: int) -> bool:
+    try:
+        mtime = (session_mgr.cache_dir / session.name / "state.json").stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return now - mtime < min_age
 
-    if not linode_mgr:
+
+def _remove_if_state_missing(session_mgr: SessionManager, session) -> bool:
+    session_dir = session_mgr.cache_dir / session.name
+    if (session_dir / "state.json").exists():
         return False
 
+    console.print(f"[yellow]  Removing session with missing state: {session.name}[/yellow]")
+    _fast_rmdir(session_dir)
+    return True
+
+
+def _list_existing_ids(linode_mgr):
+    """Fetch every Linode ID on the account once, or None if the listing fails."""
     try:
-        instance = linode_mgr.get_instance(session.linode_id)
-        if not instance:
-            console.print(
-                f"[yellow]  Removing stale session: {session.name} "
-                f"(Linode {session.linode_id} no longer exists)[/yellow]"
-            )
-            shutil.rmtree(session_dir)
-            return True
-    except Exception:
-        pass
+        return linode_mgr.list_instance_ids()
+    except Exception as e:
+        console.print(f"[yellow]⚠ Cannot list Linodes ({e}) - only checking state files[/yellow]\n")
+        return None
 
-    return False
+
+def _remove_stale_session(session_mgr: SessionManager, session):
+    console.print(
+        f"[yellow]  Removing stale session: {session.name} "
+        f"(Linode {session.linode_id} no longer exists)[/yellow]"
+    )
+    _fast_rmdir(session_mgr.cache_dir / session.name)
+
+
+def _fast_rmdir(path: Path):
+    """Remove a session directory, unlinking its files directly.
+
+    Session directories are flat (state.json, last_activity, watchdog.pid, ...),
+    so this skips shutil.rmtree's recursive walk; anything nested falls back to it.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(path)
+                return
+            os.unlink(entry.path)
+    os.rmdir(path)
@@ -7,7 +7,6 @@ from pathlib import Path
 import click
 
 from ..config import Config
-from ..linode_client import LinodeManager
 from ..output import console
 from ..session import SessionManager
 
@@ -22,13 +21,14 @@ def cmd(session_name: str, force: bool):
     """
     config = Config()
     session_mgr = SessionManager()
-    linode_mgr = LinodeManager(config)
 
     session = _get_session_or_exit(session_mgr, session_name)
     _require_token_or_exit(config, session)
     _confirm_destroy(session, force)
-    _close_ssh_tunnel(session)
-    _delete_linode(linode_mgr, session)
+    # The tunnel shutdown and the API delete are independent, so overlap them
+    ssh_proc = _close_ssh_tunnel(session)
+    _delete_linode(config, session)
+    _wait_for_tunnel_close(ssh_proc)
     _print_summary(session)
     session_mgr.delete_session(session.name)
     console.print(f"\n[green]✓[/green] Session '{session.name}' destroyed")
@@ -100,24 +100,41 @@ def _confirm_destroy(session, force: bool):
     console.print(f"  Runtime: {session.runtime_hours:.2f} hours")
     console.print(f"  Cost: ${session.total_cost:.2f}\n")
 
-    response = input("Destroy this VM? [y/N]: ")
-    if response.lower() != "y":
+    if not sys.stdin.isatty():
+        # Never destroy a VM on an unanswerable prompt; scripts must pass --force
+        console.error("[red]✗ Not a terminal - pass --force to destroy without a prompt[/red]")
+        sys.exit(1)
+
+    if not click.confirm("Destroy this VM?", default=False):
         console.print("Cancelled")
         sys.exit(0)
 
 
-def _close_ssh_tunnel(session):
+def _close_ssh_tunnel(session) -> subprocess.Popen:
+    """Start closing the session's SSH ControlMaster without waiting for it."""
     console.print("\n[bold]Cleaning up SSH tunnel...[/bold]")
     control_path = Path.home() / ".ssh" / f"llm-master-root@{session.ip}"
-    subprocess.run(
+    return subprocess.Popen(
         ["ssh", "-O", "exit", "-o", f"ControlPath={control_path}", f"root@{session.ip}"],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
 
-def _delete_linode(linode_mgr: LinodeManager, session):
+def _wait_for_tunnel_close(ssh_proc: subprocess.Popen, timeout: float = 5):
+    try:
+        ssh_proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        ssh_proc.kill()
+
+
+def _delete_linode(config: Config, session):
+    # Imported here so the linode_api4 client only loads once the user has confirmed
+    from ..linode_client import LinodeManager
+
     console.print("[bold]Destroying VM...[/bold]")
     try:
+        linode_mgr = LinodeManager(config)
         instance = linode_mgr.get_instance(session.linode_id)
         if instance:
             instance.delete()
@@ -1,7 +1,6 @@
 """Reset watchdog idle timer."""
 
 import sys
-import time
 
 import click
 
@@ -34,8 +33,7 @@ def cmd(session_name: str = None):
 
     # Update last_activity timestamp
     session_dir = session_mgr.cache_dir / session.name
-    activity_file = session_dir / "last_activity"
-    activity_file.write_text(str(time.time()))
+    session_mgr.record_activity(session.name)
 
     console.print(f"[green]✓ Timer reset for session: {session.name}[/green]")
 
@@ -1,10 +1,10 @@
 """List GPU types command."""
 
+import heapq
 import sys
 import click
-from rich.table import Table
 
-from ..config import Config
+from ..config import default_config
 from ..output import console
 from ..providers.linode import LinodeProvider
 
@@ -30,7 +30,7 @@ def cmd(region, refresh):
 
     # Load config to get API token
     try:
-        config = Config()
+        config = default_config()
         if not config.linode_token:
             console.print("[red]Error: LINODE_TOKEN not found in environment[/red]")
             console.print("Set LINODE_TOKEN or LINODE_CLI_TOKEN in .env")
@@ -52,23 +52,37 @@ def cmd(region, refresh):
             )
             sys.exit(1)
 
-        # Display table
-        table = Table(title=f"GPU Types{' in ' + region if region else ''}")
-        table.add_column("Type ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("GPUs", justify="right")
-        table.add_column("VRAM/GPU", justify="right")
-        table.add_column("Total VRAM", justify="right")
-        table.add_column("Cost/Hour", justify="right", style="yellow")
-        table.add_column("Regions", style="dim")
-
-        for vm_type in vm_types:
-            # Format regions (show first 3 + count)
-            regions_str = ", ".join(sorted(vm_type.available_in_regions)[:3])
-            if len(vm_type.available_in_regions) > 3:
-                regions_str += f" +{len(vm_type.available_in_regions) - 3}"
-
-            table.add_row(
+        rows = _type_rows(vm_types)
+        if console.is_terminal:
+            console.print(_types_table(rows, region))
+        else:
+            # Piped output skips rich's table measurement and is written in one go
+            console.print(_plain_types_listing(rows), markup=False, highlight=False, soft_wrap=True)
+        console.print(f"\n[dim]Total: {len(vm_types)} GPU types[/dim]\n")
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+_COLUMNS = ("Type ID", "Name", "GPUs", "VRAM/GPU", "Total VRAM", "Cost/Hour", "Regions")
+# Columns right-aligned in both the rich table and the plain listing
+_RIGHT_ALIGNED = {"GPUs", "VRAM/GPU", "Total VRAM", "Cost/Hour"}
+
+
+def _type_rows(vm_types) -> list[tuple[str, ...]]:
+    """Format each GPU type as a row of cell strings, in _COLUMNS order."""
+    rows = []
+    for vm_type in vm_types:
+        # Format regions (show first 3 + count); nsmallest avoids sorting the full list
+        regions = vm_type.available_in_regions
+        n_regions = len(regions)
+        regions_str = ", ".join(heapq.nsmallest(3, regions))
+        if n_regions > 3:
+            regions_str += f" +{n_regions - 3}"
+
+        rows.append(
+            (
                 vm_type.id,
                 vm_type.name,
                 str(vm_type.gpus),
@@ -77,10 +91,31 @@ def cmd(region, refresh):
                 f"${vm_type.hourly_cost:.2f}",
                 regions_str,
             )
+        )
+    return rows
 
-        console.print(table)
-        console.print(f"\n[dim]Total: {len(vm_types)} GPU types[/dim]\n")
 
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        sys.exit(1)
+def _types_table(rows: list[tuple[str, ...]], region):
+    from rich.table import Table
+
+    styles = {"Type ID": "cyan", "Name": "green", "Cost/Hour": "yellow", "Regions": "dim"}
+    table = Table(title=f"GPU Types{' in ' + region if region else ''}")
+    for column in _COLUMNS:
+        justify = "right" if column in _RIGHT_ALIGNED else "left"
+        table.add_column(column, justify=justify, style=styles.get(column))
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _plain_types_listing(rows: list[tuple[str, ...]]) -> str:
+    """Lay the rows out as fixed-width text, measuring each column once."""
+    widths = [max(len(cell) for cell in column) for column in zip(_COLUMNS, *rows)]
+    lines = []
+    for cells in (_COLUMNS, *rows):
+        padded = [
+            cell.rjust(width) if column in _RIGHT_ALIGNED else cell.ljust(width)
+            for column, cell, width in zip(_COLUMNS, cells, widths)
+        ]
+        lines.append("  ".join(padded).rstrip())
+    return "\n".join(lines)
@@ -1,9 +1,11 @@
 """List all VM sessions."""
 
+import operator
+
 import click
 from rich.table import Table
 
-from ..config import Config
+from ..config import default_config
 from ..linode_client import LinodeManager
 from ..output import console
 from ..session import SessionManager
@@ -13,7 +15,7 @@ from ..session import SessionManager
 def cmd():
     """List all active VM sessions."""
     # Load configuration
-    config = Config()
+    config = default_config()
 
     # Initialize managers
     session_mgr = SessionManager()
@@ -44,10 +46,17 @@ def cmd():
     total_hourly = 0.0
     total_cost = 0.0
 
-    for session in sorted(sessions, key=lambda s: s.start_time):
+    # One listing answers every session instead of a GET per Linode
+    statuses = _list_statuses(linode_mgr)
+
+    # list_sessions hands back a fresh list, so it can be sorted in place
+    sessions.sort(key=operator.attrgetter("start_time"))
+    for session in sessions:
         # Check if Linode still exists
-        instance = linode_mgr.get_instance(session.linode_id)
-        status = instance.status if instance else "deleted"
+        if statuses is None:
+            status = "unknown"
+        else:
+            status = statuses.get(session.linode_id, "deleted")
 
         # Mark current session
         session_name = session.name
@@ -82,3 +91,12 @@ def cmd():
         console.print(
             "[yellow]No current session set. Run 'coder use <session>' to set one.[/yellow]"
         )
+
+
+def _list_statuses(linode_mgr: LinodeManager):
+    """Fetch the status of every Linode on the account, or None if the listing fails."""
+    try:
+        return linode_mgr.list_instance_statuses()
+    except Exception as e:
+        console.print(f"[yellow]⚠ Cannot list Linodes ({e}) - status unknown[/yellow]")
+        return None
@@ -1,11 +1,12 @@
 """Interactive recommendation command."""
 
 import click
+from rich.console import Group
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 
-from ..benchmark_db import BenchmarkDatabase
+from ..benchmark_db import default_database
 from ..output import console
 from ..recommendations import (
     BudgetConstraint,
@@ -42,10 +43,10 @@ def cmd():
     console.print()
 
     # Check if database has any data
-    db = BenchmarkDatabase()
-    all_results = db.get_results()
+    db = default_database()
+    result_count = db.count_results()
 
-    if not all_results:
+    if not result_count:
         console.print("[yellow]No benchmark data available yet.[/yellow]\n")
         console.print("To get recommendations:")
         console.print("  1. Create a VM: maider up")
@@ -53,7 +54,7 @@ def cmd():
         console.print("  3. Come back here: maider recommend\n")
         return
 
-    console.print(f"[dim]Found {len(all_results)} benchmark results in database[/dim]\n")
+    console.print(f"[dim]Found {result_count} benchmark results in database[/dim]\n")
 
     # Question 1: Task type
     console.print("[bold]What's your primary task type?[/bold]\n")
@@ -151,7 +152,7 @@ def cmd():
     for i, rec in enumerate(recommendations, 1):
         _display_recommendation(i, rec)
 
-    console.print(f"\n[dim]Based on {len(all_results)} benchmark results[/dim]\n")
+    console.print(f"\n[dim]Based on {result_count} benchmark results[/dim]\n")
 
 
 def _display_recommendation(rank: int, rec):
@@ -168,12 +169,6 @@ def _display_recommendation(rank: int, rec):
     if len(model_name) > 40:
         model_name = model_name[:37] + "..."
 
-    # Create panel content
-    lines = [
-        f"[bold cyan]{rank}. {gpu_label} + {model_name}[/bold cyan]",
-        "",
-    ]
-
     # Performance metrics
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Metric", style="dim")
@@ -192,26 +187,16 @@ def _display_recommendation(rank: int, rec):
         f"{confidence_display} ({rec.num_benchmark_runs} benchmark runs)",
     )
 
-    # Render table to string
-    from io import StringIO
-    from rich.console import Console as TempConsole
-
-    temp_console = TempConsole(file=StringIO(), width=70, legacy_windows=False)
-    temp_console.print(table)
-    table_str = temp_console.file.getvalue()
-
-    lines.append(table_str)
-
-    # Add notes if any
+    # Header, metrics table and notes render in a single pass inside the panel
+    renderables = [f"[bold cyan]{rank}. {gpu_label} + {model_name}[/bold cyan]", "", table]
     if rec.notes:
-        lines.append("")
-        for note in rec.notes:
-            lines.append(f"[yellow]{note}[/yellow]")
+        renderables.append("")
+        renderables.extend(f"[yellow]{note}[/yellow]" for note in rec.notes)
 
     # Display panel
     console.print(
         Panel(
-            "\n".join(lines),
+            Group(*renderables),
             border_style=rec.confidence_color,
             padding=(0, 1),
         )
@@ -3,7 +3,7 @@
 import sys
 import click
 
-from ..config import Config
+from ..config import default_config
 from ..linode_client import LinodeManager
 from ..output import console
 from ..session import SessionManager
@@ -17,7 +17,7 @@ def cmd(session_name: str):
     SESSION_NAME: Name of session (current session if not specified)
     """
     # Load configuration
-    config = Config()
+    config = default_config()
 
     # Initialize managers
     session_mgr = SessionManager()
@@ -38,23 +38,29 @@ def cmd(session_name: str):
     # Get Linode status
     instance = linode_mgr.get_instance(session.linode_id)
 
-    # Display status
-    console.print(f"\n[bold]Session: {session.name}[/bold]")
-    console.print("─" * 50)
-    console.print(f"  Linode ID: {session.linode_id}")
-    console.print(f"  IP Address: {session.ip}")
-    console.print(f"  Type: {session.type}")
-    console.print(f"  Model: {session.model_id}")
-    console.print(f"  Status: {instance.status if instance else 'deleted'}")
-    console.print()
-    console.print(f"  Runtime: {session.runtime_hours:.2f} hours")
-    console.print(f"  Hourly cost: ${session.hourly_cost:.2f}")
-    console.print(f"  Total cost: ${session.total_cost:.2f}")
-    console.print()
+    # Display status as one block: a single render and write instead of one per line
+    lines = [
+        "",
+        f"[bold]Session: {session.name}[/bold]",
+        "─" * 50,
+        f"  Linode ID: {session.linode_id}",
+        f"  IP Address: {session.ip}",
+        f"  Type: {session.type}",
+        f"  Model: {session.model_id}",
+        f"  Status: {instance.status if instance else 'deleted'}",
+        "",
+        f"  Runtime: {session.runtime_hours:.2f} hours",
+        f"  Hourly cost: ${session.hourly_cost:.2f}",
+        f"  Total cost: ${session.total_cost:.2f}",
+        "",
+    ]
 
     if instance and instance.status == "running":
-        console.print("[bold]Access:[/bold]")
-        console.print(f"  • SSH: ssh root@{session.ip}")
-        console.print("  • Open WebUI: http://localhost:3000")
-        console.print("  • vLLM API: http://localhost:8000/v1")
-    console.print()
+        lines += [
+            "[bold]Access:[/bold]",
+            f"  • SSH: ssh root@{session.ip}",
+            "  • Open WebUI: http://localhost:3000",
+            "  • vLLM API: http://localhost:8000/v1",
+        ]
+    lines.append("")
+    console.print("\n".join(lines))
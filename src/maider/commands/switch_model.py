@@ -9,10 +9,11 @@ import click
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..compose import ComposeRuntime
-from ..config import Config
+from ..config import Config, default_config
 from ..model_validation import prompt_for_max_len_adjustment, validate_max_model_len
 from ..output import console
 from ..session import SessionManager
+from ..ssh_utils import SSHClient
 
 
 @click.command(name="switch-model")
@@ -33,7 +34,7 @@ def cmd(
     MODEL_ID: HuggingFace model ID (e.g., Qwen/Qwen2.5-Coder-14B-Instruct-AWQ)
     SESSION_NAME: Name of session (current session if not specified)
     """
-    config = Config()
+    config = default_config()
     session_mgr = SessionManager()
     session = _get_session_or_exit(session_mgr, session_name)
 
@@ -61,9 +62,9 @@ def cmd(
     _generate_aider_metadata(served_name, final_max_model_len)
     _update_session_model(session_mgr, session, model_id, served_name)
 
-    api_ready = _wait_for_api(session.ip, runtime)
-    if api_ready:
-        _verify_model(session.ip, runtime.vllm_port, served_name)
+    models_body = _wait_for_api(session.ip, runtime)
+    if models_body is not None:
+        _verify_model(served_name, models_body)
         console.print(f"\n[green]✓[/green] Successfully switched to {model_id}")
     else:
         console.print("\n[yellow]⚠[/yellow] Model switch initiated but API did not respond in time")
@@ -174,55 +175,60 @@ def _upload_runtime(ip: str, docker_compose: str, runtime_env: str):
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        _upload_compose(ip, docker_compose, progress)
-        _upload_env(ip, runtime_env, progress)
+        task = progress.add_task("Uploading docker-compose.yml and .env...", total=None)
+        _upload_files(ip, {"docker-compose.yml": docker_compose, ".env": runtime_env}, "/opt/llm/")
+        progress.update(task, completed=True)
 
 
-def _upload_compose(ip: str, docker_compose: str, progress: Progress):
-    task = progress.add_task("Uploading new docker-compose.yml...", total=None)
-    _upload_temp_file(
-        content=docker_compose,
-        suffix=".yml",
-        remote_path=f"root@{ip}:/opt/llm/docker-compose.yml",
-    )
-    progress.update(task, completed=True)
+def _upload_files(ip: str, files: dict[str, str], remote_dir: str):
+    """Write several files into one remote directory over a single ssh call.
 
+    The files are packed into an in-memory tar streamed to ``tar -x`` on the VM,
+    so nothing touches the local disk and the call shares the ControlMaster.
+    """
+    import io
+    import tarfile
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            # .env holds the HF token
+            info.mode = 0o600
+            info.mtime = int(time.time())
+            archive.addfile(info, io.BytesIO(data))
 
-def _upload_env(ip: str, runtime_env: str, progress: Progress):
-    task = progress.add_task("Uploading .env...", total=None)
-    _upload_temp_file(
-        content=runtime_env,
-        suffix=".env",
-        remote_path=f"root@{ip}:/opt/llm/.env",
+    result = subprocess.run(
+        ["ssh", *_ssh_options(ip), f"root@{ip}", f"tar -x -C {remote_dir}"],
+        input=buffer.getvalue(),
+        capture_output=True,
     )
-    progress.update(task, completed=True)
-
+    if result.returncode != 0:
+        console.print(f"[red]Failed to upload: {result.stderr.decode(errors='replace')}[/red]")
+        sys.exit(1)
 
-def _upload_temp_file(content: str, suffix: str, remote_path: str):
-    import tempfile
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as temp_file:
-        temp_file.write(content)
-        temp_path = temp_file.name
+def _ssh_options(ip: str) -> list[str]:
+    """SSH options that multiplex every call to the VM over one connection.
 
-    try:
-        result = subprocess.run(
-            ["scp", temp_path, remote_path],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            console.print(f"[red]Failed to upload: {result.stderr}[/red]")
-            sys.exit(1)
-    finally:
-        Path(temp_path).unlink()
+    Uses the tunnel's ControlMaster socket, so calls ride an open tunnel, or the
+    first call starts a master that the restart and API polls then share.
+    """
+    return SSHClient(ip).multiplex_options()
 
 
 def _restart_containers(ip: str):
     console.print("[bold]Restarting containers...[/bold]")
     try:
         result = subprocess.run(
-            ["ssh", f"root@{ip}", "cd /opt/llm && docker compose down && docker compose up -d"],
+            [
+                "ssh",
+                *_ssh_options(ip),
+                f"root@{ip}",
+                "cd /opt/llm && docker compose down && docker compose up -d",
+            ],
             capture_output=True,
             text=True,
             timeout=120,
@@ -236,7 +242,7 @@ def _restart_containers(ip: str):
         )
         try:
             result = subprocess.run(
-                ["ssh", f"root@{ip}", "systemctl restart vllm"],
+                ["ssh", *_ssh_options(ip), f"root@{ip}", "systemctl restart vllm"],
                 capture_output=True,
                 text=True,
                 timeout=60,
@@ -249,14 +255,18 @@ def _restart_containers(ip: str):
             sys.exit(1)
 
 
-def _wait_for_api(ip: str, runtime: ComposeRuntime) -> bool:
-    """Wait for the vLLM API to become ready. Returns True if ready, False on timeout."""
+def _wait_for_api(ip: str, runtime: ComposeRuntime) -> str | None:
+    """Wait for the vLLM API to become ready.
+
+    Returns:
+        The /v1/models response body from the successful poll, or None on timeout
+    """
     console.print("\n[bold]Waiting for vLLM API...[/bold]")
     console.print("[dim](This may take 10-20 minutes for model download)[/dim]")
 
     max_wait = 1200  # 20 minutes
     start_time = time.time()
-    api_ready = False
+    models_body = None
 
     with Progress(
         SpinnerColumn(),
@@ -270,6 +280,7 @@ def _wait_for_api(ip: str, runtime: ComposeRuntime) -> bool:
                 result = subprocess.run(
                     [
                         "ssh",
+                        *_ssh_options(ip),
                         f"root@{ip}",
                         f"curl -s http://localhost:{runtime.vllm_port}/v1/models",
                     ],
@@ -281,36 +292,31 @@ def _wait_for_api(ip: str, runtime: ComposeRuntime) -> bool:
                 # {"object": "list", "data": [...]} when ready
                 if result.returncode == 0 and '"data"' in result.stdout:
                     progress.update(task, completed=True)
-                    api_ready = True
+                    models_body = result.stdout
                     break
             except subprocess.TimeoutExpired:
                 pass
 
             time.sleep(5)
 
-    if api_ready:
+    if models_body is not None:
         console.print("[green]✓[/green] API ready")
     else:
         console.print("[yellow]⚠ Timeout waiting for API[/yellow]")
         console.print("[dim]The model may still be loading. Check status with:[/dim]")
         console.print(f"  [cyan]ssh root@{ip} docker logs -f vllm[/cyan]")
 
-    return api_ready
+    return models_body
 
 
-def _verify_model(ip: str, vllm_port: int, served_name: str):
+def _verify_model(served_name: str, models_body: str):
+    """Check the served name against the /v1/models body the readiness poll fetched."""
     console.print("\n[bold]Verifying model...[/bold]")
-    result = subprocess.run(
-        ["ssh", f"root@{ip}", f"curl -s http://localhost:{vllm_port}/v1/models"],
-        capture_output=True,
-        text=True,
-    )
-
-    if served_name in result.stdout:
+    if served_name in models_body:
         console.print(f"[green]✓[/green] Model loaded: {served_name}")
     else:
         console.print("[yellow]⚠[/yellow] Model name not found in API response")
-        console.print(f"Response: {result.stdout}")
+        console.print(f"Response: {models_body}")
 
 
 def _update_session_model(session_mgr: SessionManager, session, model_id: str, served_name: str):
@@ -337,6 +343,21 @@ def _generate_aider_metadata(model_name: str, max_model_len: int):
     }
 
     metadata_path = Path.cwd() / ".aider.model.metadata.json"
+    # Re-switching to the same model and length leaves the file (and its mtime) alone
+    if _read_json(metadata_path) == metadata:
+        console.print("[green]✓[/green] .aider.model.metadata.json already up to date")
+        return
+
     metadata_path.write_text(json.dumps(metadata, indent=2))
 
     console.print("[green]✓[/green] Generated .aider.model.metadata.json")
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, or return None if it is missing or unreadable."""
+    import json
+
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
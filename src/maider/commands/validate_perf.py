@@ -31,7 +31,7 @@ def cmd(session_name: str):
     console.print()
 
     gpus = _gpu_hardware_validation(gpu_monitor)
-    _tensor_parallel_validation(gpu_monitor)
+    _tensor_parallel_validation(gpu_monitor, gpus)
     idle_gpus = _gpu_memory_utilization(gpus)
     errors = _nccl_communication_check(gpu_monitor)
     results = _run_live_performance_test(session)
@@ -76,7 +76,7 @@ def _gpu_hardware_validation(gpu_monitor: GPUMonitor):
     return gpus
 
 
-def _tensor_parallel_validation(gpu_monitor: GPUMonitor):
+def _tensor_parallel_validation(gpu_monitor: GPUMonitor, gpus):
     _print_header("2. Tensor Parallelism Configuration")
     console.print("[bold]Checking vLLM tensor parallelism initialization...[/bold]")
     logs = gpu_monitor.get_container_logs(lines=200)
@@ -96,7 +96,7 @@ def _tensor_parallel_validation(gpu_monitor: GPUMonitor):
     for line in tp_lines[:5]:
         console.print(f"  {line.strip()}")
 
-    is_working, message = gpu_monitor.check_tensor_parallelism()
+    is_working, message = gpu_monitor.check_tensor_parallelism(gpus)
     console.print()
     if is_working:
         console.print(f"[green]✓[/green] {message}")
@@ -3,6 +3,7 @@
 import importlib.util
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -164,3 +165,39 @@ class Config:
 
         # Fallback: return 0.0 for unknown providers
         return 0.0
+
+
+def default_config() -> Config:
+    """Return the process-wide config for the current directory.
+
+    Read-only commands share one instance per project directory, so the .env files
+    are parsed once per process. The cache is keyed on the environment as well, so a
+    long-lived process sees the same values a fresh Config() would after an env var
+    or .env file changes. Callers that modify the config build their own.
+    """
+    project_dir = Path.cwd()
+    _load_project_env(project_dir, _dotenv_stamps(project_dir))
+    return _config_for(project_dir, frozenset(os.environ.items()))
+
+
+def _dotenv_stamps(project_dir: Path) -> tuple[Optional[int], ...]:
+    stamps = []
+    for name in (".env", ".env.secrets"):
+        try:
+            stamps.append((project_dir / name).stat().st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+@lru_cache(maxsize=8)
+def _load_project_env(project_dir: Path, dotenv_stamps: tuple[Optional[int], ...]) -> None:
+    # Apply the .env files before the environment is snapshotted for _config_for;
+    # Config's own load_dotenv calls then leave os.environ unchanged
+    load_dotenv(project_dir / ".env")
+    load_dotenv(project_dir / ".env.secrets")
+
+
+@lru_cache(maxsize=8)
+def _config_for(project_dir: Path, environ: frozenset[tuple[str, str]]) -> Config:
+    return Config(project_dir)
@@ -72,9 +72,14 @@ class GPUMonitor:
 
         return gpus
 
-    def check_tensor_parallelism(self) -> tuple[bool, str]:
-        """Check if tensor parallelism is working (all GPUs have similar memory usage)."""
-        gpus = self.get_gpu_info()
+    def check_tensor_parallelism(self, gpus: Optional[list[GPUInfo]] = None) -> tuple[bool, str]:
+        """Check if tensor parallelism is working (all GPUs have similar memory usage).
+
+        Args:
+            gpus: GPU info already fetched by the caller (default: query the host)
+        """
+        if gpus is None:
+            gpus = self.get_gpu_info()
 
         if len(gpus) <= 1:
             return True, "Single GPU configuration"
@@ -68,6 +68,14 @@ class LinodeManager:
         except Exception:
             return None
 
+    def list_instance_ids(self) -> set[int]:
+        """Get the IDs of all instances on the account in one paginated listing."""
+        return {instance.id for instance in self.client.linode.instances()}
+
+    def list_instance_statuses(self) -> dict[int, str]:
+        """Get the status of every instance on the account in one paginated listing."""
+        return {instance.id: instance.status for instance in self.client.linode.instances()}
+
     def delete_instance(self, linode_id: int):
         """Delete a Linode instance.
 
@@ -4,9 +4,14 @@ Fetches model configs from HuggingFace and validates that the configured
 max_model_len doesn't exceed the model's actual max_position_embeddings.
 """
 
+import json
 import logging
+import os
 import sys
+import tempfile
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 import requests
@@ -32,6 +37,11 @@ KNOWN_CONTEXT_LENGTHS: dict[str, int] = {
 # HuggingFace API timeout
 HF_API_TIMEOUT = 30
 
+# Successful HuggingFace lookups are cached on disk so repeated up/switch-model
+# runs for the same model skip the network round-trip
+MODEL_CONFIG_CACHE = Path.home() / ".cache" / "linode-vms" / "model-configs.json"
+MODEL_CONFIG_CACHE_TTL = 7 * 24 * 3600  # seconds
+
 
 @dataclass
 class ModelConfigInfo:
@@ -120,6 +130,10 @@ def fetch_model_config(model_id: str, hf_token: Optional[str] = None) -> ModelCo
             max_position_embeddings=KNOWN_CONTEXT_LENGTHS[model_id],
         )
 
+    cached = _cached_model_config(model_id)
+    if cached is not None:
+        return cached
+
     url = f"https://huggingface.co/{model_id}/resolve/main/config.json"
     headers = {}
     if hf_token:
@@ -148,12 +162,14 @@ def fetch_model_config(model_id: str, hf_token: Optional[str] = None) -> ModelCo
 
         config = response.json()
 
-        return ModelConfigInfo(
+        info = ModelConfigInfo(
             model_id=model_id,
             max_position_embeddings=config.get("max_position_embeddings"),
             model_max_length=config.get("model_max_length"),
             rope_scaling=config.get("rope_scaling"),
         )
+        _store_model_config(info)
+        return info
 
     except requests.exceptions.Timeout:
         return ModelConfigInfo(
@@ -172,6 +188,48 @@ def fetch_model_config(model_id: str, hf_token: Optional[str] = None) -> ModelCo
         )
 
 
+def _read_model_config_cache() -> dict:
+    try:
+        cache = json.loads(MODEL_CONFIG_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _cached_model_config(model_id: str) -> Optional[ModelConfigInfo]:
+    """Return the cached config for model_id, or None if missing or expired."""
+    entry = _read_model_config_cache().get(model_id)
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get("fetched_at", 0) > MODEL_CONFIG_CACHE_TTL:
+        return None
+    return ModelConfigInfo(
+        model_id=model_id,
+        max_position_embeddings=entry.get("max_position_embeddings"),
+        model_max_length=entry.get("model_max_length"),
+        rope_scaling=entry.get("rope_scaling"),
+    )
+
+
+def _store_model_config(info: ModelConfigInfo) -> None:
+    """Record a successful lookup; cache write failures are not fatal."""
+    cache = _read_model_config_cache()
+    cache[info.model_id] = {
+        "max_position_embeddings": info.max_position_embeddings,
+        "model_max_length": info.model_max_length,
+        "rope_scaling": info.rope_scaling,
+        "fetched_at": time.time(),
+    }
+    try:
+        MODEL_CONFIG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=MODEL_CONFIG_CACHE.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, MODEL_CONFIG_CACHE)
+    except OSError as e:
+        logger.debug("Could not write model config cache: %s", e)
+
+
 def validate_max_model_len(
     model_id: str,
     max_model_len: int,
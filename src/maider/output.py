@@ -12,9 +12,16 @@ class QuietConsole:
     """
 
     def __init__(self):
-        self._console = RichConsole()
+        self._rich_console = None
         self._quiet = False
 
+    @property
+    def _console(self) -> RichConsole:
+        """Underlying rich Console, created on first use rather than at import."""
+        if self._rich_console is None:
+            self._rich_console = RichConsole()
+        return self._rich_console
+
     @property
     def quiet(self) -> bool:
         return self._quiet
@@ -55,6 +62,18 @@ class QuietConsole:
         """Check if output is a terminal."""
         return self._console.is_terminal
 
+    def __getattr__(self, name: str):
+        """Delegate anything else to the rich Console (e.g. for Progress(console=console))."""
+        if name.startswith("__") or name == "_rich_console":
+            raise AttributeError(name)
+        return getattr(self._console, name)
+
+    def __enter__(self):
+        return self._console.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._console.__exit__(*exc_info)
+
 
 # Global console instance
 console = QuietConsole()
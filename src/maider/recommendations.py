@@ -141,12 +141,10 @@ class RecommendationEngine:
     def _group_by_config(self, results: List[BenchmarkResult]) -> Dict[str, List[BenchmarkResult]]:
         """Group results by GPU type and model category."""
         groups: Dict[str, List[BenchmarkResult]] = {}
+        setdefault = groups.setdefault
 
         for result in results:
-            key = f"{result.gpu_type}|{result.model_category}"
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(result)
+            setdefault(f"{result.gpu_type}|{result.model_category}", []).append(result)
 
         return groups
 
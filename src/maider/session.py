@@ -1,6 +1,7 @@
 """Session management for VM instances."""
 
 import json
+import os
 import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -50,11 +51,14 @@ class SessionManager:
     """Manages VM sessions."""
 
     STATE_FILENAME = "state.json"
+    ACTIVITY_FILENAME = "last_activity"
 
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize session manager."""
         self.cache_dir = cache_dir or (Path.home() / ".cache" / "linode-vms")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Sessions parsed by list_sessions, served to get_session until the next write
+        self._session_cache: Optional[dict[str, Session]] = None
 
     def create_session(
         self,
@@ -111,6 +115,7 @@ class SessionManager:
 
         state_file = session_dir / self.STATE_FILENAME
         state_file.write_text(json.dumps(asdict(session), indent=2))
+        self._session_cache = None
 
         # Create aider-env file
         self._write_aider_env(session, session_dir)
@@ -123,6 +128,9 @@ class SessionManager:
         Handles migration from old sessions with linode_id to new format
         with provider_instance_id.
         """
+        if self._session_cache is not None:
+            return self._session_cache.get(name)
+
         state_file = self.cache_dir / name / self.STATE_FILENAME
         if not state_file.exists():
             return None
@@ -145,22 +153,42 @@ class SessionManager:
 
     def list_sessions(self) -> list[Session]:
         """List all sessions."""
-        sessions = []
-        for session_dir in self.cache_dir.iterdir():
-            if session_dir.is_dir():
-                session = self.get_session(session_dir.name)
-                if session:
-                    sessions.append(session)
-        return sessions
+        if self._session_cache is None:
+            cache = {}
+            for session_dir in self.cache_dir.iterdir():
+                if session_dir.is_dir():
+                    session = self.get_session(session_dir.name)
+                    if session:
+                        cache[session_dir.name] = session
+            self._session_cache = cache
+        return list(self._session_cache.values())
 
     def delete_session(self, name: str):
         """Delete a session."""
         session_dir = self.cache_dir / name
+        self._session_cache = None
         if session_dir.exists():
             import shutil
 
             shutil.rmtree(session_dir)
 
+    def record_activity(self, name: str) -> Path:
+        """Stamp the session's last-activity file with the current wall-clock time.
+
+        The file holds a single ``time.time()`` float. It is replaced atomically,
+        so readers either see the previous stamp or the new one, never a partial
+        write; wall-clock time is used because the stamp is compared across
+        processes, where ``time.monotonic`` values are meaningless.
+        """
+        activity_file = self.cache_dir / name / self.ACTIVITY_FILENAME
+        tmp_file = activity_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(str(time.time()).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, activity_file)
+        return activity_file
+
     def update_session_model(self, name: str, model_id: str, served_model_name: str):
         """Update the model information for a session."""
         session = self.get_session(name)
@@ -175,24 +203,21 @@ class SessionManager:
         session_dir = self.cache_dir / name
         state_file = session_dir / self.STATE_FILENAME
         state_file.write_text(json.dumps(asdict(session), indent=2))
+        self._session_cache = None
 
         # Regenerate aider-env file
         self._write_aider_env(session, session_dir)
 
     def get_current_session(self) -> Optional[Session]:
         """Get the current active session from .aider-env symlink."""
-        cwd = Path.cwd()
-        aider_env = cwd / ".aider-env"
-
-        if not aider_env.is_symlink():
+        # The symlink points at <cache_dir>/<name>/aider-env, so one readlink names
+        # the session without resolving every path component or scanning cache_dir
+        try:
+            target = Path(os.readlink(".aider-env"))
+        except OSError:
             return None
 
-        # Resolve symlink to get session directory
-        target = aider_env.resolve()
-        session_dir = target.parent
-        session_name = session_dir.name
-
-        return self.get_session(session_name)
+        return self.get_session(target.parent.name)
 
     def set_current_session(self, session: Session):
         """Set the current session by updating .aider-env symlink."""
@@ -209,8 +234,6 @@ class SessionManager:
 
     def _write_aider_env(self, session: Session, session_dir: Path):
         """Write aider environment file."""
-        import os
-
         vllm_port = os.getenv("VLLM_PORT", "8000")
         env_content = f"""# Auto-generated by linode-coder
 export IP="{session.ip}"
@@ -1,16 +1,35 @@
 """SSH utilities for remote command execution."""
 
 import subprocess
+from pathlib import Path
 from typing import Optional
 
 
 class SSHClient:
     """Simple SSH client for executing commands on remote hosts."""
 
-    def __init__(self, host: str, user: str = "root"):
-        """Initialize SSH client."""
+    def __init__(self, host: str, user: str = "root", control_persist: str = "60s"):
+        """Initialize SSH client.
+
+        Commands share the ControlMaster socket used by ``maider tunnel``, so they
+        ride the tunnel's connection when it is up, or the first command opens a
+        master that stays alive for ``control_persist`` to serve the ones after it.
+        """
         self.host = host
         self.user = user
+        self.control_path = Path.home() / ".ssh" / f"llm-master-{user}@{host}"
+        self.control_persist = control_persist
+
+    def multiplex_options(self) -> list[str]:
+        """SSH options that route a call through the shared ControlMaster socket."""
+        return [
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPath={self.control_path}",
+            "-o",
+            f"ControlPersist={self.control_persist}",
+        ]
 
     def run(self, command: str, timeout: int = 30) -> tuple[int, str, str]:
         """Execute a command via SSH.
@@ -24,6 +43,7 @@ class SSHClient:
             "StrictHostKeyChecking=no",
             "-o",
             "ConnectTimeout=5",
+            *self.multiplex_options(),
             f"{self.user}@{self.host}",
             command,
         ]
@@ -192,9 +192,12 @@ def stop_watchdog(session_name: str):
 
 
 def extend_watchdog(session_name: str):
-    """Reset watchdog timer by touching activity file."""
+    """Reset watchdog timer by touching activity file.
+
+    The file is written by SessionManager.record_activity, which replaces it
+    atomically; readers should parse it as a single ``time.time()`` float and
+    treat a missing file as no recorded activity.
+    """
     # This is a simple approach - stop and restart the watchdog
     # In a real implementation, you might use IPC to signal the watchdog
-    cache_dir = CACHE_DIR / session_name
-    activity_file = cache_dir / "last_activity"
-    activity_file.write_text(str(time.time()))
+    SessionManager(CACHE_DIR).record_activity(session_name)
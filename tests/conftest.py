@@ -90,3 +90,22 @@ def isolate_env(monkeypatch):
     ]
     for key in config_keys:
         monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_instances():
+    """Drop process-wide configs and databases cached by earlier tests."""
+    from src.maider.benchmark_db import default_database
+    from src.maider.config import _config_for, _load_project_env
+
+    _config_for.cache_clear()
+    _load_project_env.cache_clear()
+    default_database.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_model_config_cache(monkeypatch, tmp_path):
+    """Keep HuggingFace config lookups from reading or writing the real cache."""
+    monkeypatch.setattr(
+        "src.maider.model_validation.MODEL_CONFIG_CACHE", tmp_path / "model-configs.json"
+    )
@@ -0,0 +1,302 @@
+"""Tests for benchmark command helpers."""
+
+import json
+import statistics
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import click
+import pytest
+import requests
+
+from src.maider.commands import benchmark as benchmark_cmd
+from src.maider.commands.benchmark import BenchmarkPrompt
+
+
+def _prompt(name: str, category: str = "coding") -> BenchmarkPrompt:
+    return BenchmarkPrompt(name=name, category=category, prompt=name, expected_tokens=100)
+
+
+def _record(
+    category: str,
+    tokens_per_sec: float,
+    started_at: float,
+    finished_at: float,
+    cache_primed: bool = False,
+) -> dict:
+    elapsed_time = finished_at - started_at
+    return {
+        "category": category,
+        "success": True,
+        "tokens_per_sec": tokens_per_sec,
+        "elapsed_time": elapsed_time,
+        "completion_tokens": int(tokens_per_sec * elapsed_time),
+        "started_at": started_at,
+        "finished_at": finished_at,
+        "cache_primed": cache_primed,
+    }
+
+
+def _models_response(body) -> Mock:
+    response = Mock()
+    response.content = json.dumps(body).encode()
+    return response
+
+
+@pytest.mark.unit
+class TestAggregateResults:
+    """Test _aggregate_results."""
+
+    def test_percentiles_and_stddev(self):
+        """Test p50/p95/stddev are computed over per-request throughput."""
+        speeds = [10.0, 20.0, 30.0, 40.0]
+        results = [_record("coding", tps, i, i + 1) for i, tps in enumerate(speeds)]
+
+        summary, _ = benchmark_cmd._aggregate_results(results, [_prompt("t")] * 4, 1.0)
+
+        assert summary["avg_tokens_per_sec"] == pytest.approx(25.0)
+        assert summary["p50_tokens_per_sec"] == pytest.approx(25.0)
+        assert summary["p95_tokens_per_sec"] == pytest.approx(38.5)
+        assert summary["stddev_tokens_per_sec"] == pytest.approx(statistics.stdev(speeds))
+        assert summary["tests_passed"] == 4
+        assert summary["tests_total"] == 4
+
+    def test_single_result_has_no_spread(self):
+        """Test that one result reports itself as p95 and zero stddev."""
+        summary, _ = benchmark_cmd._aggregate_results(
+            [_record("coding", 12.0, 0.0, 2.0)], [_prompt("t")], 1.0
+        )
+
+        assert summary["p95_tokens_per_sec"] == 12.0
+        assert summary["stddev_tokens_per_sec"] == 0.0
+
+    def test_wall_time_spans_overlapping_requests(self):
+        """Test wall_time and aggregate throughput for overlapping prompts."""
+        results = [
+            _record("coding", 50.0, 0.0, 2.0),  # 100 tokens
+            _record("reasoning", 25.0, 1.0, 5.0),  # 100 tokens
+        ]
+
+        summary, by_category = benchmark_cmd._aggregate_results(
+            results, [_prompt("a"), _prompt("b", "reasoning")], 1.0
+        )
+
+        assert summary["total_time"] == pytest.approx(6.0)
+        assert summary["wall_time"] == pytest.approx(5.0)
+        assert summary["aggregate_tokens_per_sec"] == pytest.approx(200 / 5.0)
+        assert set(by_category) == {"coding", "reasoning"}
+        assert by_category["coding"]["total_tokens"] == 100
+
+    def test_sequential_cost_uses_per_request_throughput(self):
+        """Test that a sequential run prices tokens at the average request speed."""
+        results = [_record("coding", 20.0, 0.0, 5.0), _record("coding", 20.0, 6.0, 11.0)]
+
+        summary, by_category = benchmark_cmd._aggregate_results(results, [_prompt("t")] * 2, 3.6)
+
+        assert summary["concurrency"] == 1
+        assert summary["cost_per_1k_tokens"] == pytest.approx(
+            benchmark_cmd.calculate_cost_per_1k_tokens(20.0, 3.6)
+        )
+        assert by_category["coding"]["cost_per_1k_tokens"] == summary["cost_per_1k_tokens"]
+
+    def test_concurrent_cost_uses_aggregate_throughput(self):
+        """Test that overlapping prompts share the hourly cost."""
+        # Four 100-token prompts at 20 tok/s each, all in flight at once: 80 tok/s overall
+        results = [_record("coding", 20.0, 0.0, 5.0) for _ in range(4)]
+
+        summary, by_category = benchmark_cmd._aggregate_results(
+            results, [_prompt("t")] * 4, 3.6, concurrency=4
+        )
+
+        assert summary["concurrency"] == 4
+        assert summary["avg_tokens_per_sec"] == pytest.approx(20.0)
+        assert summary["aggregate_tokens_per_sec"] == pytest.approx(80.0)
+        assert summary["cost_per_1k_tokens"] == pytest.approx(
+            benchmark_cmd.calculate_cost_per_1k_tokens(80.0, 3.6)
+        )
+        assert by_category["coding"]["cost_per_1k_tokens"] == pytest.approx(
+            summary["cost_per_1k_tokens"]
+        )
+
+    def test_primed_and_cold_throughput(self):
+        """Test cache-primed and cold prompts are averaged separately."""
+        results = [
+            _record("coding", 10.0, 0.0, 1.0, cache_primed=False),
+            _record("coding", 30.0, 1.0, 2.0, cache_primed=True),
+            _record("coding", 50.0, 2.0, 3.0, cache_primed=True),
+        ]
+
+        summary, _ = benchmark_cmd._aggregate_results(results, [_prompt("t")] * 3, 1.0)
+
+        assert summary["cold_tokens_per_sec"] == pytest.approx(10.0)
+        assert summary["cache_primed_tokens_per_sec"] == pytest.approx(40.0)
+
+    def test_missing_priming_group_is_none(self):
+        """Test that a run with no primed prompts reports None for that group."""
+        summary, _ = benchmark_cmd._aggregate_results(
+            [_record("coding", 10.0, 0.0, 1.0)], [_prompt("t")], 1.0
+        )
+
+        assert summary["cache_primed_tokens_per_sec"] is None
+
+
+@pytest.mark.unit
+class TestResultsWriter:
+    """Test the streamed results file."""
+
+    def test_writes_header_tests_and_trailer(self, temp_dir):
+        """Test that the streamed file is one JSON document in field order."""
+        path = temp_dir / "results.json"
+
+        with benchmark_cmd._ResultsWriter(path, {"session": "s1", "hourly_cost": 1.5}) as writer:
+            writer.write_test({"test_name": "a", "success": True})
+            writer.write_test({"test_name": "b", "success": False})
+            writer.finish({"summary": {"tests_passed": 1}})
+
+        data = json.loads(path.read_text())
+        assert list(data) == ["session", "hourly_cost", "tests", "summary"]
+        assert [t["test_name"] for t in data["tests"]] == ["a", "b"]
+        assert data["summary"] == {"tests_passed": 1}
+
+    def test_empty_tests_array(self, temp_dir):
+        """Test that a run with no records still writes valid JSON."""
+        path = temp_dir / "results.json"
+
+        with benchmark_cmd._ResultsWriter(path, {"session": "s1"}) as writer:
+            writer.finish({"summary": {}})
+
+        assert json.loads(path.read_text())["tests"] == []
+
+    def test_abort_keeps_previous_results(self, temp_dir):
+        """Test that an aborted run neither truncates the old file nor leaves a temp file."""
+        path = temp_dir / "results.json"
+        path.write_text('{"summary": {"tests_passed": 12}}')
+
+        with pytest.raises(click.Abort):
+            with benchmark_cmd._ResultsWriter(path, {"session": "s1"}) as writer:
+                writer.write_test({"test_name": "a", "success": False})
+                raise click.Abort()
+
+        assert json.loads(path.read_text()) == {"summary": {"tests_passed": 12}}
+        assert list(temp_dir.iterdir()) == [path]
+
+    def test_unfinished_run_is_discarded(self, temp_dir):
+        """Test that leaving the block without finish() writes nothing."""
+        path = temp_dir / "results.json"
+
+        with benchmark_cmd._ResultsWriter(path, {"session": "s1"}):
+            pass
+
+        assert list(temp_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+class TestPreflight:
+    """Test the API preflight check."""
+
+    @patch("src.maider.commands.benchmark._SESSION")
+    def test_passes_when_model_is_served(self, mock_session):
+        """Test that the preflight returns when the model is listed."""
+        mock_session.get.return_value = _models_response({"data": [{"id": "coder"}]})
+
+        benchmark_cmd._preflight("http://localhost:8000/v1", "coder")
+
+        mock_session.get.assert_called_once_with("http://localhost:8000/v1/models", timeout=5)
+
+    @patch("src.maider.commands.benchmark._SESSION")
+    def test_aborts_when_model_is_missing(self, mock_session):
+        """Test that a different served model aborts the run."""
+        mock_session.get.return_value = _models_response({"data": [{"id": "other"}]})
+
+        with pytest.raises(click.Abort):
+            benchmark_cmd._preflight("http://localhost:8000/v1", "coder")
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            [{"id": "coder"}],
+            {"data": {"id": "coder"}},
+            "ready",
+        ],
+    )
+    @patch("src.maider.commands.benchmark._SESSION")
+    def test_aborts_on_malformed_body(self, mock_session, body):
+        """Test that a JSON body of the wrong shape is treated as not reachable."""
+        mock_session.get.return_value = _models_response(body)
+
+        with pytest.raises(click.Abort):
+            benchmark_cmd._preflight("http://localhost:8000/v1", "coder")
+
+    @patch("src.maider.commands.benchmark._SESSION")
+    def test_ignores_malformed_entries(self, mock_session):
+        """Test that entries without a string id are skipped when listing models."""
+        mock_session.get.return_value = _models_response(
+            {"data": ["coder", {"object": "model"}, {"id": 7}, {"id": "other"}]}
+        )
+
+        with patch("src.maider.commands.benchmark.console") as mock_console:
+            with pytest.raises(click.Abort):
+                benchmark_cmd._preflight("http://localhost:8000/v1", "coder")
+
+        printed = [call.args[0] for call in mock_console.print.call_args_list]
+        assert "  Available: other" in printed
+
+    @patch("src.maider.commands.benchmark._SESSION")
+    def test_passes_when_entries_are_malformed_but_model_listed(self, mock_session):
+        """Test that a valid entry for the model is found among malformed ones."""
+        mock_session.get.return_value = _models_response({"data": [None, {"id": "coder"}]})
+
+        benchmark_cmd._preflight("http://localhost:8000/v1", "coder")
+
+    @patch("src.maider.commands.benchmark._SESSION")
+    def test_aborts_when_api_unreachable(self, mock_session):
+        """Test that a connection error aborts the run."""
+        mock_session.get.side_effect = requests.exceptions.ConnectionError("refused")
+
+        with pytest.raises(click.Abort):
+            benchmark_cmd._preflight("http://localhost:8000/v1", "coder")
+
+
+@pytest.mark.unit
+class TestSelectTests:
+    """Test _select_tests."""
+
+    def test_all_returns_every_prompt(self):
+        assert benchmark_cmd._select_tests("all") == benchmark_cmd.TEST_PROMPTS
+
+    def test_category_filter(self):
+        selected = benchmark_cmd._select_tests("Reasoning")
+
+        assert selected
+        assert {test.category for test in selected} == {"reasoning"}
+
+
+@pytest.mark.unit
+class TestParseApiSettings:
+    """Test _parse_api_settings."""
+
+    def test_reads_exports(self, temp_dir):
+        env_file = temp_dir / "aider-env"
+        env_file.write_text(
+            'export OPENAI_API_BASE="http://localhost:8000/v1"\nexport AIDER_MODEL=openai/coder\n'
+        )
+
+        settings = benchmark_cmd._parse_api_settings(str(env_file), env_file.stat().st_mtime_ns)
+
+        assert settings == ("http://localhost:8000/v1", "coder")
+
+
+@pytest.mark.unit
+class TestOutputHeader:
+    """Test _build_output_header."""
+
+    def test_records_concurrency(self):
+        session = Mock(model_id="m", type="g1-gpu-rtx6000-1", hourly_cost=1.5)
+        session.name = "s1"
+
+        header = benchmark_cmd._build_output_header(
+            session, "all", datetime(2025, 1, 1, tzinfo=timezone.utc), concurrency=8
+        )
+
+        assert header["concurrency"] == 8
+        assert header["session"] == "s1"
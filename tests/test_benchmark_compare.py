@@ -0,0 +1,66 @@
+"""Tests for benchmark-compare command."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.maider.benchmark_db import BenchmarkDatabase
+from src.maider.commands.benchmark_compare import cmd as benchmark_compare_cmd
+
+
+def _add_results(db: BenchmarkDatabase, count: int):
+    for index in range(count):
+        db.add_result(
+            db.create_result(
+                gpu_type=f"g1-gpu-rtx6000-{index % 2 + 1}",
+                gpu_count=index % 2 + 1,
+                vram_per_gpu=24,
+                hourly_cost=1.5,
+                model_id="Qwen/Qwen2.5-Coder-14B-Instruct-AWQ",
+                model_category="14b",
+                vllm_config={"tensor_parallel_size": 1},
+                results_by_category={},
+                summary={"avg_tokens_per_sec": float(index), "tests_passed": 1, "tests_total": 1},
+                tests=[],
+            )
+        )
+
+
+@pytest.mark.unit
+class TestBenchmarkCompare:
+    """Test benchmark-compare command."""
+
+    @pytest.fixture
+    def db(self, temp_dir):
+        """Create a database with more results than the table shows."""
+        db = BenchmarkDatabase(temp_dir / "benchmark-database.json")
+        _add_results(db, 150)
+        with patch("src.maider.commands.benchmark_compare.default_database", return_value=db):
+            yield db
+
+    def test_export_writes_every_result(self, db, temp_dir):
+        """Test that exports are not capped at the table's 100 rows."""
+        output = temp_dir / "results.json"
+
+        benchmark_compare_cmd(None, None, None, "tokens_per_sec", "json", str(output))
+
+        exported = json.loads(output.read_text())
+        assert len(exported) == 150
+        speeds = [row["summary"]["avg_tokens_per_sec"] for row in exported]
+        assert speeds == sorted(speeds, reverse=True)
+
+    def test_export_applies_filters(self, db, temp_dir):
+        """Test that filtered exports keep every matching result."""
+        output = temp_dir / "results.csv"
+
+        benchmark_compare_cmd("g1-gpu-rtx6000-2", None, None, "tokens_per_sec", "csv", str(output))
+
+        assert len(output.read_text().splitlines()) == 75 + 1  # rows plus header
+
+    def test_table_shows_top_hundred(self, db):
+        """Test that the table view still ranks only the top 100 rows."""
+        with patch("src.maider.commands.benchmark_compare._display_table") as mock_display:
+            benchmark_compare_cmd(None, None, None, "tokens_per_sec", "table", None)
+
+        assert len(mock_display.call_args[0][0]) == 100
@@ -2,11 +2,12 @@
 
 import json
 import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
-from src.maider.benchmark_db import BenchmarkDatabase, BenchmarkResult
+from src.maider.benchmark_db import BenchmarkDatabase, BenchmarkResult, SummaryMetrics
 
 
 class TestBenchmarkDatabase:
@@ -91,6 +92,22 @@ class TestBenchmarkDatabase:
         assert result.id  # Should have UUID
         assert result.timestamp  # Should have timestamp
 
+    def test_create_result_with_timestamp(self, temp_db, sample_result):
+        """Test creating a result with an explicit run timestamp."""
+        run_started_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        result = temp_db.create_result(**sample_result, timestamp=run_started_at)
+
+        assert result.timestamp == "2025-01-02T03:04:05+00:00"
+        assert result.timestamp_ns == 1735787045 * 1_000_000_000
+
+    def test_result_metrics(self, temp_db, sample_result):
+        """Test the typed summary view falls back to 0 for missing fields."""
+        result = temp_db.create_result(**sample_result)
+        assert result.metrics.avg_tokens_per_sec == sample_result["summary"]["avg_tokens_per_sec"]
+
+        result.summary = {}
+        assert result.metrics == SummaryMetrics()
+
     def test_add_result(self, temp_db, sample_result):
         """Test adding a result to database."""
         result = temp_db.create_result(**sample_result)
@@ -121,6 +138,18 @@ class TestBenchmarkDatabase:
         assert len(results) == 2
         assert all(isinstance(r, BenchmarkResult) for r in results)
 
+    def test_count_results(self, temp_db, sample_result):
+        """Test counting results, skipping malformed rows."""
+        assert temp_db.count_results() == 0
+
+        temp_db.add_result(temp_db.create_result(**sample_result))
+        data = json.loads(temp_db.db_path.read_text())
+        data["benchmarks"].append({"id": "broken"})
+        temp_db.db_path.write_text(json.dumps(data))
+
+        assert temp_db.count_results() == 1
+        assert temp_db.count_results() == len(temp_db.get_results())
+
     def test_get_results_with_filters(self, temp_db, sample_result):
         """Test retrieving results with filters."""
         # Add two different GPU types
@@ -149,6 +178,35 @@ class TestBenchmarkDatabase:
         coding_results = temp_db.get_results(task_category="coding")
         assert len(coding_results) == 2  # Both have coding results
 
+    def test_get_results_combined_filters(self, temp_db, sample_result):
+        """Test combining indexed filters after incremental adds."""
+        temp_db.add_result(temp_db.create_result(**sample_result))
+
+        # Query once so later adds extend the in-memory indexes
+        assert len(temp_db.get_results(gpu_type="g1-gpu-rtx6000-2")) == 1
+
+        result2_data = sample_result.copy()
+        result2_data["model_category"] = "30b"
+        result2_data["results_by_category"] = {"reasoning": {"avg_tokens_per_sec": 40.0}}
+        temp_db.add_result(temp_db.create_result(**result2_data))
+
+        assert len(temp_db.get_results(gpu_type="g1-gpu-rtx6000-2")) == 2
+        assert len(temp_db.get_results(gpu_type="g1-gpu-rtx6000-2", model_category="30b")) == 1
+        assert len(temp_db.get_results(model_category="30b", task_category="coding")) == 0
+        assert len(temp_db.get_results(task_category="reasoning")) == 2
+        assert temp_db.get_results(gpu_type="unknown") == []
+
+    def test_get_results_reloads_after_external_write(self, temp_db, sample_result):
+        """Test cached results are refreshed when another writer changes the file."""
+        temp_db.add_result(temp_db.create_result(**sample_result))
+        assert len(temp_db.get_results()) == 1
+
+        # Simulate a second process adding a result
+        other = BenchmarkDatabase(temp_db.db_path)
+        other.add_result(other.create_result(**sample_result))
+
+        assert len(temp_db.get_results()) == 2
+
     def test_get_best_by_metric(self, temp_db, sample_result):
         """Test getting best results by metric."""
         # Add results with different performance
@@ -178,6 +236,47 @@ class TestBenchmarkDatabase:
         assert len(best_eff) == 1
         # RTX4000 should have better efficiency (38/1.04 = 36.5 vs 43.7/3.0 = 14.6)
         assert best_eff[0].gpu_type == "g2-gpu-rtx4000a2-s"
+        assert best_eff[0].cost_efficiency == pytest.approx(38.0 / 1.04)
+
+        # Filters narrow the candidates before ranking
+        best_rtx6000 = temp_db.get_best_by_metric("cost_efficiency", gpu_type="g1-gpu-rtx6000-2")
+        assert [r.gpu_type for r in best_rtx6000] == ["g1-gpu-rtx6000-2"]
+        assert temp_db.get_best_by_metric("tokens_per_sec", model_category="30b") == []
+
+    def test_get_best_by_metric_matches_full_sort(self, temp_db, sample_result):
+        """Test the pre-sorted metric order agrees with ranking the filtered rows."""
+        speeds = [40.0, 55.0, 40.0, 20.0, 55.0]
+        for index, speed in enumerate(speeds):
+            data = dict(sample_result, summary={**sample_result["summary"]})
+            data["gpu_type"] = f"gpu-{index % 2}"
+            data["summary"]["avg_tokens_per_sec"] = speed
+            temp_db.add_result(temp_db.create_result(**data))
+        results = temp_db.get_results()
+
+        best = temp_db.get_best_by_metric("tokens_per_sec", limit=3)
+        assert best == sorted(results, key=lambda r: -r.summary["avg_tokens_per_sec"])[:3]
+
+        slowest = temp_db.get_best_by_metric("tokens_per_sec", limit=2, ascending=True)
+        assert slowest == sorted(results, key=lambda r: r.summary["avg_tokens_per_sec"])[:2]
+
+        gpu0 = temp_db.get_best_by_metric("tokens_per_sec", gpu_type="gpu-0")
+        assert [r.summary["avg_tokens_per_sec"] for r in gpu0] == [55.0, 40.0, 40.0]
+
+        # limit=None returns every match, through both the pre-sorted and ranked paths
+        assert temp_db.get_best_by_metric("tokens_per_sec", limit=None) == sorted(
+            results, key=lambda r: -r.summary["avg_tokens_per_sec"]
+        )
+        gpu1 = temp_db.get_best_by_metric("tokens_per_sec", limit=None, gpu_type="gpu-1")
+        assert [r.summary["avg_tokens_per_sec"] for r in gpu1] == [55.0, 20.0]
+
+        # Adding a result invalidates the pre-sorted order
+        data = dict(sample_result, summary={**sample_result["summary"]})
+        data["summary"]["avg_tokens_per_sec"] = 99.0
+        temp_db.add_result(temp_db.create_result(**data))
+        assert (
+            temp_db.get_best_by_metric("tokens_per_sec", limit=1)[0].summary["avg_tokens_per_sec"]
+            == 99.0
+        )
 
     def test_get_coverage_report(self, temp_db, sample_result):
         """Test coverage report generation."""
@@ -211,6 +310,34 @@ class TestBenchmarkDatabase:
         assert coverage["gpu_types_tested"] == 1  # Still 1 unique type
         assert len(coverage["tested_configs"]) == 1
         assert coverage["tested_configs"][0]["count"] == 2
+        assert coverage["confidence_counts"] == {"high": 0, "medium": 1, "low": 0}
+
+        # Unchanged database reuses the report
+        assert temp_db.get_coverage_report() is coverage
+
+    def test_get_coverage_report_legacy_timestamps(self, temp_db, sample_result):
+        """Test rows written without timestamp_ns are ordered by their ISO timestamp."""
+        older = temp_db.create_result(**sample_result)
+        newer_data = sample_result.copy()
+        newer_data["gpu_type"] = "g2-gpu-rtx4000a1-s"
+        newer = temp_db.create_result(**newer_data)
+
+        older_dict = vars(older).copy()
+        newer_dict = vars(newer).copy()
+        older_dict["timestamp"] = "2026-01-01T10:00:00"
+        newer_dict["timestamp"] = "2026-01-02T10:00:00"
+        del older_dict["timestamp_ns"]
+        del newer_dict["timestamp_ns"]
+        temp_db.db_path.write_text(
+            json.dumps({"version": "1.0", "benchmarks": [older_dict, newer_dict]})
+        )
+
+        coverage = temp_db.get_coverage_report()
+        assert [c["gpu_type"] for c in coverage["tested_configs"]] == [
+            "g2-gpu-rtx4000a1-s",
+            "g1-gpu-rtx6000-2",
+        ]
+        assert coverage["tested_configs"][0]["last_run"] == "2026-01-02T10:00:00"
 
     def test_export_json(self, temp_db, sample_result):
         """Test JSON export."""
@@ -233,7 +360,7 @@ class TestBenchmarkDatabase:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output = Path(tmpdir) / "export.csv"
-            temp_db.export("csv", output)
+            assert temp_db.export("csv", output) == 1
 
             assert output.exists()
             content = output.read_text()
@@ -255,6 +382,19 @@ class TestBenchmarkDatabase:
             assert "g1-gpu-rtx6000-2" in content
             assert "| " in content  # Markdown table format
 
+    def test_export_given_results(self, temp_db, sample_result):
+        """Test export writes the supplied results instead of re-querying."""
+        temp_db.add_result(temp_db.create_result(**sample_result))
+        temp_db.add_result(temp_db.create_result(**{**sample_result, "gpu_type": "other-gpu"}))
+        selected = temp_db.get_results(gpu_type="other-gpu")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "export.json"
+            assert temp_db.export("json", output, results=selected) == 1
+
+            data = json.loads(output.read_text())
+            assert [row["gpu_type"] for row in data] == ["other-gpu"]
+
     def test_concurrent_writes(self, temp_db, sample_result):
         """Test file locking prevents concurrent write issues."""
         # This test verifies atomic writes work
@@ -1,10 +1,12 @@
 """Tests for check command helpers."""
 
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from src.maider.commands import check as check_cmd
+from src.maider.gpu_utils import GPUInfo
 
 
 class TestCheckHelpers:
@@ -18,24 +20,101 @@ class TestCheckHelpers:
             check_cmd._get_session_or_exit(mock_sm_instance, "missing")
 
     def test_print_gpu_memory_usage_empty(self):
-        gpu_monitor = Mock()
-        gpu_monitor.get_gpu_info.return_value = []
-
         with pytest.raises(SystemExit):
-            check_cmd._print_gpu_memory_usage(gpu_monitor)
+            check_cmd._print_gpu_memory_usage([])
+
+    def test_gpu_row_styles_status_without_markup(self):
+        gpu = GPUInfo(
+            index=0, name="A100", memory_used_mb=50, memory_total_mb=1000, utilization_percent=7
+        )
+
+        row = check_cmd._gpu_row(gpu)
+
+        assert row[0] == "GPU 0"
+        assert row[5] == "7%"
+        assert (row[4].plain, row[4].style) == ("IDLE", "red")
+
+    @pytest.mark.parametrize(
+        "memory_pct, expected",
+        [
+            (0.0, ("red", "IDLE")),
+            (9.9, ("red", "IDLE")),
+            (10.0, ("yellow", "10%")),
+            (49.9, ("yellow", "50%")),
+            (50.0, ("green", "50%")),
+            (100.0, ("green", "100%")),
+        ],
+    )
+    def test_memory_status_bands(self, memory_pct, expected):
+        assert check_cmd._memory_status(memory_pct) == expected
 
-    @patch("src.maider.commands.check.requests.post")
-    def test_run_throughput_test_http_error(self, mock_post):
-        mock_post.return_value = Mock(status_code=500, json=Mock(return_value={}))
+    @patch("src.maider.commands.check.console")
+    @patch("src.maider.commands.check._http_session")
+    def test_throughput_reports_http_error(self, mock_http_session, mock_console):
+        response = MagicMock(status_code=500)
+        response.__enter__.return_value = response
+        mock_http_session.return_value.post.return_value = response
         session = Mock(served_model_name="coder")
 
-        check_cmd._run_throughput_test(session)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            check_cmd._print_throughput(executor.submit(check_cmd._measure_throughput, session))
 
-    @patch("src.maider.commands.check.requests.post")
-    def test_run_throughput_test_request_exception(self, mock_post):
+        printed = [call.args[0] for call in mock_console.print.call_args_list]
+        assert "  [red]✗[/red] API test failed: 500" in printed
+
+    @patch("src.maider.commands.check.console")
+    @patch("src.maider.commands.check._http_session")
+    def test_throughput_reports_request_exception(self, mock_http_session, mock_console):
         from requests.exceptions import RequestException
 
-        mock_post.side_effect = RequestException("network down")
+        mock_http_session.return_value.post.side_effect = RequestException("network down")
         session = Mock(served_model_name="coder")
 
-        check_cmd._run_throughput_test(session)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            check_cmd._print_throughput(executor.submit(check_cmd._measure_throughput, session))
+
+        printed = [call.args[0] for call in mock_console.print.call_args_list]
+        assert "  [red]✗[/red] API test failed: network down" in printed
+
+    def test_http_session_is_reused_without_retries(self):
+        session = check_cmd._http_session()
+
+        assert check_cmd._http_session() is session
+        assert session.get_adapter("http://localhost:8000").max_retries.total == 0
+
+    def test_read_completion_stream_uses_usage_chunk(self):
+        response = Mock()
+        response.iter_lines.return_value = [
+            b'data: {"choices": [{"text": "print"}]}',
+            b"",
+            b'data: {"choices": [{"text": "()"}]}',
+            b'data: {"choices": [], "usage": {"completion_tokens": 3}}',
+            b"data: [DONE]",
+        ]
+
+        tokens, first_token_at = check_cmd._read_completion_stream(response)
+
+        assert tokens == 3
+        assert first_token_at is not None
+
+    def test_read_completion_stream_counts_chunks_without_usage(self):
+        response = Mock()
+        response.iter_lines.return_value = [
+            b'data: {"choices": [{"text": ""}]}',
+            b'data: {"choices": [{"text": "a"}]}',
+            b'data: {"choices": [{"text": "b"}]}',
+        ]
+
+        assert check_cmd._read_completion_stream(response)[0] == 2
+
+    def test_read_completion_stream_aborts_without_first_token(self):
+        from requests.exceptions import Timeout
+
+        response = Mock()
+        response.iter_lines.return_value = [b'data: {"choices": [{"text": ""}]}'] * 2
+
+        with pytest.raises(Timeout):
+            check_cmd._read_completion_stream(response, deadline=0.0)
+
+    def test_format_rates_excludes_ttft_from_decode_rate(self):
+        assert check_cmd._format_rates(11, 3.0, 1.0) == "TTFT 1000 ms, 5.0 tok/s, ITL 200.0 ms"
@@ -0,0 +1,86 @@
+"""Tests for cleanup command helpers."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.maider.commands import cleanup as cleanup_cmd
+from src.maider.session import SessionManager
+
+
+@pytest.mark.unit
+class TestFastRmdir:
+    def test_removes_flat_session_dir(self, temp_dir: Path):
+        session_dir = temp_dir / "session"
+        session_dir.mkdir()
+        (session_dir / "state.json").write_text("{}")
+        (session_dir / "last_activity").write_text("0")
+
+        cleanup_cmd._fast_rmdir(session_dir)
+
+        assert not session_dir.exists()
+
+    def test_falls_back_for_nested_dirs(self, temp_dir: Path):
+        session_dir = temp_dir / "session"
+        (session_dir / "logs").mkdir(parents=True)
+        (session_dir / "logs" / "vllm.log").write_text("")
+        (session_dir / "state.json").write_text("{}")
+
+        cleanup_cmd._fast_rmdir(session_dir)
+
+        assert not session_dir.exists()
+
+
+@pytest.mark.unit
+class TestForceRemoveSession:
+    @patch("src.maider.commands.cleanup.click.confirm")
+    @patch("src.maider.commands.cleanup.sys.stdin")
+    def test_non_tty_removes_without_prompt(self, mock_stdin, mock_confirm, temp_dir: Path):
+        mock_stdin.isatty.return_value = False
+        (temp_dir / "session").mkdir()
+        session_mgr = Mock(cache_dir=temp_dir)
+
+        cleanup_cmd._force_remove_session(session_mgr, "session", Mock(linode_id=123))
+
+        mock_confirm.assert_not_called()
+        assert not (temp_dir / "session").exists()
+
+    @patch("src.maider.commands.cleanup.click.confirm", return_value=False)
+    @patch("src.maider.commands.cleanup.sys.stdin")
+    def test_tty_declined_keeps_session(self, mock_stdin, mock_confirm, temp_dir: Path):
+        mock_stdin.isatty.return_value = True
+        (temp_dir / "session").mkdir()
+        session_mgr = Mock(cache_dir=temp_dir)
+
+        cleanup_cmd._force_remove_session(session_mgr, "session", Mock(linode_id=123))
+
+        assert (temp_dir / "session").exists()
+
+
+@pytest.mark.unit
+class TestBulkCleanup:
+    def _make_session(self, session_mgr, name: str, linode_id: int):
+        session_mgr.create_session(name=name, linode_id=linode_id)
+
+    @patch("src.maider.commands.cleanup._get_linode_manager")
+    def test_recent_sessions_skip_linode_lookup(self, mock_get_mgr, temp_dir: Path):
+        session_mgr = SessionManager(cache_dir=temp_dir)
+        self._make_session(session_mgr, "fresh", 1)
+
+        cleanup_cmd._cleanup_bulk_sessions(session_mgr, min_age=300)
+
+        mock_get_mgr.assert_not_called()
+        assert (temp_dir / "fresh").exists()
+
+    @patch("src.maider.commands.cleanup._get_linode_manager")
+    def test_min_age_zero_removes_missing_vms(self, mock_get_mgr, temp_dir: Path):
+        session_mgr = SessionManager(cache_dir=temp_dir)
+        self._make_session(session_mgr, "gone", 1)
+        self._make_session(session_mgr, "alive", 2)
+        mock_get_mgr.return_value.list_instance_ids.return_value = {2}
+
+        cleanup_cmd._cleanup_bulk_sessions(session_mgr, min_age=0)
+
+        assert not (temp_dir / "gone").exists()
+        assert (temp_dir / "alive").exists()
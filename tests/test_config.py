@@ -4,7 +4,7 @@ import math
 
 import pytest
 
-from src.maider.config import Config
+from src.maider.config import Config, default_config
 
 
 @pytest.mark.unit
@@ -124,3 +124,28 @@ MODEL_ID=Qwen/Qwen2.5-Coder-32B-Instruct-AWQ
 
         assert len(errors) > 0
         assert any("LINODE_TOKEN" in error for error in errors)
+
+    def test_default_config_shared_per_directory(self, temp_dir, mock_env_file, monkeypatch):
+        """Test that default_config reuses one instance per project directory."""
+        monkeypatch.chdir(temp_dir)
+
+        config = default_config()
+
+        assert default_config() is config
+        assert config.project_dir == temp_dir
+
+        other_dir = temp_dir / "other"
+        other_dir.mkdir()
+        monkeypatch.chdir(other_dir)
+        assert default_config() is not config
+
+    def test_default_config_sees_env_changes(self, temp_dir, mock_env_file, monkeypatch):
+        """Test that a changed environment variable is not served from the cache."""
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setenv("LINODE_TOKEN", "first_token")
+        config = default_config()
+
+        monkeypatch.setenv("LINODE_TOKEN", "second_token")
+
+        assert default_config() is not config
+        assert default_config().linode_token == "second_token"
@@ -0,0 +1,32 @@
+"""Tests for json_utils module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.maider.json_utils import json_dumps, json_loads
+
+
+@pytest.mark.unit
+class TestJsonHelpers:
+    """Test the orjson-or-json helpers."""
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_round_trip(self, indent):
+        """Test that dumped bytes parse back to the same data."""
+        data = {"name": "coder", "tokens": [1, 2, 3], "nested": {"ok": True}}
+
+        raw = json_dumps(data, indent=indent)
+
+        assert isinstance(raw, bytes)
+        assert json_loads(raw) == data
+
+    def test_stdlib_fallback_matches_orjson_layout(self):
+        """Test that the json fallback produces compact and 2-space indented output."""
+        data = {"a": [1, 2]}
+
+        with patch("src.maider.json_utils.orjson", None):
+            assert json_dumps(data) == b'{"a":[1,2]}'
+            assert json_dumps(data, indent=True) == json.dumps(data, indent=2).encode()
+            assert json_loads(b'{"a": [1, 2]}') == data
@@ -108,6 +108,32 @@ class TestLinodeManager:
             assert instance.id == 12345
             mock_client.load.assert_called_once_with(Instance, 12345)
 
+    def test_list_instance_ids(self, mock_config, mock_client, mock_console):
+        mock_client.linode.instances.return_value = [
+            Instance(mock_client, 1, {}),
+            Instance(mock_client, 2, {}),
+        ]
+        with (
+            patch("src.maider.linode_client.LinodeClient", return_value=mock_client),
+            patch("src.maider.linode_client.Console", return_value=mock_console),
+        ):
+            manager = LinodeManager(config=mock_config)
+            assert manager.list_instance_ids() == {1, 2}
+            mock_client.linode.instances.assert_called_once_with()
+
+    def test_list_instance_statuses(self, mock_config, mock_client, mock_console):
+        mock_client.linode.instances.return_value = [
+            MagicMock(id=1, status="running"),
+            MagicMock(id=2, status="offline"),
+        ]
+        with (
+            patch("src.maider.linode_client.LinodeClient", return_value=mock_client),
+            patch("src.maider.linode_client.Console", return_value=mock_console),
+        ):
+            manager = LinodeManager(config=mock_config)
+            assert manager.list_instance_statuses() == {1: "running", 2: "offline"}
+            mock_client.linode.instances.assert_called_once_with()
+
     def test_delete_instance(self, mock_config, mock_provider, mock_console):
         with (
             patch("src.maider.linode_client.LinodeProvider", return_value=mock_provider),
@@ -0,0 +1,52 @@
+"""Tests for list-types command helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.maider.commands import list_types as list_types_cmd
+
+
+def _vm_type(**overrides):
+    values = {
+        "id": "g2-gpu-rtx4000a2-s",
+        "name": "RTX4000 Ada x2 Small",
+        "gpus": 2,
+        "vram_per_gpu": 20,
+        "total_vram": 40,
+        "hourly_cost": 1.04,
+        "available_in_regions": ["us-ord", "de-fra-2", "us-sea", "jp-osa"],
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.unit
+class TestListTypesHelpers:
+    def test_type_rows_summarises_regions(self):
+        rows = list_types_cmd._type_rows([_vm_type()])
+
+        assert rows == [
+            (
+                "g2-gpu-rtx4000a2-s",
+                "RTX4000 Ada x2 Small",
+                "2",
+                "20GB",
+                "40GB",
+                "$1.04",
+                "de-fra-2, jp-osa, us-ord +1",
+            )
+        ]
+
+    def test_plain_listing_aligns_columns(self):
+        rows = list_types_cmd._type_rows(
+            [_vm_type(), _vm_type(id="g1-gpu-rtx6000-4", gpus=4, available_in_regions=["us-ord"])]
+        )
+
+        lines = list_types_cmd._plain_types_listing(rows).splitlines()
+
+        assert lines[0].startswith("Type ID")
+        assert len(lines) == 3
+        # Right-aligned GPU counts line up under their header
+        gpus_end = lines[0].index("GPUs") + len("GPUs")
+        assert [line[gpus_end - 1] for line in lines[1:]] == ["2", "4"]
@@ -199,6 +199,45 @@ class TestFetchModelConfig:
         assert "Authorization" in call_kwargs["headers"]
         assert "Bearer test_token" in call_kwargs["headers"]["Authorization"]
 
+    @patch("src.maider.model_validation.requests.get")
+    def test_successful_fetch_is_cached(self, mock_get):
+        """Test that a second lookup for the same model is served from disk."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"max_position_embeddings": 4096}
+        mock_get.return_value = mock_response
+
+        fetch_model_config("test/model")
+        config = fetch_model_config("test/model")
+
+        mock_get.assert_called_once()
+        assert config.max_position_embeddings == 4096
+        assert config.error is None
+
+    @patch("src.maider.model_validation.requests.get")
+    def test_expired_cache_entry_is_refetched(self, mock_get):
+        """Test that entries older than the TTL trigger a new fetch."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"max_position_embeddings": 4096}
+        mock_get.return_value = mock_response
+
+        with patch("src.maider.model_validation.time.time", return_value=0):
+            fetch_model_config("test/model")
+        fetch_model_config("test/model")
+
+        assert mock_get.call_count == 2
+
+    @patch("src.maider.model_validation.requests.get")
+    def test_errors_are_not_cached(self, mock_get):
+        """Test that failed lookups are retried on the next call."""
+        mock_get.return_value = Mock(status_code=404)
+
+        fetch_model_config("test/model")
+        fetch_model_config("test/model")
+
+        assert mock_get.call_count == 2
+
 
 @pytest.mark.unit
 class TestValidateMaxModelLen:
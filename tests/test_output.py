@@ -48,6 +48,12 @@ class TestQuietConsole:
         qc.quiet = True
         qc.rule("Test")  # Should not raise
 
+    def test_unknown_attributes_delegate_to_rich_console(self):
+        """Attributes QuietConsole does not define come from the rich Console."""
+        qc = QuietConsole()
+        qc._console.get_time = lambda: 1.0
+        assert qc.get_time() == 1.0
+
 
 class TestGlobalQuiet:
     """Test global quiet mode functions."""
@@ -159,6 +159,35 @@ class TestSessionManager:
         assert not session_dir.exists()
         assert session_mgr.get_session("test-session") is None
 
+    def test_get_session_served_from_list_cache(self, temp_dir, mock_session_data):
+        """Test that list_sessions primes get_session and writes invalidate it."""
+        session_mgr = SessionManager(cache_dir=temp_dir)
+        session_mgr.create_session(name="test-session", linode_id=1)
+
+        listed = session_mgr.list_sessions()
+        (temp_dir / "test-session" / "state.json").write_text("{}")
+
+        assert session_mgr.get_session("test-session") is listed[0]
+
+        session_mgr.delete_session("test-session")
+        assert session_mgr.get_session("test-session") is None
+        assert session_mgr.list_sessions() == []
+
+    def test_record_activity(self, temp_dir, mock_session_data):
+        """Test stamping the last-activity file atomically."""
+        session_mgr = SessionManager(cache_dir=temp_dir)
+        session_mgr.create_session(
+            name=mock_session_data["name"],
+            linode_id=mock_session_data["linode_id"],
+        )
+
+        before = time.time()
+        activity_file = session_mgr.record_activity("test-session")
+
+        assert activity_file == temp_dir / "test-session" / "last_activity"
+        assert float(activity_file.read_text()) >= before
+        assert not activity_file.with_suffix(".tmp").exists()
+
     def test_update_session_model(self, temp_dir, mock_session_data):
         """Test updating model information for a session."""
         session_mgr = SessionManager(cache_dir=temp_dir)
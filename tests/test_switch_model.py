@@ -1,7 +1,10 @@
 """Tests for switch-model command."""
 
+import io
 import json
+import os
 import subprocess
+import tarfile
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +14,7 @@ from src.maider.commands.switch_model import cmd as switch_model_cmd
 from src.maider.commands import switch_model as switch_model_module
 from src.maider.model_validation import ValidationResult
 from src.maider.session import SessionManager
+from src.maider.ssh_utils import SSHClient
 
 
 def _make_valid_validation_result(model_id: str, max_len: int) -> ValidationResult:
@@ -35,7 +39,7 @@ class TestSwitchModel:
     @pytest.fixture
     def mock_config(self, temp_dir, mock_env_file, mock_secrets_file):
         """Create mock config."""
-        with patch("src.maider.commands.switch_model.Config") as mock:
+        with patch("src.maider.commands.switch_model.default_config") as mock:
             config = Mock()
             config.model_id = "Qwen/Qwen2.5-Coder-32B-Instruct-AWQ"
             config.vllm_max_model_len = 32768
@@ -128,11 +132,9 @@ class TestSwitchModel:
 
         # Mock subprocess calls - note: session update now happens before API wait
         mock_subprocess.side_effect = [
-            Mock(returncode=0, stdout="", stderr=""),  # scp upload docker-compose
-            Mock(returncode=0, stdout="", stderr=""),  # scp env upload
+            Mock(returncode=0, stdout="", stderr=""),  # ssh tar -x docker-compose.yml and .env
             Mock(returncode=0, stdout="", stderr=""),  # docker restart
             Mock(returncode=0, stdout='{"data": [{"id": "coder"}]}', stderr=""),  # curl (waiting)
-            Mock(returncode=0, stdout='{"data": [{"id": "coder"}]}', stderr=""),  # curl (verify)
         ]
 
         with patch("src.maider.commands.switch_model.SessionManager") as mock_sm:
@@ -149,6 +151,9 @@ class TestSwitchModel:
 
             assert result.exit_code == 0
             assert "Successfully switched" in result.output
+            assert "Model loaded: coder" in result.output
+            assert "Generated .aider.model.metadata.json" in result.output
+            assert (temp_dir / ".aider.model.metadata.json").exists()
 
             # Verify update_session_model was called
             mock_sm_instance.update_session_model.assert_called_once()
@@ -169,11 +174,9 @@ class TestSwitchModel:
 
         # Mock subprocess calls - note: session update now happens before API wait
         mock_subprocess.side_effect = [
-            Mock(returncode=0, stdout="", stderr=""),  # scp upload docker-compose
-            Mock(returncode=0, stdout="", stderr=""),  # scp env upload
+            Mock(returncode=0, stdout="", stderr=""),  # ssh tar -x docker-compose.yml and .env
             Mock(returncode=0, stdout="", stderr=""),  # docker restart
             Mock(returncode=0, stdout='{"data": [{"id": "coder"}]}', stderr=""),  # curl (waiting)
-            Mock(returncode=0, stdout='{"data": [{"id": "coder"}]}', stderr=""),  # curl (verify)
         ]
 
         with patch("src.maider.commands.switch_model.SessionManager") as mock_sm:
@@ -221,11 +224,11 @@ class TestSwitchModel:
         self, mock_subprocess, runner, temp_dir, mock_config, mock_session, mock_validation
     ):
         """Test error when docker-compose upload fails."""
-        # Mock failed scp
+        # Mock failed ssh tar upload
         mock_subprocess.return_value = Mock(
             returncode=1,
-            stdout="",
-            stderr="Connection refused",
+            stdout=b"",
+            stderr=b"Connection refused",
         )
 
         with patch("src.maider.commands.switch_model.SessionManager") as mock_sm:
@@ -249,8 +252,7 @@ class TestSwitchModel:
         """Test error when container restart fails."""
         # Mock successful upload, failed restart
         mock_subprocess.side_effect = [
-            Mock(returncode=0, stdout="", stderr=""),  # scp success
-            Mock(returncode=0, stdout="", stderr=""),  # scp env success
+            Mock(returncode=0, stdout="", stderr=""),  # ssh tar -x upload success
             Mock(returncode=1, stdout="", stderr="Docker daemon not running"),  # restart fail
         ]
 
@@ -268,6 +270,31 @@ class TestSwitchModel:
             assert result.exit_code == 1
             assert "Failed to restart" in result.output
 
+    @patch("src.maider.commands.switch_model.subprocess.run")
+    def test_upload_files_streams_single_tar(self, mock_subprocess):
+        """Test that both runtime files go to the VM as one tar over one ssh call."""
+        mock_subprocess.return_value = Mock(returncode=0, stdout=b"", stderr=b"")
+
+        switch_model_module._upload_files(
+            "192.0.2.1", {"docker-compose.yml": "services: {}", ".env": "HF_TOKEN=x"}, "/opt/llm/"
+        )
+
+        mock_subprocess.assert_called_once()
+        assert mock_subprocess.call_args[0][0][-1] == "tar -x -C /opt/llm/"
+        payload = mock_subprocess.call_args[1]["input"]
+        with tarfile.open(fileobj=io.BytesIO(payload)) as archive:
+            uploaded = {
+                member.name: archive.extractfile(member).read().decode() for member in archive
+            }
+            assert {member.mode for member in archive} == {0o600}
+        assert uploaded == {"docker-compose.yml": "services: {}", ".env": "HF_TOKEN=x"}
+
+    def test_ssh_options_share_ssh_client_socket(self):
+        """Test that switch-model multiplexes over the same socket as SSHClient."""
+        options = switch_model_module._ssh_options("192.0.2.1")
+
+        assert f"ControlPath={SSHClient('192.0.2.1').control_path}" in options
+
     def test_generate_aider_metadata(self, runner, temp_dir, monkeypatch):
         """Test .aider.model.metadata.json generation."""
         monkeypatch.chdir(temp_dir)
@@ -288,6 +315,22 @@ class TestSwitchModel:
         assert metadata["openai/coder-14b"]["litellm_provider"] == "openai"
         assert metadata["openai/coder-14b"]["mode"] == "chat"
 
+    def test_generate_aider_metadata_skips_unchanged(self, temp_dir, monkeypatch):
+        """Test that identical metadata is not rewritten."""
+        monkeypatch.chdir(temp_dir)
+
+        from src.maider.commands.switch_model import _generate_aider_metadata
+
+        _generate_aider_metadata("coder-14b", 16384)
+        metadata_file = temp_dir / ".aider.model.metadata.json"
+        os.utime(metadata_file, ns=(0, 0))
+
+        _generate_aider_metadata("coder-14b", 16384)
+        assert metadata_file.stat().st_mtime_ns == 0
+
+        _generate_aider_metadata("coder-14b", 8192)
+        assert json.loads(metadata_file.read_text())["openai/coder-14b"]["max_tokens"] == 8192
+
     @patch("src.maider.commands.switch_model.subprocess.run")
     def test_restart_containers_timeout_fallback(self, mock_subprocess):
         """Test fallback to systemctl when docker compose restart hangs."""